@@ -3,10 +3,17 @@ import os
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any, Literal
 
 from doc2json.core.exceptions import ConfigError
-from doc2json.models.document import MAX_CHARS_DEFAULT
+from doc2json.models.document import CHUNK_OVERLAP_DEFAULT, MAX_CHARS_DEFAULT
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 def _substitute_env_vars(value: Any) -> Any:
@@ -30,6 +37,7 @@ class LargeDocStrategy(str, Enum):
     FULL = "full"        # Send entire document (may fail on very large)
     TRUNCATE = "truncate"  # Truncate to max_chars with warning
     FAIL = "fail"        # Raise error if document exceeds limit
+    CHUNK = "chunk"      # Extract from overlapping max_chars windows and merge
 
 
 @dataclass
@@ -46,7 +54,7 @@ class DestinationConfig:
     config: Dict[str, Any] = field(default_factory=dict)  # Connector-specific config
 
 
-@dataclass
+@dataclass(frozen=True)
 class SchemaConfig:
     """Configuration for a schema extraction pipeline.
 
@@ -59,8 +67,10 @@ class SchemaConfig:
     assess: bool = False  # Whether to run quality assessment
     large_doc_strategy: LargeDocStrategy = LargeDocStrategy.TRUNCATE
     max_chars: int = MAX_CHARS_DEFAULT  # Character limit for extraction
-    source: Optional[SourceConfig] = None  # Override global source
-    destination: Optional[DestinationConfig] = None  # Override global destination
+    chunk_overlap: int = CHUNK_OVERLAP_DEFAULT  # Chars shared by adjacent chunks (chunk strategy)
+    # Connector overrides hold mutable dicts, so they are left out of the hash
+    source: Optional[SourceConfig] = field(default=None, hash=False)  # Override global source
+    destination: Optional[DestinationConfig] = field(default=None, hash=False)  # Override global destination
 
     @property
     def schema_path(self) -> str:
@@ -86,6 +96,9 @@ class LLMConfig:
     base_url: Optional[str] = None
     api_key: Optional[str] = None
     api_version: Optional[str] = None  # Required for Azure OpenAI
+    requests_per_minute: Optional[float] = None  # Client-side throttle (None = unlimited)
+    tokens_per_minute: Optional[float] = None  # Estimated input tokens per minute
+    cache_dir: Optional[str] = None  # Reuse results of identical extraction requests across runs
 
 
 @dataclass
@@ -101,18 +114,24 @@ class Config:
     determines all paths (sources, outputs, schema file).
     Supports global source/destination connectors with per-schema overrides.
     """
-    schemas: list[SchemaConfig]
+    schemas: tuple[SchemaConfig, ...]
     llm: LLMConfig
     source: Optional[SourceConfig] = None  # Global source connector
     destination: Optional[DestinationConfig] = None  # Global destination connector
     inference: Optional[InferenceConfig] = None
+    _by_name: Dict[str, SchemaConfig] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Accept any iterable of schemas but store an immutable tuple
+        self.schemas = tuple(self.schemas)
+        # Name index for get_schema; the first entry wins on duplicate names
+        self._by_name = {}
+        for schema in self.schemas:
+            self._by_name.setdefault(schema.name, schema)
 
     def get_schema(self, name: str) -> Optional[SchemaConfig]:
         """Get a schema config by name."""
-        for schema in self.schemas:
-            if schema.name == name:
-                return schema
-        return None
+        return self._by_name.get(name)
 
     def get_source_config(self, schema_config: SchemaConfig) -> SourceConfig:
         """Get effective source config for a schema (schema override or global)."""
@@ -173,13 +192,7 @@ def load_config(path: str = "doc2json.yml") -> Config:
             f"Run 'doc2json init' to create a new project."
         )
 
-    try:
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        raise ConfigError(
-            f"Invalid YAML in {path}:\n{e}"
-        )
+    data = _read_yaml(path)
 
     if data is None:
         raise ConfigError(f"Config file {path} is empty.")
@@ -197,13 +210,16 @@ def load_config(path: str = "doc2json.yml") -> Config:
         model=llm_data.get("model", "claude-sonnet-4-20250514"),
         base_url=llm_data.get("base_url"),
         api_key=llm_data.get("api_key"),
+        requests_per_minute=llm_data.get("requests_per_minute"),
+        tokens_per_minute=llm_data.get("tokens_per_minute"),
+        cache_dir=llm_data.get("cache_dir"),
     )
 
     # Parse optional global source config
-    source = _parse_connector_config(data.get("source"))
+    source = _parse_connector_config(data.get("source"), SourceConfig)
 
     # Parse optional global destination config
-    destination = _parse_connector_config(data.get("destination"))
+    destination = _parse_connector_config(data.get("destination"), DestinationConfig)
 
     # Parse optional inference config
     inference = None
@@ -220,6 +236,24 @@ def load_config(path: str = "doc2json.yml") -> Config:
     )
 
 
+def _read_yaml(path: str) -> Any:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged."""
+    st = os.stat(path)
+    return _parse_yaml(path, st.st_mtime_ns, st.st_size)
+
+
+# Keyed by the file's (mtime_ns, size) so edits miss the cache. Only the raw
+# data is cached: env vars are substituted and objects built on every load.
+@lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, 'r') as f:
+        try:
+            return yaml.load(f, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            # Message (including the problem mark) is only built on failure
+            raise ConfigError(f"Invalid YAML in {path}:\n{e}") from e
+
+
 def _expand_env_vars(value: Any) -> Any:
     """Expand environment variables in string values.
 
@@ -248,8 +282,16 @@ def _expand_env_vars(value: Any) -> Any:
     return expanded
 
 
-def _parse_connector_config(data: Optional[dict]) -> Optional[SourceConfig]:
-    """Parse a source or destination connector config."""
+def _parse_connector_config(
+    data: Optional[dict],
+    config_class: type[SourceConfig] | type[DestinationConfig] = SourceConfig,
+) -> Optional[SourceConfig | DestinationConfig]:
+    """Parse a source or destination connector config.
+
+    Args:
+        data: Raw connector config from YAML
+        config_class: SourceConfig or DestinationConfig
+    """
     if data is None:
         return None
 
@@ -263,10 +305,23 @@ def _parse_connector_config(data: Optional[dict]) -> Optional[SourceConfig]:
     # Everything except 'type' goes into config, with env var expansion
     config = {k: _expand_env_vars(v) for k, v in data.items() if k != "type"}
 
-    return SourceConfig(type=conn_type, config=config)
+    return config_class(type=conn_type, config=config)
 
 
-def _parse_schemas(data: dict) -> list[SchemaConfig]:
+def _parse_large_doc_strategy(value: Any, location: str) -> LargeDocStrategy:
+    """Convert a large_doc_strategy config value, raising ConfigError if invalid."""
+    try:
+        # Enum value lookup is a dict hit, so no extra caching is needed here
+        return LargeDocStrategy(value)
+    except ValueError:
+        valid = ", ".join(s.value for s in LargeDocStrategy)
+        raise ConfigError(
+            f"Invalid large_doc_strategy '{value}' in {location}. "
+            f"Valid options: {valid}"
+        ) from None
+
+
+def _parse_schemas(data: dict) -> tuple[SchemaConfig, ...]:
     """Parse schema configurations from config data.
 
     Supports both new 'schemas' format and legacy 'extraction'/'extractions' formats.
@@ -301,26 +356,36 @@ def _parse_schemas(data: dict) -> list[SchemaConfig]:
                         "  - name: schema_name\n"
                         "    assess: true"
                     )
-                # Parse large_doc_strategy
-                strategy_str = item.get("large_doc_strategy", "truncate")
-                try:
-                    strategy = LargeDocStrategy(strategy_str)
-                except ValueError:
-                    valid = ", ".join(s.value for s in LargeDocStrategy)
+                # Parse per-schema source/destination overrides
+                source_override = _parse_connector_config(item.get("source"), SourceConfig)
+                dest_override = _parse_connector_config(
+                    item.get("destination"), DestinationConfig
+                )
+
+                strategy = _parse_large_doc_strategy(
+                    item.get("large_doc_strategy", "truncate"), f"schemas[{i}]"
+                )
+                max_chars = item.get("max_chars", MAX_CHARS_DEFAULT)
+                if strategy == LargeDocStrategy.CHUNK and (
+                    not isinstance(max_chars, int) or max_chars <= 0
+                ):
+                    raise ConfigError(
+                        f"Invalid max_chars '{max_chars}' in schemas[{i}]. "
+                        "The chunk strategy needs a positive chunk size."
+                    )
+                chunk_overlap = item.get("chunk_overlap", CHUNK_OVERLAP_DEFAULT)
+                if not isinstance(chunk_overlap, int) or chunk_overlap < 0:
                     raise ConfigError(
-                        f"Invalid large_doc_strategy '{strategy_str}' in schemas[{i}]. "
-                        f"Valid options: {valid}"
+                        f"Invalid chunk_overlap '{chunk_overlap}' in schemas[{i}]. "
+                        "The chunk overlap must be a non-negative integer."
                     )
 
-                # Parse per-schema source/destination overrides
-                source_override = _parse_connector_config(item.get("source"))
-                dest_override = _parse_connector_config(item.get("destination"))
-
                 schemas.append(SchemaConfig(
                     name=item["name"],
                     assess=item.get("assess", False),
                     large_doc_strategy=strategy,
-                    max_chars=item.get("max_chars", MAX_CHARS_DEFAULT),
+                    max_chars=max_chars,
+                    chunk_overlap=chunk_overlap,
                     source=source_override,
                     destination=dest_override,
                 ))
@@ -329,7 +394,7 @@ def _parse_schemas(data: dict) -> list[SchemaConfig]:
                     f"Invalid schema entry at index {i}. "
                     "Must be a string or object with 'name' field."
                 )
-        return schemas
+        return tuple(schemas)
 
     # Legacy format: extraction (single)
     if "extraction" in data:
@@ -341,10 +406,10 @@ def _parse_schemas(data: dict) -> list[SchemaConfig]:
                 "schemas:\n"
                 "  - my_schema"
             )
-        return [SchemaConfig(
+        return (SchemaConfig(
             name=ext_data["schema"],
             assess=ext_data.get("assess", False),
-        )]
+        ),)
 
     # Legacy format: extractions (multiple)
     if "extractions" in data:
@@ -363,7 +428,7 @@ def _parse_schemas(data: dict) -> list[SchemaConfig]:
                 name=ext_data["schema"],
                 assess=ext_data.get("assess", False),
             ))
-        return schemas
+        return tuple(schemas)
 
     raise ConfigError(
         "Missing schema configuration.\n\n"
@@ -1,11 +1,12 @@
 """BigQuery destination connector."""
 
-import json
 import logging
 import uuid
 from datetime import datetime
 from typing import Any
 
+from doc2json.core.utils.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
 # Declarative schema definitions for auto-migration
@@ -174,7 +175,7 @@ class BigQueryDestination:
             "schema_name": record.get("_schema"),
             "schema_version": record.get("_schema_version"),
             "extracted_at": datetime.now().isoformat(),
-            "data": json.dumps(data),
+            "data": dumps(data),
             "error": record.get("_error"),
             "truncated": record.get("_truncated", False)
         }
@@ -1,11 +1,12 @@
 """JSONL file destination connector."""
 
-import json
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from doc2json.core.utils.serialization import dumps
+
 
 class JSONLDestination:
     """Destination connector for local JSONL files."""
@@ -43,11 +44,11 @@ class JSONLDestination:
         self.path.parent.mkdir(parents=True, exist_ok=True)
 
         # Open main output file
-        self._file = open(self.path, "w")
+        self._file = open(self.path, "w", encoding="utf-8")
 
         # Open metadata file
         meta_path = Path(str(self.path).replace(".jsonl", ".meta.jsonl"))
-        self._meta_file = open(meta_path, "w")
+        self._meta_file = open(meta_path, "w", encoding="utf-8")
 
     def write_record(self, record: dict[str, Any]) -> None:
         """Write a single extraction result as a JSON line."""
@@ -62,7 +63,7 @@ class JSONLDestination:
 
         # Add extraction_id to record
         output = {"_extraction_id": extraction_id, **record}
-        self._file.write(json.dumps(output) + "\n")
+        self._file.write(dumps(output) + "\n")
 
     def write_metadata(self, metadata: dict[str, Any]) -> None:
         """Write metadata to the metadata file."""
@@ -76,7 +77,7 @@ class JSONLDestination:
             if extraction_id:
                 metadata = {"extraction_id": extraction_id, **metadata}
 
-        self._meta_file.write(json.dumps(metadata) + "\n")
+        self._meta_file.write(dumps(metadata) + "\n")
 
     def flush(self) -> None:
         """Force write/commit of buffered data."""
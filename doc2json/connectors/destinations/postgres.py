@@ -1,9 +1,10 @@
 """PostgreSQL destination connector."""
 
-import json
 import logging
 from typing import Any, Optional
 
+from doc2json.core.utils.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
 # Default table schema
@@ -245,7 +246,7 @@ class PostgresDestination:
                 source_file,
                 schema_name,
                 schema_version,
-                json.dumps(data),
+                dumps(data),
                 error,
                 truncated,
             ),
@@ -1,9 +1,10 @@
 """Snowflake destination connector."""
 
-import json
 import logging
 from typing import Any
 
+from doc2json.core.utils.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TABLE = "EXTRACTIONS"
@@ -204,7 +205,7 @@ class SnowflakeDestination:
         # and capture the inserted ID for linking metadata
         for r in self._extraction_buffer:
             data = {k: v for k, v in r.items() if not k.startswith("_")}
-            data_json = json.dumps(data)
+            data_json = dumps(data)
             source_file = r.get("_source_file")
 
             # Use parameterized query for JSON to avoid issues with % characters in data
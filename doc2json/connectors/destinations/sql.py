@@ -11,11 +11,11 @@ Supports any database with a SQLAlchemy dialect:
 See: https://docs.sqlalchemy.org/en/20/core/engines.html
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any
 
+from doc2json.core.utils.serialization import dumps
 from doc2json.connectors.destinations.sql_schema import (
     EXTRACTIONS_COLUMNS,
     EXTRACTIONS_INDEXES,
@@ -229,7 +229,7 @@ class SQLDestination:
             # Serialize JSON if needed
             data = row["data"]
             if self._json_as_text:
-                data = json.dumps(data)
+                data = dumps(data)
 
             # Insert and get ID
             from sqlalchemy import insert
@@ -3,16 +3,23 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Iterator, Optional, Sequence, Tuple
 
-from doc2json.config.loader import Config, SchemaConfig, LargeDocStrategy
+from doc2json.config.loader import Config, LLMConfig, SchemaConfig, LargeDocStrategy
 from doc2json.core.parsers import parse_document, get_registry
 from doc2json.core.parsers.pdf import PDFParser
-from doc2json.core.extraction import load_schema, get_schema_version, ExtractionEngine
+from doc2json.core.extraction import (
+    load_schema,
+    get_schema_version,
+    ExtractionEngine,
+    ExtractionResponse,
+    ExtractionCache,
+)
 from doc2json.core.schema_analysis import analyze_schema
 from doc2json.core.exceptions import DocumentTooLargeError, EmptyDocumentError
+from doc2json.core.utils.serialization import dumps
 from doc2json.models.result import ExtractionResult
-from doc2json.models.document import DocumentInfo
+from doc2json.models.document import CHARS_PER_TOKEN, DocumentInfo
 from doc2json.models.metadata import ExtractionMetadata, RunMetadata, TokenUsage
 
 # Import connectors to register them
@@ -25,6 +32,55 @@ logger = logging.getLogger(__name__)
 # Files to skip when scanning source directories
 SKIP_FILES = {".gitkeep", ".gitignore", ".DS_Store"}
 
+# Appended to truncated documents so the LLM knows content was cut
+TRUNCATION_MARKER = "\n\n[... document truncated due to size limits ...]"
+
+# Preferred places to end a chunk, best first
+CHUNK_BREAKS = ("\n\n", "\n", ". ")
+
+
+def _iter_chunks(text: str, size: int, overlap: int) -> Iterator[str]:
+    """Yield overlapping windows of at most size chars covering text.
+
+    Each window ends at the last paragraph, line or sentence break in its
+    second half when there is one, and the next window starts overlap chars
+    before that point.
+    """
+    if size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {size}")
+    overlap = min(overlap, size // 4)  # Always advance by at least 1/4 window
+    start = 0
+    while True:
+        end = min(start + size, len(text))
+        if end < len(text):
+            for sep in CHUNK_BREAKS:
+                cut = text.rfind(sep, start + size // 2, end)
+                if cut != -1:
+                    end = cut + len(sep)
+                    break
+        yield text[start:end]
+        if end >= len(text):
+            return
+        start = max(end - overlap, start + 1)
+
+
+def _merge_extracted(merged: dict[str, Any], data: dict[str, Any]) -> dict[str, Any]:
+    """Fold one chunk's extracted data into the running result.
+
+    Scalars keep the first non-empty value, lists are concatenated without
+    duplicates (overlapping chunks often repeat items) and nested objects
+    are merged recursively.
+    """
+    for key, value in data.items():
+        current = merged.get(key)
+        if current is None or current == "" or current == [] or current == {}:
+            merged[key] = value
+        elif isinstance(current, list) and isinstance(value, list):
+            current.extend(item for item in value if item not in current)
+        elif isinstance(current, dict) and isinstance(value, dict):
+            _merge_extracted(current, value)
+    return merged
+
 
 class SchemaTool:
     def __init__(self, config: Config):
@@ -47,7 +103,7 @@ class SchemaTool:
         for schema_config in schemas:
             self._run_extraction(schema_config)
 
-    def _get_schemas_to_run(self, schema_name: Optional[str]) -> list[SchemaConfig]:
+    def _get_schemas_to_run(self, schema_name: Optional[str]) -> Sequence[SchemaConfig]:
         """Get list of schemas to run based on optional filter."""
         if schema_name:
             schema_config = self.config.get_schema(schema_name)
@@ -61,6 +117,20 @@ class SchemaTool:
             return [schema_config]
         return self.config.schemas
 
+    def _create_engine(self, llm_config: LLMConfig) -> ExtractionEngine:
+        """Build the extraction engine, with a result cache if llm.cache_dir is set."""
+        cache = ExtractionCache(directory=llm_config.cache_dir) if llm_config.cache_dir else None
+        return ExtractionEngine(
+            provider=llm_config.provider,
+            model=llm_config.model,
+            base_url=llm_config.base_url,
+            api_key=llm_config.api_key,
+            api_version=llm_config.api_version,
+            cache=cache,
+            requests_per_minute=llm_config.requests_per_minute,
+            tokens_per_minute=llm_config.tokens_per_minute,
+        )
+
     def _run_extraction(self, schema_config: SchemaConfig):
         """Run a single extraction pipeline."""
         llm_config = self.config.llm
@@ -72,13 +142,7 @@ class SchemaTool:
         self.logger.info(f"Schema version: {schema_version}")
 
         # Initialize extraction engine
-        engine = ExtractionEngine(
-            provider=llm_config.provider,
-            model=llm_config.model,
-            base_url=llm_config.base_url,
-            api_key=llm_config.api_key,
-            api_version=llm_config.api_version,
-        )
+        engine = self._create_engine(llm_config)
 
         # Get source and destination connectors
         source_config = self.config.get_source_config(schema_config)
@@ -144,7 +208,19 @@ class SchemaTool:
                     )
 
                     # Extract structured data with metadata
-                    extract_response = engine.extract_with_metadata(text, schema_class)
+                    chunked = (
+                        schema_config.large_doc_strategy == LargeDocStrategy.CHUNK
+                        and doc_info.exceeds_limit(schema_config.max_chars)
+                    )
+                    if chunked:
+                        extract_response = self._extract_chunked(
+                            engine, text, schema_class, schema_config
+                        )
+                        # Assessment sees the first window rather than the whole
+                        # document; the result is flagged as partially assessed
+                        text = text[:schema_config.max_chars] + TRUNCATION_MARKER
+                    else:
+                        extract_response = engine.extract_with_metadata(text, schema_class)
                     extracted = extract_response.data
                     extract_tokens = extract_response.tokens
 
@@ -165,7 +241,13 @@ class SchemaTool:
                             text, schema_class, extracted
                         )
                         result.assessment = assess_response.assessment
+                        result.assessment_partial = chunked
                         assess_tokens = assess_response.tokens
+                        if chunked:
+                            self.logger.warning(
+                                f"Assessment of {doc_ref.name} covered only the first "
+                                f"{schema_config.max_chars:,} of {doc_info.char_count:,} chars"
+                            )
                         self.logger.info(
                             f"Review status: {assess_response.assessment.review_status.value}"
                         )
@@ -238,6 +320,10 @@ class SchemaTool:
                 f"{run_meta.total_output_tokens:,} output, "
                 f"{run_meta.total_tokens:,} total"
             )
+            if engine.cache is not None:
+                self.logger.info(
+                    f"Extraction cache: {engine.cache.hits} hits, {engine.cache.misses} misses"
+                )
 
         # Summary of review statuses if assessment enabled
         if schema_config.assess:
@@ -316,15 +402,18 @@ class SchemaTool:
             self.logger.warning(
                 f"Truncating document from {doc_info.char_count:,} to {max_chars:,} chars"
             )
-            truncated_text = text[:max_chars]
-            # Add marker so LLM knows content was cut
-            truncated_text += "\n\n[... document truncated due to size limits ...]"
-            return truncated_text, True
+            return text[:max_chars] + TRUNCATION_MARKER, True
+
+        elif strategy == LargeDocStrategy.CHUNK:
+            # Chunks are cut at extraction time; the text itself is left whole
+            self.logger.info(
+                f"Document exceeds {max_chars:,} chars; extracting in chunks "
+                f"(large_doc_strategy=chunk)"
+            )
+            return text, False
 
         elif strategy == LargeDocStrategy.FAIL:
             raise DocumentTooLargeError(
-                f"Document exceeds size limit ({doc_info.char_count:,} chars > {max_chars:,} max). "
-                f"Set large_doc_strategy to 'truncate' or 'full' to process anyway.",
                 char_count=doc_info.char_count,
                 max_chars=max_chars,
             )
@@ -332,6 +421,37 @@ class SchemaTool:
         # Should never reach here
         return text, False
 
+    def _extract_chunked(
+        self,
+        engine: ExtractionEngine,
+        text: str,
+        schema_class,
+        schema_config: SchemaConfig,
+    ) -> ExtractionResponse:
+        """Extract from overlapping max_chars windows and merge the results.
+
+        Token usage is summed across chunks. The merged data is validated
+        against the schema again so callers get a normal model instance.
+        """
+        merged: dict[str, Any] = {}
+        input_tokens = output_tokens = 0
+        have_tokens = False
+
+        chunks = _iter_chunks(text, schema_config.max_chars, schema_config.chunk_overlap)
+        for i, chunk in enumerate(chunks, start=1):
+            self.logger.info(f"Extracting chunk {i} ({len(chunk):,} chars)")
+            response = engine.extract_with_metadata(chunk, schema_class)
+            _merge_extracted(merged, response.data.model_dump(mode="json"))
+            if response.tokens:
+                have_tokens = True
+                input_tokens += response.tokens.input_tokens
+                output_tokens += response.tokens.output_tokens
+
+        return ExtractionResponse(
+            data=schema_class.model_validate(merged),
+            tokens=TokenUsage(input_tokens, output_tokens) if have_tokens else None,
+        )
+
     def _write_metadata(self, meta_path: Path, run_meta: RunMetadata):
         """Write metadata to a .meta.jsonl file.
 
@@ -339,14 +459,14 @@ class SchemaTool:
         - Line 1: Run summary (schema, model, totals)
         - Lines 2+: Per-file extraction metadata
         """
-        with open(meta_path, "w") as f:
+        with open(meta_path, "w", encoding="utf-8") as f:
             # Write run summary first
-            f.write(json.dumps(run_meta.to_summary_dict()) + "\n")
+            f.write(dumps(run_meta.to_summary_dict()) + "\n")
 
             # Write per-file metadata
             for extraction in run_meta.extractions:
                 record = {"_type": "extraction", **extraction.to_dict()}
-                f.write(json.dumps(record) + "\n")
+                f.write(dumps(record) + "\n")
 
         self.logger.info(f"Wrote metadata to {meta_path}")
 
@@ -487,7 +607,9 @@ class SchemaTool:
                 # Check if would be truncated
                 would_truncate = doc_info.exceeds_limit(schema_config.max_chars)
                 effective_chars = min(doc_info.char_count, schema_config.max_chars)
-                effective_tokens = effective_chars // 4
+                if schema_config.large_doc_strategy == LargeDocStrategy.CHUNK:
+                    effective_chars = doc_info.char_count  # Every chunk is sent
+                effective_tokens = effective_chars // CHARS_PER_TOKEN
 
                 # Format status
                 status = ""
@@ -498,6 +620,8 @@ class SchemaTool:
                     elif schema_config.large_doc_strategy == LargeDocStrategy.TRUNCATE:
                         status = " [TRUNCATE]"
                         truncated_count += 1
+                    elif schema_config.large_doc_strategy == LargeDocStrategy.CHUNK:
+                        status = " [CHUNK]"
 
                 # Format page info
                 pages = f"{doc_info.page_count} pages, " if doc_info.page_count else ""
@@ -74,12 +74,32 @@ class ValidationError(ExtractionError):
 
 
 class DocumentTooLargeError(ParserError):
-    """Document exceeds size limits for extraction."""
-
-    def __init__(self, message: str, char_count: int, max_chars: int):
+    """Document exceeds size limits for extraction.
+
+    If no message is given, the standard one is built from the counts when
+    the error is actually displayed.
+    """
+
+    def __init__(
+        self,
+        message: str | None = None,
+        *,
+        char_count: int,
+        max_chars: int,
+    ):
+        self.message = message
         self.char_count = char_count
         self.max_chars = max_chars
-        super().__init__(message)
+        super().__init__(*([message] if message else []))
+
+    def __str__(self) -> str:
+        if self.message:
+            return self.message
+        return (
+            f"Document too large: exceeds size limit ({self.char_count:,} chars > "
+            f"{self.max_chars:,} max). Set large_doc_strategy to 'truncate', 'chunk' "
+            f"or 'full' to process anyway."
+        )
 
 
 class EmptyDocumentError(ParserError):
@@ -1,15 +1,25 @@
+import ast
+import asyncio
 import importlib.util
 import json
 import logging
 import os
+import random
+import re
 import time
+import types
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Type, Any, Optional
+from functools import lru_cache
+from typing import Type, Any, Optional, Sequence
 
 from pydantic import BaseModel
 
 from doc2json.models.result import Assessment, ReviewStatus
 from doc2json.models.metadata import TokenUsage
+from doc2json.models.document import CHARS_PER_TOKEN
+from doc2json.core.extraction.cache import ExtractionCache
+from doc2json.core.extraction.ratelimit import RateLimiter
 from doc2json.core.exceptions import (
     SchemaNotFoundError,
     SchemaValidationError,
@@ -67,6 +77,10 @@ def _extract_token_usage(completion: Any) -> Optional[TokenUsage]:
 def load_schema_module(schema_name: str, schemas_dir: str = "schemas"):
     """Load a schema module from a Python file.
 
+    The module is executed once per version of the file: later calls return
+    the same module object until the file's modification time or size
+    changes.
+
     Args:
         schema_name: Name of the schema (without .py extension)
         schemas_dir: Directory containing schema files
@@ -85,11 +99,16 @@ def load_schema_module(schema_name: str, schemas_dir: str = "schemas"):
             f"Create a schema file at schemas/{schema_name}.py with a Pydantic 'Schema' class."
         )
 
-    # Load the module dynamically
+    st = os.stat(schema_path)
+    return _exec_schema_module(schema_name, schema_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _exec_schema_module(schema_name: str, schema_path: str, mtime_ns: int, size: int):
+    """Import a schema file, keyed by its (mtime_ns, size) so edits miss the cache."""
     spec = importlib.util.spec_from_file_location(schema_name, schema_path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-
     return module
 
 
@@ -108,11 +127,34 @@ def load_schema(schema_name: str, schemas_dir: str = "schemas") -> Type[BaseMode
         SchemaValidationError: If schema is invalid (missing Schema class, not a BaseModel)
     """
     module = load_schema_module(schema_name, schemas_dir)
+    return _schema_class(module, f"schemas/{schema_name}.py")
+
+
+def load_schema_from_source(code: str, schema_name: str = "generated") -> Type[BaseModel]:
+    """Load a Pydantic schema from Python source without writing it to disk.
+
+    Used to check LLM-generated schema code before it is saved.
+
+    Args:
+        code: Python source defining a 'Schema' class
+        schema_name: Name used for the throwaway module and in error messages
+
+    Returns:
+        The Schema class defined by the code
+
+    Raises:
+        SchemaValidationError: If schema is invalid (missing Schema class, not a BaseModel)
+    """
+    module = types.ModuleType(schema_name)
+    exec(compile(code, f"<schema {schema_name}>", "exec"), module.__dict__)
+    return _schema_class(module, f"schemas/{schema_name}.py")
+
 
-    # Get the Schema class
+def _schema_class(module, location: str) -> Type[BaseModel]:
+    """Return a schema module's Schema class, checking it is a BaseModel."""
     if not hasattr(module, "Schema"):
         raise SchemaValidationError(
-            f"Schema file 'schemas/{schema_name}.py' must define a 'Schema' class. "
+            f"Schema file '{location}' must define a 'Schema' class. "
             f"Example:\n\n"
             f"from pydantic import BaseModel\n\n"
             f"class Schema(BaseModel):\n"
@@ -123,7 +165,7 @@ def load_schema(schema_name: str, schemas_dir: str = "schemas") -> Type[BaseMode
 
     if not issubclass(schema_class, BaseModel):
         raise SchemaValidationError(
-            f"Schema class in 'schemas/{schema_name}.py' must inherit from pydantic.BaseModel. "
+            f"Schema class in '{location}' must inherit from pydantic.BaseModel. "
             f"Got: {type(schema_class).__name__}"
         )
 
@@ -139,11 +181,119 @@ def get_schema_version(schema_name: str, schemas_dir: str = "schemas") -> str:
 
     Returns:
         Version string, or "unknown" if not defined
+
+    A literal ``__version__ = "..."`` assignment is read from the source
+    without executing the file; anything else falls back to loading it.
     """
+    schema_path = os.path.join(schemas_dir, f"{schema_name}.py")
+    try:
+        st = os.stat(schema_path)
+    except OSError:
+        st = None
+    if st is not None:
+        version = _literal_schema_version(schema_path, st.st_mtime_ns, st.st_size)
+        if version is not None:
+            return version
+
     module = load_schema_module(schema_name, schemas_dir)
     return getattr(module, "__version__", "unknown")
 
 
+@lru_cache(maxsize=32)
+def _literal_schema_version(schema_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Find a top-level __version__ assignment in a schema file.
+
+    Returns the version, "unknown" if there is no assignment at all, or None
+    if __version__ is assigned something other than a literal.
+    """
+    with open(schema_path, "rb") as f:
+        tree = ast.parse(f.read(), filename=schema_path)
+
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "__version__" for t in targets):
+            if isinstance(value, ast.Constant) and isinstance(value.value, (str, int, float)):
+                return str(value.value)
+            return None
+    return "unknown"
+
+
+# Rate limit and transient server error markers, matched in one scan
+_RETRYABLE_ERROR_TERMS = (
+    "rate limit", "rate_limit", "429", "too many requests",
+    "500", "502", "503", "504", "overloaded", "timeout",
+)
+_RETRYABLE_ERROR_RE = re.compile("|".join(map(re.escape, _RETRYABLE_ERROR_TERMS)))
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check if an error is a provider rate limit rejection."""
+    return "rate limit" in str(error).lower() or "429" in str(error)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read a Retry-After header (in seconds) from a provider SDK exception."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after")
+    except Exception:
+        return None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        # HTTP-date form isn't used by the LLM providers; fall back to backoff
+        return None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough input token estimate used for throttling."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+ASSESS_INSTRUCTIONS = """Assess this extraction. Be terse.
+
+Return:
+- review_status: "needs_review" (errors/missing data), "suggested_review" (minor issues), or "no_review_needed"
+- ambiguous_fields: field names with uncertain values
+- review_notes: 1-2 sentences max, only if issues exist
+- schema_suggestions: list of fields worth adding, each with:
+  - name: snake_case field name
+  - field_type: Python type (str, int, float, bool, Optional[str], list[str], etc.)
+  - description: short description for Field()
+  - sample_value: example value from the document (optional)
+"""
+
+
+@lru_cache(maxsize=128)
+def _schema_blob(schema: Type[BaseModel]) -> tuple[str, dict]:
+    """JSON schema for a model as (pretty-printed text, dict), built once per class.
+
+    Keyed by the class itself: every user schema is named 'Schema', so
+    names would collide. The returned dict is shared - don't mutate it.
+    """
+    json_schema = schema.model_json_schema()
+    return json.dumps(json_schema, indent=2), json_schema
+
+
+def _batch_custom_id(index: int) -> str:
+    """Batch request ID encoding a document's position."""
+    return f"doc-{index}"
+
+
+def _batch_index(custom_id: str) -> int:
+    """Recover the document position from a batch request ID."""
+    return int(custom_id.rsplit("-", 1)[-1])
+
+
 class ExtractionEngine:
     """Engine for extracting structured data from documents using LLMs."""
 
@@ -151,6 +301,8 @@ class ExtractionEngine:
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_DELAY = 1.0  # seconds
     DEFAULT_RETRY_MULTIPLIER = 2.0  # exponential backoff
+    MAX_RETRY_DELAY = 30.0  # cap on a single backoff sleep
+    RETRY_JITTER = 0.25  # up to +25% random jitter per sleep
 
     def __init__(
         self,
@@ -161,6 +313,9 @@ class ExtractionEngine:
         api_version: Optional[str] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        cache: Optional[ExtractionCache] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
     ):
         self.provider = provider
         self.model = model
@@ -169,7 +324,16 @@ class ExtractionEngine:
         self.api_version = api_version  # Required for Azure OpenAI
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.cache = cache  # Optional exact-match result cache
+        # Optional client-side throttling to stay under provider rate limits
+        self._limiter = (
+            RateLimiter(requests_per_minute, tokens_per_minute)
+            if requests_per_minute or tokens_per_minute
+            else None
+        )
         self._client = None
+        self._async_client = None
+        self._ollama_json_mode = False  # Set once a model rejects tool calls
 
     def _get_client(self):
         """Lazily initialize the LLM client.
@@ -178,9 +342,31 @@ class ExtractionEngine:
             ProviderError: If provider is not supported or SDK is not installed
             AuthenticationError: If API key is missing or invalid
         """
-        if self._client is not None:
-            return self._client
+        if self._client is None:
+            self._client = self._build_client(async_=False)
+        return self._client
+
+    def _get_async_client(self):
+        """Lazily initialize the async LLM client used by aextract().
+
+        Raises:
+            ProviderError: If provider is not supported or SDK is not installed
+            AuthenticationError: If API key is missing or invalid
+        """
+        if self._async_client is None:
+            self._async_client = self._build_client(async_=True)
+        return self._async_client
 
+    def _build_client(self, async_: bool):
+        """Create the instructor-wrapped client for the configured provider.
+
+        Args:
+            async_: Wrap the provider's async SDK client instead of the sync one
+
+        Raises:
+            ProviderError: If provider is not supported or SDK is not installed
+            AuthenticationError: If API key is missing or invalid
+        """
         try:
             import instructor
         except ImportError:
@@ -191,66 +377,51 @@ class ExtractionEngine:
 
         if self.provider == "anthropic":
             try:
-                from anthropic import Anthropic
+                from anthropic import Anthropic, AsyncAnthropic
             except ImportError:
                 raise ProviderError(
                     f"anthropic package not installed. "
                     f"Run: pip install doc2json[anthropic]"
                 )
-            try:
-                self._client = instructor.from_anthropic(
-                    Anthropic(
+            client_class = AsyncAnthropic if async_ else Anthropic
+            with self._auth_errors("Anthropic", "ANTHROPIC_API_KEY"):
+                return instructor.from_anthropic(
+                    client_class(
                         base_url=self.base_url,
                         api_key=self.api_key
                     )
                 )
-            except Exception as e:
-                if "api_key" in str(e).lower() or "authentication" in str(e).lower():
-                    raise AuthenticationError(
-                        "Anthropic API key not found or invalid. "
-                        "Set ANTHROPIC_API_KEY environment variable.",
-                        provider="anthropic",
-                        original_error=e,
-                    )
-                raise
 
         elif self.provider == "openai":
             try:
-                from openai import OpenAI, AzureOpenAI
+                from openai import OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI
             except ImportError:
                 raise ProviderError(
                     f"openai package not installed. "
                     f"Run: pip install doc2json[openai]"
                 )
-            try:
+            with self._auth_errors("OpenAI", "OPENAI_API_KEY"):
                 # Use AzureOpenAI client when api_version is specified
                 if self.api_version:
-                    client = AzureOpenAI(
+                    client_class = AsyncAzureOpenAI if async_ else AzureOpenAI
+                    client = client_class(
                         azure_endpoint=self.base_url,
                         api_key=self.api_key,
                         api_version=self.api_version,
                     )
                     logger.info(f"Using Azure OpenAI (api_version={self.api_version})")
                 else:
-                    client = OpenAI(
+                    client_class = AsyncOpenAI if async_ else OpenAI
+                    client = client_class(
                         base_url=self.base_url,
                         api_key=self.api_key,
                     )
-                self._client = instructor.from_openai(client)
-            except Exception as e:
-                if "api_key" in str(e).lower() or "authentication" in str(e).lower():
-                    raise AuthenticationError(
-                        "OpenAI API key not found or invalid. "
-                        "Set OPENAI_API_KEY environment variable.",
-                        provider="openai",
-                        original_error=e,
-                    )
-                raise
+                return instructor.from_openai(client)
 
         elif self.provider == "ollama":
             # Ollama is OpenAI-compatible
             try:
-                from openai import OpenAI
+                from openai import OpenAI, AsyncOpenAI
             except ImportError:
                 raise ProviderError(
                     f"openai package not installed (required for ollama). "
@@ -261,23 +432,26 @@ class ExtractionEngine:
             base_url = self.base_url or "http://localhost:11434/v1"
             api_key = self.api_key or "ollama"  # Ollama doesn't require key but client might
 
+            # Start with TOOLS mode (best quality); JSON once a model rejects tools
+            mode = instructor.Mode.JSON if self._ollama_json_mode else instructor.Mode.TOOLS
+            client_class = AsyncOpenAI if async_ else OpenAI
             try:
-                # Start with TOOLS mode (best quality), will fall back to JSON if needed
-                self._client = instructor.from_openai(
-                    OpenAI(
+                client = instructor.from_openai(
+                    client_class(
                         base_url=base_url,
                         api_key=api_key,
                     ),
-                    mode=instructor.Mode.TOOLS,
+                    mode=mode,
                 )
-                self._ollama_base_url = base_url
-                self._ollama_api_key = api_key
             except Exception as e:
                 raise APIError(
                     f"Failed to initialize Ollama client: {e}",
                     provider="ollama",
                     original_error=e,
                 )
+            self._ollama_base_url = base_url
+            self._ollama_api_key = api_key
+            return client
 
         elif self.provider == "gemini":
             try:
@@ -287,37 +461,60 @@ class ExtractionEngine:
                     f"google-generativeai package not installed. "
                     f"Run: pip install doc2json[gemini]"
                 )
-            try:
-                self._client = instructor.from_gemini(
-                    genai.GenerativeModel(model_name=self.model)
+            with self._auth_errors("Google", "GOOGLE_API_KEY"):
+                return instructor.from_gemini(
+                    genai.GenerativeModel(model_name=self.model),
+                    use_async=async_,
                 )
-            except Exception as e:
-                if "api_key" in str(e).lower() or "authentication" in str(e).lower():
-                    raise AuthenticationError(
-                        "Google API key not found or invalid. "
-                        "Set GOOGLE_API_KEY environment variable.",
-                        provider="gemini",
-                        original_error=e,
-                    )
-                raise
-        else:
-            raise ProviderError(
-                f"Unsupported LLM provider: '{self.provider}'. "
-                f"Supported providers: anthropic, openai, gemini, ollama"
-            )
 
-        return self._client
+        raise ProviderError(
+            f"Unsupported LLM provider: '{self.provider}'. "
+            f"Supported providers: anthropic, openai, gemini, ollama"
+        )
+
+    @contextmanager
+    def _auth_errors(self, vendor: str, env_var: str):
+        """Turn key/authentication failures while building a client into AuthenticationError."""
+        try:
+            yield
+        except Exception as e:
+            if "api_key" in str(e).lower() or "authentication" in str(e).lower():
+                raise AuthenticationError(
+                    f"{vendor} API key not found or invalid. "
+                    f"Set {env_var} environment variable.",
+                    provider=self.provider,
+                    original_error=e,
+                )
+            raise
+
+    def _create_with_completion(self, client):
+        """Return the provider's create_with_completion callable for a client."""
+        if self.provider == "anthropic":
+            return client.messages.create_with_completion
+        return client.chat.completions.create_with_completion  # openai, gemini, ollama
+
+    def _completion_kwargs(
+        self,
+        messages: list[dict],
+        response_model: Type[BaseModel],
+        max_tokens: int,
+    ) -> dict:
+        """Build request kwargs; only Anthropic requires an explicit max_tokens."""
+        kwargs = {
+            "model": self.model,
+            "messages": messages,
+            "response_model": response_model,
+        }
+        if self.provider == "anthropic":
+            kwargs["max_tokens"] = max_tokens
+        return kwargs
 
     def _is_retryable_error(self, error: Exception) -> bool:
         """Check if an error is retryable (rate limit, temporary failure)."""
         error_str = str(error).lower()
 
-        # Rate limit errors
-        if any(term in error_str for term in ["rate limit", "rate_limit", "429", "too many requests"]):
-            return True
-
-        # Temporary server errors
-        if any(term in error_str for term in ["500", "502", "503", "504", "overloaded", "timeout"]):
+        # Rate limits and temporary server errors
+        if _RETRYABLE_ERROR_RE.search(error_str):
             return True
 
         # Ollama "does not support tools" - retryable after fallback to JSON mode
@@ -341,40 +538,100 @@ class ExtractionEngine:
             RateLimitError: If rate limit is hit and retries exhausted
             APIError: For other API errors after retries exhausted
         """
-        last_error = None
-        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = func(*args, **kwargs)
+                if self._limiter:
+                    self._limiter.on_success()
+                return result
+            except Exception as e:
+                time.sleep(self._retry_delay_or_raise(attempt, e))
+
+    async def _call_with_retry_async(self, func, *args, **kwargs):
+        """Async counterpart of _call_with_retry; awaits func and sleeps without blocking.
+
+        Args:
+            func: Coroutine function to call
+            *args, **kwargs: Arguments to pass to the function
+
+        Returns:
+            Result of the awaited function call
 
+        Raises:
+            RateLimitError: If rate limit is hit and retries exhausted
+            APIError: For other API errors after retries exhausted
+        """
         for attempt in range(self.max_retries + 1):
             try:
-                return func(*args, **kwargs)
+                result = await func(*args, **kwargs)
+                if self._limiter:
+                    self._limiter.on_success()
+                return result
             except Exception as e:
-                last_error = e
+                await asyncio.sleep(self._retry_delay_or_raise(attempt, e))
 
-                if not self._is_retryable_error(e):
-                    # Non-retryable error, raise immediately
-                    self._raise_api_error(e)
+    def _retry_delay_or_raise(self, attempt: int, error: Exception) -> float:
+        """Handle a failed (0-based) attempt for both retry wrappers.
 
-                if attempt < self.max_retries:
-                    logger.warning(
-                        f"Retryable error (attempt {attempt + 1}/{self.max_retries + 1}): {e}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    time.sleep(delay)
-                    delay *= self.DEFAULT_RETRY_MULTIPLIER
-                else:
-                    # Exhausted retries
-                    if "rate limit" in str(e).lower() or "429" in str(e):
-                        raise RateLimitError(
-                            f"Rate limit exceeded after {self.max_retries + 1} attempts. "
-                            f"Try again later or reduce request frequency.",
-                            provider=self.provider,
-                            original_error=e,
-                        )
-                    raise APIError(
-                        f"API call failed after {self.max_retries + 1} attempts: {e}",
-                        provider=self.provider,
-                        original_error=e,
-                    )
+        Returns:
+            Seconds to wait before the next attempt
+
+        Raises:
+            RateLimitError: If rate limit is hit and retries exhausted
+            APIError: If the error isn't retryable or retries are exhausted
+        """
+        self._note_rate_limit(error)
+
+        if not self._is_retryable_error(error):
+            # Non-retryable error, raise immediately
+            self._raise_api_error(error)
+
+        if attempt >= self.max_retries:
+            raise self._retries_exhausted_error(error)
+
+        delay = self._backoff_delay(attempt, error)
+        logger.warning(
+            f"Retryable error (attempt {attempt + 1}/{self.max_retries + 1}): {error}. "
+            f"Retrying in {delay:.1f}s..."
+        )
+        return delay
+
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before retrying after the given (0-based) attempt.
+
+        Honors a Retry-After header when the provider sends one; otherwise
+        uses capped exponential backoff plus random jitter so parallel
+        callers don't retry in lockstep.
+        """
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(
+            self.retry_delay * self.DEFAULT_RETRY_MULTIPLIER ** attempt,
+            self.MAX_RETRY_DELAY,
+        )
+        return delay + random.uniform(0, delay * self.RETRY_JITTER)
+
+    def _note_rate_limit(self, error: Exception) -> None:
+        """Tell the limiter (if any) that the provider rejected a request."""
+        if self._limiter and _is_rate_limit_error(error):
+            self._limiter.on_rate_limited()
+
+    def _retries_exhausted_error(self, error: Exception) -> APIError:
+        """Build the error raised once all retry attempts have failed."""
+        if _is_rate_limit_error(error):
+            return RateLimitError(
+                f"Rate limit exceeded after {self.max_retries + 1} attempts. "
+                f"Try again later or reduce request frequency.",
+                provider=self.provider,
+                original_error=error,
+            )
+        return APIError(
+            f"API call failed after {self.max_retries + 1} attempts: {error}",
+            provider=self.provider,
+            original_error=error,
+        )
 
     def _fallback_to_json_mode(self) -> bool:
         """Fall back to JSON mode for Ollama if tools aren't supported.
@@ -388,21 +645,16 @@ class ExtractionEngine:
         if not hasattr(self, "_ollama_base_url"):
             return False
 
+        logger.info("Model doesn't support tools, falling back to JSON mode")
+        self._ollama_json_mode = True
         try:
-            import instructor
-            from openai import OpenAI
-
-            logger.info("Model doesn't support tools, falling back to JSON mode")
-            self._client = instructor.from_openai(
-                OpenAI(
-                    base_url=self._ollama_base_url,
-                    api_key=self._ollama_api_key,
-                ),
-                mode=instructor.Mode.JSON,
-            )
-            return True
+            self._client = self._build_client(async_=False)
         except Exception:
+            self._ollama_json_mode = False
             return False
+        # Rebuild the async client in JSON mode on next use
+        self._async_client = None
+        return True
 
     def _raise_api_error(self, error: Exception):
         """Convert provider-specific errors to our exception types."""
@@ -456,35 +708,313 @@ class ExtractionEngine:
             RateLimitError: If rate limit is exceeded
             AuthenticationError: If authentication fails
         """
+        cache_key, cached = self._cache_lookup(text, schema)
+        if cached is not None:
+            return cached
+
         client = self._get_client()
+        kwargs = self._extract_kwargs(text, schema)
 
         def _do_extract():
+            if self._limiter:
+                self._limiter.acquire(_estimate_tokens(text))
+            return self._create_with_completion(client)(**kwargs)
+
+        result = self._call_with_retry(_do_extract)
+        return self._cache_store(cache_key, self._to_extraction_response(result))
+
+    async def aextract(self, text: str, schema: Type[BaseModel]) -> BaseModel:
+        """Async version of extract() using the provider's async client.
+
+        Raises:
+            APIError: If the API call fails
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+        """
+        response = await self.aextract_with_metadata(text, schema)
+        return response.data
+
+    async def aextract_with_metadata(
+        self, text: str, schema: Type[BaseModel]
+    ) -> ExtractionResponse:
+        """Async version of extract_with_metadata().
+
+        Raises:
+            APIError: If the API call fails
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+        """
+        cache_key, cached = self._cache_lookup(text, schema)
+        if cached is not None:
+            return cached
+
+        kwargs = self._extract_kwargs(text, schema)
+
+        async def _do_extract():
+            if self._limiter:
+                await self._limiter.aacquire(_estimate_tokens(text))
+            # Fetch per attempt so an Ollama JSON-mode fallback takes effect
+            client = self._get_async_client()
+            return await self._create_with_completion(client)(**kwargs)
+
+        result = await self._call_with_retry_async(_do_extract)
+        return self._cache_store(cache_key, self._to_extraction_response(result))
+
+    def _cache_lookup(
+        self, text: str, schema: Type[BaseModel]
+    ) -> tuple[Optional[str], Optional[ExtractionResponse]]:
+        """Return (cache key, cached response) - both None without a cache."""
+        if self.cache is None:
+            return None, None
+        schema_text, _ = _schema_blob(schema)
+        key = self.cache.make_key(f"{self.provider}:{self.model}", schema_text, text)
+        data = self.cache.get(key, schema)
+        if data is None:
+            return key, None
+        # No LLM call was made, so there is no token usage to report
+        return key, ExtractionResponse(data=data, tokens=None)
+
+    def _cache_store(
+        self, key: Optional[str], response: ExtractionResponse
+    ) -> ExtractionResponse:
+        if key is not None:
+            self.cache.set(key, response.data)
+        return response
+
+    async def aextract_many(
+        self,
+        texts: Sequence[str],
+        schema: Type[BaseModel],
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> list:
+        """Extract from many documents concurrently.
+
+        Args:
+            texts: Document texts to extract from
+            schema: Pydantic model class defining the extraction schema
+            max_concurrency: Maximum number of requests in flight at once
+            return_exceptions: If True, failed documents yield their exception
+                instead of cancelling the whole batch
+
+        Returns:
+            Extracted schema instances in the same order as texts
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(text: str) -> BaseModel:
+            async with semaphore:
+                return await self.aextract(text, schema)
+
+        return await asyncio.gather(
+            *(_bounded(text) for text in texts),
+            return_exceptions=return_exceptions,
+        )
+
+    def submit_batch(self, texts: Sequence[str], schema: Type[BaseModel]) -> str:
+        """Submit documents as a provider-native batch job.
+
+        Batch jobs run asynchronously on the provider side at reduced cost.
+        Each request is tagged with its index in texts so collect_batch()
+        can restore the original order.
+
+        Args:
+            texts: Document texts to extract from
+            schema: Pydantic model class defining the extraction schema
+
+        Returns:
+            Provider batch ID to pass to collect_batch()
+
+        Raises:
+            ProviderError: If the provider has no batch API
+            APIError: If submitting the batch fails
+        """
+        client = self._get_raw_client()
+        _, json_schema = _schema_blob(schema)
+
+        if self.provider == "anthropic":
+            requests = [
+                {
+                    "custom_id": _batch_custom_id(i),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": 4096,
+                        "messages": self._extract_kwargs(text, schema)["messages"],
+                        "tools": [{
+                            "name": schema.__name__,
+                            "description": schema.__doc__ or f"Extract {schema.__name__}",
+                            "input_schema": json_schema,
+                        }],
+                        "tool_choice": {"type": "tool", "name": schema.__name__},
+                    },
+                }
+                for i, text in enumerate(texts)
+            ]
+            batch = self._call_with_retry(client.messages.batches.create, requests=requests)
+            return batch.id
+
+        # openai: upload a JSONL file of chat completion requests
+        lines = [
+            json.dumps({
+                "custom_id": _batch_custom_id(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._extract_kwargs(text, schema)["messages"],
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {"name": schema.__name__, "schema": json_schema},
+                    },
+                },
+            })
+            for i, text in enumerate(texts)
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        batch_file = self._call_with_retry(
+            client.files.create, file=("batch.jsonl", payload), purpose="batch"
+        )
+        batch = self._call_with_retry(
+            client.batches.create,
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        schema: Type[BaseModel],
+        count: int,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[BaseModel]]:
+        """Wait for a batch job to finish and return its results in order.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+            schema: Pydantic model class used when submitting
+            count: Number of documents submitted
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            One entry per submitted document; None where the request failed
+            or the response did not validate against the schema
+
+        Raises:
+            ProviderError: If the provider has no batch API
+            APIError: If the batch fails, expires, or times out
+        """
+        client = self._get_raw_client()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
             if self.provider == "anthropic":
-                return client.messages.create_with_completion(
-                    model=self.model,
-                    max_tokens=4096,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": f"Extract the following information from this document:\n\n{text}",
-                        }
-                    ],
-                    response_model=schema,
-                )
-            else:  # openai, gemini, ollama
-                return client.chat.completions.create_with_completion(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": f"Extract the following information from this document:\n\n{text}",
-                        }
-                    ],
-                    response_model=schema,
+                batch = self._call_with_retry(client.messages.batches.retrieve, batch_id)
+                if batch.processing_status == "ended":
+                    break
+            else:
+                batch = self._call_with_retry(client.batches.retrieve, batch_id)
+                if batch.status == "completed":
+                    break
+                if batch.status in ("failed", "expired", "cancelled"):
+                    raise APIError(
+                        f"Batch {batch_id} did not complete (status: {batch.status})",
+                        provider=self.provider,
+                    )
+
+            if deadline is not None and time.monotonic() >= deadline:
+                raise APIError(
+                    f"Timed out waiting for batch {batch_id}",
+                    provider=self.provider,
                 )
+            time.sleep(poll_interval)
 
-        result = self._call_with_retry(_do_extract)
+        results: list[Optional[BaseModel]] = [None] * count
+        for index, data in self._iter_batch_results(client, batch):
+            if not 0 <= index < count:
+                continue
+            try:
+                results[index] = schema.model_validate(data)
+            except Exception as e:
+                logger.warning(f"Batch {batch_id} result {index} failed validation: {e}")
+        return results
+
+    def extract_batch(
+        self,
+        texts: Sequence[str],
+        schema: Type[BaseModel],
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[BaseModel]]:
+        """Extract from many documents via the provider's batch API.
+
+        Convenience wrapper around submit_batch() and collect_batch().
+        """
+        batch_id = self.submit_batch(texts, schema)
+        logger.info(f"Submitted batch {batch_id} with {len(texts)} document(s)")
+        return self.collect_batch(
+            batch_id, schema, len(texts), poll_interval=poll_interval, timeout=timeout
+        )
+
+    def _get_raw_client(self):
+        """Return the underlying SDK client for APIs instructor doesn't wrap.
+
+        Raises:
+            ProviderError: If the provider has no batch API
+        """
+        if self.provider not in ("anthropic", "openai"):
+            raise ProviderError(
+                f"Batch extraction is not supported for provider '{self.provider}'. "
+                f"Supported providers: anthropic, openai"
+            )
+        return self._get_client().client
 
+    def _iter_batch_results(self, client, batch):
+        """Yield (index, data) for each successful request in a finished batch."""
+        if self.provider == "anthropic":
+            for entry in client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+                    continue
+                for block in entry.result.message.content:
+                    if block.type == "tool_use":
+                        yield _batch_index(entry.custom_id), block.input
+                        break
+            return
+
+        if not batch.output_file_id:
+            return
+        content = client.files.content(batch.output_file_id).text
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                logger.warning(f"Batch request {entry.get('custom_id')} failed: {entry.get('error')}")
+                continue
+            message = response["body"]["choices"][0]["message"]["content"]
+            yield _batch_index(entry["custom_id"]), json.loads(message)
+
+    def _extract_kwargs(self, text: str, schema: Type[BaseModel]) -> dict:
+        """Build the extraction request for a document."""
+        messages = [
+            {
+                "role": "user",
+                "content": f"Extract the following information from this document:\n\n{text}",
+            }
+        ]
+        return self._completion_kwargs(messages, schema, max_tokens=4096)
+
+    @staticmethod
+    def _to_extraction_response(result: Any) -> ExtractionResponse:
+        """Wrap a create_with_completion result in an ExtractionResponse."""
         # create_with_completion returns (model, completion) tuple
         if isinstance(result, tuple) and len(result) == 2:
             data, completion = result
@@ -538,47 +1068,12 @@ class ExtractionEngine:
             RateLimitError: If rate limit is exceeded
         """
         client = self._get_client()
-
-        # Build prompt with context
-        schema_json = json.dumps(schema.model_json_schema(), indent=2)
-        extracted_json = json.dumps(extracted_data.model_dump(mode="json"), indent=2)
-
-        prompt = f"""Assess this extraction. Be terse.
-
-DOCUMENT:
-{text}
-
-SCHEMA:
-{schema_json}
-
-EXTRACTED:
-{extracted_json}
-
-Return:
-- review_status: "needs_review" (errors/missing data), "suggested_review" (minor issues), or "no_review_needed"
-- ambiguous_fields: field names with uncertain values
-- review_notes: 1-2 sentences max, only if issues exist
-- schema_suggestions: list of fields worth adding, each with:
-  - name: snake_case field name
-  - field_type: Python type (str, int, float, bool, Optional[str], list[str], etc.)
-  - description: short description for Field()
-  - sample_value: example value from the document (optional)
-"""
+        kwargs = self._assess_kwargs(text, schema, extracted_data)
 
         def _do_assess():
-            if self.provider == "anthropic":
-                return client.messages.create_with_completion(
-                    model=self.model,
-                    max_tokens=512,
-                    messages=[{"role": "user", "content": prompt}],
-                    response_model=Assessment,
-                )
-            else:  # openai, gemini, ollama
-                return client.chat.completions.create_with_completion(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    response_model=Assessment,
-                )
+            if self._limiter:
+                self._limiter.acquire(_estimate_tokens(text))
+            return self._create_with_completion(client)(**kwargs)
 
         result = self._call_with_retry(_do_assess)
 
@@ -590,3 +1085,40 @@ Return:
 
         # Fallback if not a tuple
         return AssessmentResponse(assessment=result, tokens=None)
+
+    def _assess_kwargs(
+        self,
+        text: str,
+        schema: Type[BaseModel],
+        extracted_data: BaseModel,
+    ) -> dict:
+        """Build the assessment request.
+
+        The instructions and schema are identical for every document of a
+        schema, so they go first as a system prefix the provider can cache
+        (explicit cache_control for Anthropic, automatic prefix caching for
+        OpenAI). Only the document and extracted data vary per call.
+        """
+        schema_text, _ = _schema_blob(schema)
+        prefix = f"{ASSESS_INSTRUCTIONS}\nSCHEMA:\n{schema_text}"
+        # pydantic-core serializes straight to JSON, skipping the dict round-trip
+        extracted_json = extracted_data.model_dump_json(indent=2)
+        content = f"DOCUMENT:\n{text}\n\nEXTRACTED:\n{extracted_json}"
+
+        if self.provider == "anthropic":
+            kwargs = self._completion_kwargs(
+                [{"role": "user", "content": content}], Assessment, max_tokens=512
+            )
+            kwargs["system"] = [
+                {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+            ]
+            return kwargs
+
+        return self._completion_kwargs(
+            [
+                {"role": "system", "content": prefix},
+                {"role": "user", "content": content},
+            ],
+            Assessment,
+            max_tokens=512,
+        )
@@ -0,0 +1,108 @@
+"""Content-addressed cache for extraction results."""
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Optional, Type
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """Exact-match cache of extraction results.
+
+    Results are keyed by a hash of the model, schema definition and document
+    text, so a hit is only possible when the request would be identical.
+    Entries are kept in a bounded in-memory LRU and, if a directory is given,
+    also persisted as JSON files so they survive across runs.
+    """
+
+    def __init__(self, max_entries: int = 1024, directory: Optional[str] = None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(model: str, schema_json: str, text: str) -> str:
+        """Build the cache key for a request from its model, JSON schema text and document."""
+        digest = hashlib.sha256()
+        digest.update(model.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(schema_json.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str, schema: Type[BaseModel]) -> Optional[BaseModel]:
+        """Return the cached result for key, or None on a miss."""
+        raw = self._entries.get(key)
+        if raw is not None:
+            self._entries.move_to_end(key)
+        elif self.directory:
+            raw = self._read_file(key)
+            if raw is not None:
+                self._remember(key, raw)
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        try:
+            data = schema.model_validate_json(raw)
+        except Exception as e:
+            # Stale entry (e.g. written by an older schema) - treat as a miss
+            logger.debug(f"Discarding unreadable cache entry {key}: {e}")
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data
+
+    def set(self, key: str, data: BaseModel) -> None:
+        """Store an extraction result."""
+        raw = data.model_dump_json()
+        self._remember(key, raw)
+        if self.directory:
+            self._write_file(key, raw)
+
+    def clear(self) -> None:
+        """Drop in-memory entries (files on disk are left in place)."""
+        self._entries.clear()
+
+    def _remember(self, key: str, raw: str) -> None:
+        self._entries[key] = raw
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_file(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_file(self, key: str, raw: str) -> None:
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(raw)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
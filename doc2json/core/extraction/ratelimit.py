@@ -0,0 +1,122 @@
+"""Client-side rate limiting for LLM requests."""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    """Token bucket that hands out reservations.
+
+    acquire() always deducts immediately and returns how long the caller must
+    wait for the bucket to refill, so callers never sleep while holding the
+    lock and concurrent callers queue up in order.
+    """
+
+    def __init__(self, per_minute: float, now: float):
+        self.per_minute = per_minute
+        self.level = per_minute  # Start full: one minute of budget
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        rate = self.per_minute / 60.0
+        self.level = min(self.per_minute, self.level + (now - self.updated) * rate)
+        self.updated = now
+        # Never ask for more than the bucket can hold, or we'd wait forever
+        self.level -= min(amount, self.per_minute)
+        return 0.0 if self.level >= 0 else -self.level / rate
+
+
+class RateLimiter:
+    """Proactive request/token throttling with AIMD adjustment.
+
+    Requests wait for budget before being sent instead of discovering the
+    limit through a 429. Each rate limit error cuts the allowed rate by
+    decrease_factor; after recovery_period seconds without one, the rate is
+    restored to the configured limits.
+
+    Args:
+        requests_per_minute: Maximum requests per minute (None for no limit)
+        tokens_per_minute: Maximum estimated input tokens per minute (None for no limit)
+        decrease_factor: Multiplier applied to the rate on each rate limit error
+        recovery_period: Seconds without rate limit errors before restoring the rate
+        clock: Monotonic time source (overridable for tests)
+    """
+
+    MIN_FRACTION = 0.1  # Never throttle below 10% of the configured rate
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        decrease_factor: float = 0.8,
+        recovery_period: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.decrease_factor = decrease_factor
+        self.recovery_period = recovery_period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._scale = 1.0
+        self._last_limited: Optional[float] = None
+
+        now = clock()
+        self._requests = _Bucket(requests_per_minute, now) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute, now) if tokens_per_minute else None
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of the given size may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Async version of acquire()."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicatively decrease the rate after a rate limit error."""
+        with self._lock:
+            self._scale = max(self.MIN_FRACTION, self._scale * self.decrease_factor)
+            self._last_limited = self._clock()
+            self._apply_scale()
+        logger.info(f"Rate limited; throttling to {self._scale:.0%} of configured rate")
+
+    def on_success(self) -> None:
+        """Restore the configured rate once the provider has stopped limiting us."""
+        with self._lock:
+            if self._scale >= 1.0 or self._last_limited is None:
+                return
+            if self._clock() - self._last_limited >= self.recovery_period:
+                self._scale = 1.0
+                self._last_limited = None
+                self._apply_scale()
+
+    @property
+    def scale(self) -> float:
+        """Current fraction of the configured rate."""
+        return self._scale
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = self._clock()
+            wait = 0.0
+            if self._requests:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens and tokens:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+            return wait
+
+    def _apply_scale(self) -> None:
+        if self._requests:
+            self._requests.per_minute = self.requests_per_minute * self._scale
+        if self._tokens:
+            self._tokens.per_minute = self.tokens_per_minute * self._scale
@@ -21,10 +21,14 @@ class ParserRegistry:
 
     def __init__(self):
         self._parsers: list[DocumentParser] = []
+        # Extension -> parsers worth asking, in registration order. Built
+        # lazily per extension and reset whenever a parser is registered.
+        self._by_ext: dict[str, list[DocumentParser]] = {}
 
     def register(self, parser: DocumentParser) -> None:
         """Register a parser with the registry."""
         self._parsers.append(parser)
+        self._by_ext.clear()
 
     def get_parser(self, file_path: str) -> DocumentParser:
         """Get the appropriate parser for a file.
@@ -32,17 +36,27 @@ class ParserRegistry:
         Raises:
             UnsupportedFileTypeError: If no parser can handle the file
         """
-        for parser in self._parsers:
+        _, ext = os.path.splitext(file_path)
+        for parser in self._candidates(ext.lower()):
             if parser.can_parse(file_path):
                 return parser
 
-        _, ext = os.path.splitext(file_path)
         supported = self._get_supported_extensions()
         raise UnsupportedFileTypeError(
             f"No parser available for '{ext}' files. "
             f"Supported formats: {', '.join(sorted(supported)) or 'none registered'}"
         )
 
+    def _candidates(self, ext: str) -> list[DocumentParser]:
+        """Parsers that may handle ext: those declaring it, plus any without SUPPORTED_EXTENSIONS."""
+        candidates = self._by_ext.get(ext)
+        if candidates is None:
+            candidates = self._by_ext[ext] = [
+                parser for parser in self._parsers
+                if ext in getattr(parser, "SUPPORTED_EXTENSIONS", (ext,))
+            ]
+        return candidates
+
     def _get_supported_extensions(self) -> set[str]:
         """Get all supported file extensions from registered parsers."""
         extensions = set()
@@ -16,7 +16,7 @@ class DOCXParser:
     Extracts text from paragraphs and tables in Word documents.
     """
 
-    SUPPORTED_EXTENSIONS = {".docx"}
+    SUPPORTED_EXTENSIONS = frozenset({".docx"})
 
     def __init__(self, include_tables: bool = True):
         """Initialize DOCX parser.
@@ -5,9 +5,11 @@ for future web scraping functionality. The HTMLExtractor class can
 process raw HTML strings, while HTMLParser wraps it for file-based use.
 """
 
+import codecs
 import logging
 import os
-from typing import Optional
+import re
+from typing import BinaryIO, Optional
 
 from bs4 import BeautifulSoup
 
@@ -25,6 +27,18 @@ REMOVE_TAGS = {
 # Tags to remove for text extraction but preserve for structured extraction
 REMOVE_TAGS_TEXT_ONLY = {"head"}
 
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+# Tags counted by HTMLExtractor.analyze_stream
+STREAM_TAGS = ("title", *sorted(HEADING_TAGS), "p", "table", "ul", "ol")
+
+# Tags collected by HTMLExtractor.extract_structured in its single tree walk
+STRUCTURE_TAGS = list(STREAM_TAGS)
+
+# Bytes read when sniffing a file's encoding, and the meta charset pattern
+ENCODING_PROBE_BYTES = 4096
+_CHARSET_RE = re.compile(rb"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
 # Tags that should add newlines for readability
 BLOCK_TAGS = {
     "p", "div", "section", "article", "main", "h1", "h2", "h3",
@@ -32,6 +46,26 @@ BLOCK_TAGS = {
 }
 
 
+def _make_soup(html: str, parser: str = "lxml") -> BeautifulSoup:
+    """Parse HTML, falling back to the built-in parser if lxml isn't available."""
+    try:
+        return BeautifulSoup(html, parser)
+    except Exception:
+        return BeautifulSoup(html, "html.parser")
+
+
+def _remove_tags(soup: BeautifulSoup, tags: set[str]) -> None:
+    """Decompose every element with one of the given tag names.
+
+    A single find_all walk matches all names at once, instead of one
+    full-tree walk per tag.
+    """
+    for element in soup.find_all(list(tags)):
+        # Nested matches go with their already-removed ancestor
+        if not element.decomposed:
+            element.decompose()
+
+
 class HTMLExtractor:
     """Extract clean text from HTML content.
 
@@ -78,21 +112,11 @@ class HTMLExtractor:
         Returns:
             Cleaned text content
         """
-        try:
-            soup = BeautifulSoup(html, parser)
-        except Exception:
-            # Fall back to built-in parser if lxml not available
-            soup = BeautifulSoup(html, "html.parser")
-
-        # Remove unwanted tags entirely
-        for tag in self.remove_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+        soup = _make_soup(html, parser)
 
-        # Remove head tag for text extraction (but not for structured)
-        for tag in REMOVE_TAGS_TEXT_ONLY:
-            for element in soup.find_all(tag):
-                element.decompose()
+        # Remove unwanted tags entirely, plus <head> for text extraction
+        # (but not for structured), in the same walk
+        _remove_tags(soup, self.remove_tags | REMOVE_TAGS_TEXT_ONLY)
 
         # Handle links if preserving
         if self.preserve_links:
@@ -108,12 +132,14 @@ class HTMLExtractor:
                 if alt:
                     img.replace_with(f"[Image: {alt}]")
 
-        # Extract text with separator for block elements
-        text = soup.get_text(separator="\n", strip=True)
-
-        # Clean up excessive newlines
-        lines = [line.strip() for line in text.splitlines()]
-        lines = [line for line in lines if line]
+        # Build lines straight from the text nodes rather than joining them
+        # into one big string only to split it apart again
+        lines = [
+            stripped
+            for string in soup.stripped_strings
+            for line in string.splitlines()
+            if (stripped := line.strip())
+        ]
 
         return "\n\n".join(self._merge_short_lines(lines))
 
@@ -144,15 +170,10 @@ class HTMLExtractor:
         Returns a dict with title, headings, and body text separated.
         Useful for more sophisticated extraction needs.
         """
-        try:
-            soup = BeautifulSoup(html, parser)
-        except Exception:
-            soup = BeautifulSoup(html, "html.parser")
+        soup = _make_soup(html, parser)
 
         # Remove unwanted tags
-        for tag in self.remove_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+        _remove_tags(soup, self.remove_tags)
 
         result = {
             "title": "",
@@ -162,57 +183,170 @@ class HTMLExtractor:
             "lists": [],
         }
 
-        # Extract title
-        title_tag = soup.find("title")
-        if title_tag:
-            result["title"] = title_tag.get_text(strip=True)
-
-        # Also check for h1 if no title
-        if not result["title"]:
-            h1 = soup.find("h1")
-            if h1:
-                result["title"] = h1.get_text(strip=True)
-
-        # Extract headings
-        for level in range(1, 7):
-            for heading in soup.find_all(f"h{level}"):
-                text = heading.get_text(strip=True)
+        title = None
+        first_h1 = None
+        headings_by_level: dict[int, list[str]] = {level: [] for level in range(1, 7)}
+
+        # One walk over the tree; headings are bucketed by level so the
+        # output keeps its all-h1s-then-h2s... ordering
+        for element in soup.find_all(STRUCTURE_TAGS):
+            tag = element.name
+            if tag in HEADING_TAGS:
+                text = element.get_text(strip=True)
+                if tag == "h1" and first_h1 is None:
+                    first_h1 = text
                 if text:
-                    result["headings"].append({
-                        "level": level,
-                        "text": text,
-                    })
-
-        # Extract paragraphs
-        for p in soup.find_all("p"):
-            text = p.get_text(strip=True)
-            if text:
-                result["paragraphs"].append(text)
-
-        # Extract tables
-        for table in soup.find_all("table"):
-            table_data = []
-            for row in table.find_all("tr"):
-                cells = []
-                for cell in row.find_all(["td", "th"]):
-                    cells.append(cell.get_text(strip=True))
-                if cells:
-                    table_data.append(cells)
-            if table_data:
-                result["tables"].append(table_data)
-
-        # Extract lists
-        for ul in soup.find_all(["ul", "ol"]):
-            items = []
-            for li in ul.find_all("li", recursive=False):
-                text = li.get_text(strip=True)
+                    headings_by_level[int(tag[1])].append(text)
+            elif tag == "p":
+                text = element.get_text(strip=True)
                 if text:
-                    items.append(text)
-            if items:
-                result["lists"].append(items)
+                    result["paragraphs"].append(text)
+            elif tag == "table":
+                table_data = []
+                for row in element.find_all("tr"):
+                    cells = [cell.get_text(strip=True) for cell in row.find_all(["td", "th"])]
+                    if cells:
+                        table_data.append(cells)
+                if table_data:
+                    result["tables"].append(table_data)
+            elif tag in ("ul", "ol"):
+                items = []
+                for li in element.find_all("li", recursive=False):
+                    text = li.get_text(strip=True)
+                    if text:
+                        items.append(text)
+                if items:
+                    result["lists"].append(items)
+            elif title is None:  # title
+                title = element.get_text(strip=True)
+
+        # Fall back to the first h1 if there is no (non-empty) title
+        result["title"] = title or first_h1 or ""
+        result["headings"] = [
+            {"level": level, "text": text}
+            for level, texts in headings_by_level.items()
+            for text in texts
+        ]
 
         return result
 
+    def analyze_stream(self, file_obj: BinaryIO, encoding: Optional[str] = None) -> dict:
+        """Count document structure without building a full tree.
+
+        Streams the HTML through lxml and clears every element once it has
+        ended and no open title/heading/p/table/list still needs its text,
+        so memory stays flat regardless of document size. Titles, headings
+        and counts follow exactly the same rules as extract_structured().
+
+        Args:
+            file_obj: Binary file-like object containing HTML
+            encoding: Known encoding, or None to let lxml detect it
+
+        Returns:
+            Dict with title, heading/paragraph/table/list counts and has_content
+        """
+        from lxml import etree
+
+        counts = {"heading": 0, "paragraph": 0, "table": 0, "list": 0}
+        # Like extract_structured: the first <title> and first <h1> in
+        # document order win, even when their text is empty
+        title = first_h1 = None
+        title_elem = first_h1_elem = None
+
+        # One flag per open element: is it (inside) a removed tag?
+        removed_stack: list[bool] = []
+        open_counted = 0  # Open STREAM_TAGS elements whose subtree is still needed
+
+        events = etree.iterparse(
+            file_obj,
+            events=("start", "end"),
+            html=True,
+            encoding=encoding,
+            recover=True,
+        )
+        try:
+            for event, elem in events:
+                tag = elem.tag
+                if event == "start":
+                    removed = bool(removed_stack and removed_stack[-1]) or tag in self.remove_tags
+                    removed_stack.append(removed)
+                    if not removed and tag in STREAM_TAGS:
+                        open_counted += 1
+                        if tag == "title" and title_elem is None:
+                            title_elem = elem
+                        elif tag == "h1" and first_h1_elem is None:
+                            first_h1_elem = elem
+                    continue
+
+                removed = removed_stack.pop()
+                if not removed and tag in STREAM_TAGS:
+                    open_counted -= 1
+                    if elem is title_elem:
+                        title = _stream_text(elem)
+                    elif tag in HEADING_TAGS:
+                        text = _stream_text(elem)
+                        if elem is first_h1_elem:
+                            first_h1 = text
+                        if text:
+                            counts["heading"] += 1
+                    elif tag == "p":
+                        if _stream_text(elem):
+                            counts["paragraph"] += 1
+                    elif tag == "table":
+                        if any(row.find(".//td") is not None or row.find(".//th") is not None
+                               for row in elem.iter("tr")):
+                            counts["table"] += 1
+                    elif tag in ("ul", "ol"):
+                        if any(_stream_text(li) for li in elem.iterchildren("li")):
+                            counts["list"] += 1
+
+                # Free the finished element (and its finished siblings)
+                # unless an enclosing counted element still needs its text
+                if not open_counted:
+                    elem.clear(keep_tail=False)
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+        except etree.LxmlError:
+            # Empty or unreadable input - report what was seen so far
+            pass
+
+        return {
+            "title": title or first_h1 or "",
+            "heading_count": counts["heading"],
+            "paragraph_count": counts["paragraph"],
+            "table_count": counts["table"],
+            "list_count": counts["list"],
+            "has_content": bool(counts["paragraph"] or counts["table"]),
+        }
+
+
+def _stream_text(elem) -> str:
+    """Whitespace-stripped text of an lxml element, like get_text(strip=True)."""
+    return "".join(t.strip() for t in elem.itertext())
+
+
+class _Utf8Reader:
+    """Binary reader that decodes a file with one codec and re-encodes it as UTF-8.
+
+    Lets lxml stream a file decoded with the same codec _read_html() would
+    use; bytes invalid in that codec raise UnicodeDecodeError from read().
+    """
+
+    def __init__(self, raw: BinaryIO, encoding: str):
+        self._raw = raw
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+    def read(self, size: int = -1) -> bytes:
+        while True:
+            chunk = self._raw.read(size)
+            text = self._decoder.decode(chunk, final=not chunk)
+            # An empty return means EOF to lxml, so keep reading past
+            # chunks that end inside a multi-byte character
+            if text or not chunk:
+                return text.encode("utf-8")
+
 
 class HTMLParser:
     """Parser for local HTML files.
@@ -221,7 +355,7 @@ class HTMLParser:
     DocumentParser protocol used by the parser registry.
     """
 
-    SUPPORTED_EXTENSIONS = {".html", ".htm"}
+    SUPPORTED_EXTENSIONS = frozenset({".html", ".htm"})
 
     def __init__(
         self,
@@ -246,6 +380,10 @@ class HTMLParser:
 
     def parse(self, file_path: str) -> str:
         """Parse an HTML file and extract text."""
+        return self.extractor.extract(self._read_html(file_path))
+
+    def _read_html(self, file_path: str) -> str:
+        """Read and decode an HTML file."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"HTML file not found: {file_path}")
 
@@ -255,18 +393,18 @@ class HTMLParser:
         try:
             with open(file_path, "r", encoding=encoding) as f:
                 html = f.read()
-            return self.extractor.extract(html)
         except UnicodeDecodeError:
             # Fallback to latin-1 which accepts any byte
             with open(file_path, "r", encoding="latin-1") as f:
                 html = f.read()
-            return self.extractor.extract(html)
+
+        return html
 
     def _detect_encoding(self, file_path: str) -> str:
         """Detect file encoding from HTML meta tag or BOM."""
-        # Read first 1KB to check for encoding hints
+        # Encoding hints must appear early in <head>; never read more than this
         with open(file_path, "rb") as f:
-            head = f.read(1024)
+            head = f.read(ENCODING_PROBE_BYTES)
 
         # Check for BOM
         if head.startswith(b"\xef\xbb\xbf"):
@@ -277,37 +415,35 @@ class HTMLParser:
             return "utf-16-be"
 
         # Look for charset in meta tag
-        head_str = head.decode("ascii", errors="ignore").lower()
-        if 'charset="utf-8"' in head_str or "charset=utf-8" in head_str:
-            return "utf-8"
-        if 'charset="iso-8859-1"' in head_str or "charset=iso-8859-1" in head_str:
-            return "iso-8859-1"
-        if 'charset="windows-1252"' in head_str or "charset=windows-1252" in head_str:
-            return "windows-1252"
+        match = _CHARSET_RE.search(head)
+        if match:
+            charset = match.group(1).decode("ascii").lower()
+            try:
+                codecs.lookup(charset)
+                return charset
+            except LookupError:
+                logger.debug(f"Unknown charset '{charset}' in {file_path}, using utf-8")
 
         return "utf-8"
 
     def parse_structured(self, file_path: str) -> dict:
         """Parse an HTML file and return structured content."""
+        return self.extractor.extract_structured(self._read_html(file_path))
+
+    def analyze(self, file_path: str) -> dict:
+        """Analyze an HTML file structure."""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"HTML file not found: {file_path}")
 
+        # Decode exactly as _read_html does, so analyze() and
+        # parse_structured() agree even when the declared charset is wrong
         encoding = self._detect_encoding(file_path)
+        try:
+            return self._analyze_file(file_path, encoding)
+        except UnicodeDecodeError:
+            return self._analyze_file(file_path, "latin-1")
 
-        with open(file_path, "r", encoding=encoding) as f:
-            html = f.read()
-
-        return self.extractor.extract_structured(html)
-
-    def analyze(self, file_path: str) -> dict:
-        """Analyze an HTML file structure."""
-        structured = self.parse_structured(file_path)
-
-        return {
-            "title": structured["title"],
-            "heading_count": len(structured["headings"]),
-            "paragraph_count": len(structured["paragraphs"]),
-            "table_count": len(structured["tables"]),
-            "list_count": len(structured["lists"]),
-            "has_content": bool(structured["paragraphs"] or structured["tables"]),
-        }
+    def _analyze_file(self, file_path: str, encoding: str) -> dict:
+        """Stream a file through analyze_stream, decoded with the given codec."""
+        with open(file_path, "rb") as f:
+            return self.extractor.analyze_stream(_Utf8Reader(f, encoding), "utf-8")
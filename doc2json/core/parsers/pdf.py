@@ -1,9 +1,20 @@
 """PDF document parser with OCR fallback for scanned documents."""
 
+import hashlib
+import importlib.util
 import logging
 import os
 import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
+from typing import Iterator, Optional, Sequence
 
 import pdfplumber
 import pdf2image
@@ -17,8 +28,98 @@ logger = logging.getLogger(__name__)
 # Below this threshold, we assume it's a scanned/image PDF
 MIN_CHARS_PER_PAGE = 50
 
+# Render resolution for OCR - good quality for Tesseract
+OCR_DPI = 300
 
-@dataclass
+# OCR results remembered per parser, keyed by rendered page content
+OCR_CACHE_SIZE = 256
+
+# analyze() results remembered per parser, keyed by file identity
+ANALYSIS_CACHE_SIZE = 128
+
+# Text extraction backends. "auto" prefers PyMuPDF (much faster, C-based)
+# when it is installed and falls back to pdfplumber otherwise.
+PDF_BACKENDS = ("auto", "pymupdf", "pdfplumber")
+
+
+def _pymupdf_available() -> bool:
+    return importlib.util.find_spec("fitz") is not None
+
+
+@lru_cache(maxsize=1)
+def _which_tesseract() -> Optional[str]:
+    # PATH lookups stat every directory, so do it once per process
+    return shutil.which("tesseract")
+
+
+def _ocr_batch(image_paths: list[str], lang: str) -> list[str]:
+    """OCR several page images with a single Tesseract process.
+
+    Tesseract reads the images from a file list and writes all of their text
+    to one file, ending each page with a form feed.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        filelist = os.path.join(tmp, "pages.txt")
+        with open(filelist, "w", encoding="utf-8") as f:
+            f.write("\n".join(image_paths) + "\n")
+
+        outbase = os.path.join(tmp, "out")
+        subprocess.run(
+            [pytesseract.pytesseract.tesseract_cmd, filelist, outbase, "-l", lang],
+            check=True,
+            capture_output=True,
+        )
+        with open(outbase + ".txt", encoding="utf-8") as f:
+            texts = f.read().split("\x0c")
+
+    # Every page ends with a form feed, leaving an empty piece after the last
+    if texts and not texts[-1].strip():
+        texts.pop()
+    if len(texts) != len(image_paths):
+        raise RuntimeError(
+            f"Tesseract returned {len(texts)} pages for {len(image_paths)} images"
+        )
+    return [text.strip() for text in texts]
+
+
+def _scale_counts(counts: Sequence[int], sampled: int, total: int) -> list[int]:
+    """Scale counts that sum to sampled so they sum to total.
+
+    Uses largest-remainder rounding: results are never negative, add up
+    exactly, and a count of zero stays zero.
+    """
+    quotas = [count * total / sampled for count in counts]
+    scaled = [int(q) for q in quotas]
+    by_remainder = sorted(range(len(counts)), key=lambda i: quotas[i] - scaled[i], reverse=True)
+    for i in by_remainder[: total - sum(scaled)]:
+        scaled[i] += 1
+    return scaled
+
+
+def _page_runs(page_nums: list[int], max_len: int) -> Iterator[list[int]]:
+    """Group sorted page numbers into consecutive runs of at most max_len."""
+    run: list[int] = []
+    for page_num in page_nums:
+        if run and (page_num != run[-1] + 1 or len(run) >= max_len):
+            yield run
+            run = []
+        run.append(page_num)
+    if run:
+        yield run
+
+
+def _import_fitz():
+    try:
+        import fitz
+    except ImportError:
+        raise ImportError(
+            "The pymupdf PDF backend requires PyMuPDF.\n"
+            "Install with: pip install doc2json[pymupdf]"
+        )
+    return fitz
+
+
+@dataclass(frozen=True, slots=True)
 class PDFPageResult:
     """Result of parsing a single PDF page."""
     page_num: int
@@ -26,23 +127,80 @@ class PDFPageResult:
     used_ocr: bool
 
 
+# Keys exposed by PDFAnalysis as a mapping, in the old dict result's order
+ANALYSIS_KEYS = (
+    "total_pages",
+    "sampled_pages",
+    "text_pages",
+    "image_pages",
+    "blank_pages",
+    "total_characters",
+    "avg_chars_per_page",
+    "likely_scanned",
+    "ocr_recommended",
+)
+
+
+# eq=False keeps Mapping.__eq__, so an analysis still equals the old dict
+@dataclass(frozen=True, slots=True, eq=False)
+class PDFAnalysis(Mapping):
+    """Page and character tallies returned by PDFParser.analyze().
+
+    Also a read-only mapping over the fields and derived values, so callers
+    written against the old dict result (analysis["key"], .get(), in, ==,
+    dict(analysis), json.dumps(dict(analysis))) keep working.
+    """
+    total_pages: int
+    sampled_pages: int
+    text_pages: int
+    image_pages: int
+    blank_pages: int
+    total_characters: int
+
+    @property
+    def avg_chars_per_page(self) -> float:
+        return self.total_characters / self.total_pages if self.total_pages > 0 else 0
+
+    @property
+    def likely_scanned(self) -> bool:
+        return self.image_pages > self.text_pages
+
+    @property
+    def ocr_recommended(self) -> bool:
+        return self.image_pages > 0
+
+    def __getitem__(self, key: str):
+        if key not in ANALYSIS_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ANALYSIS_KEYS)
+
+    def __len__(self) -> int:
+        return len(ANALYSIS_KEYS)
+
+
 class PDFParser:
     """Parser for PDF files with automatic OCR fallback.
 
-    Attempts text extraction first using pdfplumber. If a page has
-    insufficient text (likely a scanned document), falls back to OCR
-    using pytesseract.
+    Attempts text extraction first, using PyMuPDF when installed and
+    pdfplumber otherwise. If a page has insufficient text (likely a scanned
+    document), falls back to OCR using pytesseract.
 
     For OCR: Requires Tesseract installed on the system
     """
 
-    SUPPORTED_EXTENSIONS = {".pdf"}
+    SUPPORTED_EXTENSIONS = frozenset({".pdf"})
 
     def __init__(
         self,
         min_chars_per_page: int = MIN_CHARS_PER_PAGE,
         ocr_enabled: bool = True,
         ocr_language: str = "eng",
+        backend: str = "auto",
+        workers: int = 1,
+        ocr_chunk_size: int = 10,
     ):
         """Initialize PDF parser.
 
@@ -50,10 +208,29 @@ class PDFParser:
             min_chars_per_page: Threshold below which OCR is attempted
             ocr_enabled: Whether to attempt OCR for image-based pages
             ocr_language: Tesseract language code (e.g., 'eng', 'fra', 'deu')
+            backend: Text extraction backend: 'pymupdf', 'pdfplumber', or
+                'auto' to use PyMuPDF when it is installed
+            workers: Processes used to parse pages in parallel (1 = in-process)
+            ocr_chunk_size: Scanned pages OCR'd per Tesseract run (and, with
+                pdfplumber, consecutive pages rendered per poppler call)
         """
+        if backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Unknown PDF backend '{backend}'. Valid options: {', '.join(PDF_BACKENDS)}"
+            )
+        if backend == "auto":
+            backend = "pymupdf" if _pymupdf_available() else "pdfplumber"
+
         self.min_chars_per_page = min_chars_per_page
         self.ocr_enabled = ocr_enabled
         self.ocr_language = ocr_language
+        self.backend = backend
+        self.workers = workers
+        self.ocr_chunk_size = max(1, ocr_chunk_size)
+        # sha256 of rendered page + language -> OCR text (LRU order)
+        self._ocr_cache: OrderedDict[str, str] = OrderedDict()
+        # (path, mtime_ns, size, settings) -> analyze() result (LRU order)
+        self._analysis_cache: OrderedDict[tuple, PDFAnalysis] = OrderedDict()
 
     def can_parse(self, file_path: str) -> bool:
         """Check if this is a PDF file."""
@@ -62,7 +239,7 @@ class PDFParser:
 
     def _check_tesseract(self):
         """Check if Tesseract is installed on the system."""
-        if shutil.which("tesseract") is None:
+        if _which_tesseract() is None:
             raise ParserError(
                 "Tesseract OCR is not installed on your system. "
                 "Install it with:\n"
@@ -71,45 +248,177 @@ class PDFParser:
                 "  Windows: Download from https://github.com/UB-Mannheim/tesseract/wiki"
             )
 
+    @contextmanager
+    def _open_pages(self, file_path: str) -> Iterator[Sequence]:
+        """Open a PDF with the configured backend and yield its pages."""
+        if self.backend == "pymupdf":
+            fitz = _import_fitz()
+            with fitz.open(file_path) as doc:
+                yield doc  # A PyMuPDF Document is a sequence of pages
+        else:
+            with pdfplumber.open(file_path) as pdf:
+                yield pdf.pages
+
     def _extract_text_from_page(self, page) -> str:
-        """Extract text from a pdfplumber page object."""
-        text = page.extract_text() or ""
+        """Extract text from a pdfplumber or PyMuPDF page object."""
+        if self.backend == "pymupdf":
+            text = page.get_text("text")
+        else:
+            text = page.extract_text() or ""
         return text.strip()
 
+    def _has_images(self, page) -> bool:
+        """Check whether a page embeds any raster images worth OCR'ing."""
+        if self.backend == "pymupdf":
+            # get_images() only lists XObject images; get_image_info() also
+            # covers inline (BI ... ID ... EI) images in the content stream.
+            # pdfminer reports both kinds in pdfplumber's page.images.
+            return bool(page.get_images() or page.get_image_info())
+        return bool(page.images)
+
+    def _release_page(self, page) -> None:
+        """Drop a page's parsed layout objects once its text has been taken.
+
+        pdfplumber keeps every page's layout cached on the open document, so
+        without this memory grows with page count. PyMuPDF pages hold nothing
+        once unreferenced.
+        """
+        if self.backend == "pdfplumber":
+            page.close()
+
+    def _ocr_cache_key(self, image) -> str:
+        """Identify a rendered page by its pixels and the OCR language."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.ocr_language}\0{image.mode}\0{image.size}\0".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def _cached_ocr(self, key: str) -> Optional[str]:
+        cached = self._ocr_cache.get(key)
+        if cached is not None:
+            self._ocr_cache.move_to_end(key)
+        return cached
+
+    def _remember_ocr(self, key: str, text: str) -> None:
+        self._ocr_cache[key] = text
+        if len(self._ocr_cache) > OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+
     def _ocr_page_image(self, image) -> str:
-        """Run OCR on a PIL Image."""
+        """Run OCR on a PIL Image, reusing the result for identical pages."""
+        key = self._ocr_cache_key(image)
+        cached = self._cached_ocr(key)
+        if cached is not None:
+            return cached
+
         try:
-            text = pytesseract.image_to_string(image, lang=self.ocr_language)
-            return text.strip()
+            text = pytesseract.image_to_string(image, lang=self.ocr_language).strip()
         except Exception as e:
             logger.warning(f"OCR failed: {e}")
-            return ""
-
-    def _convert_page_to_image(self, pdf_path: str, page_num: int):
+            return ""  # Not cached, so a transient failure is retried
+
+        self._remember_ocr(key, text)
+        return text
+
+    def _ocr_image_files(self, paths: list[str]) -> list[str]:
+        """OCR rendered page files, sending all cache misses to one Tesseract run."""
+        from PIL import Image
+
+        texts = [""] * len(paths)
+        keys: dict[int, str] = {}
+        for i, path in enumerate(paths):
+            try:
+                with Image.open(path) as image:
+                    key = self._ocr_cache_key(image)
+            except Exception as e:
+                logger.warning(f"OCR failed for {os.path.basename(path)}: {e}")
+                continue  # Left empty, so the page keeps its extracted text
+            cached = self._cached_ocr(key)
+            if cached is not None:
+                texts[i] = cached
+            else:
+                keys[i] = key
+
+        if len(keys) == 1:
+            (i,) = keys
+            try:
+                with Image.open(paths[i]) as image:
+                    texts[i] = self._ocr_page_image(image)
+            except Exception as e:
+                logger.warning(f"OCR failed for {os.path.basename(paths[i])}: {e}")
+        elif keys:
+            try:
+                batch = _ocr_batch([paths[i] for i in keys], self.ocr_language)
+            except Exception as e:
+                logger.warning(f"OCR failed: {e}")
+                return texts  # Misses stay uncached so they are retried
+            for (i, key), text in zip(keys.items(), batch):
+                texts[i] = text
+                self._remember_ocr(key, text)
+        return texts
+
+    def _convert_page_to_image(self, pdf_path: str, page_num: int, page=None):
         """Convert a single PDF page to an image.
 
+        With the PyMuPDF backend the already-open page is rendered in-process;
+        otherwise pdf2image (poppler) renders it from the file.
+
         Args:
             pdf_path: Path to the PDF file
             page_num: 0-indexed page number
+            page: Open page object, if available
 
         Returns:
             PIL Image of the page
         """
+        if self.backend == "pymupdf" and page is not None:
+            from PIL import Image
+
+            pix = page.get_pixmap(dpi=OCR_DPI)  # RGB, no alpha
+            return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
         # pdf2image uses 1-indexed pages
         images = pdf2image.convert_from_path(
             pdf_path,
             first_page=page_num + 1,
             last_page=page_num + 1,
-            dpi=300,  # Good quality for OCR
+            dpi=OCR_DPI,
         )
         return images[0] if images else None
 
+    def _needs_ocr(self, page, text: str, page_num: int) -> bool:
+        """Decide whether a page's extracted text should be replaced by OCR."""
+        # Check if we got enough text
+        if len(text) >= self.min_chars_per_page:
+            return False
+
+        # Not enough text and no images - a blank page, nothing to OCR
+        if not self._has_images(page):
+            return False
+
+        # Not enough text but images present - this might be a scanned page
+        if not self.ocr_enabled:
+            logger.warning(
+                f"Page {page_num + 1} has little text ({len(text)} chars) "
+                f"but OCR is disabled"
+            )
+            return False
+        return True
+
+    def _ocr_result(self, page_num: int, text: str, image) -> PDFPageResult:
+        """OCR a rendered page, keeping the extracted text if OCR finds nothing."""
+        if image:
+            ocr_text = self._ocr_page_image(image)
+            if ocr_text:
+                return PDFPageResult(page_num=page_num, text=ocr_text, used_ocr=True)
+        return PDFPageResult(page_num=page_num, text=text, used_ocr=False)
+
     def parse_page(self, pdf_path: str, page, page_num: int) -> PDFPageResult:
         """Parse a single page, using OCR if needed.
 
         Args:
             pdf_path: Path to the PDF file (needed for OCR)
-            page: pdfplumber page object
+            page: pdfplumber or PyMuPDF page object
             page_num: 0-indexed page number
 
         Returns:
@@ -117,28 +426,15 @@ class PDFParser:
         """
         # Try text extraction first
         text = self._extract_text_from_page(page)
-
-        # Check if we got enough text
-        if len(text) >= self.min_chars_per_page:
-            return PDFPageResult(page_num=page_num, text=text, used_ocr=False)
-
-        # Not enough text - this might be a scanned page
-        if not self.ocr_enabled:
-            logger.warning(
-                f"Page {page_num + 1} has little text ({len(text)} chars) "
-                f"but OCR is disabled"
-            )
+        if not self._needs_ocr(page, text, page_num):
             return PDFPageResult(page_num=page_num, text=text, used_ocr=False)
 
         # Attempt OCR
         logger.info(f"Page {page_num + 1} appears to be scanned, attempting OCR...")
         try:
             self._check_tesseract()
-            image = self._convert_page_to_image(pdf_path, page_num)
-            if image:
-                ocr_text = self._ocr_page_image(image)
-                if ocr_text:
-                    return PDFPageResult(page_num=page_num, text=ocr_text, used_ocr=True)
+            image = self._convert_page_to_image(pdf_path, page_num, page)
+            return self._ocr_result(page_num, text, image)
         except ParserError:
             raise
         except Exception as e:
@@ -147,6 +443,40 @@ class PDFParser:
         # Return whatever we got from text extraction
         return PDFPageResult(page_num=page_num, text=text, used_ocr=False)
 
+    def _render_pages(
+        self, pdf_path: str, page_nums: list[int]
+    ) -> Iterator[tuple[list[int], list[str]]]:
+        """Render pages for OCR with poppler, ocr_chunk_size pages per call.
+
+        Each call writes its images to a temporary directory, so memory never
+        holds a whole chunk of page images. Yields (page_nums, image_paths)
+        per chunk; the files are removed once the caller moves on.
+        """
+        for run in _page_runs(page_nums, self.ocr_chunk_size):
+            first, last = run[0], run[-1]
+            with tempfile.TemporaryDirectory() as tmp:
+                try:
+                    # pdf2image uses 1-indexed pages
+                    paths = pdf2image.convert_from_path(
+                        pdf_path,
+                        first_page=first + 1,
+                        last_page=last + 1,
+                        dpi=OCR_DPI,
+                        output_folder=tmp,
+                        paths_only=True,
+                    )
+                except Exception as e:
+                    logger.warning(f"OCR failed for pages {first + 1}-{last + 1}: {e}")
+                    continue
+                if len(paths) != len(run):
+                    # Pairing images with pages by position would misplace text
+                    logger.warning(
+                        f"OCR failed for pages {first + 1}-{last + 1}: "
+                        f"rendered {len(paths)} images for {len(run)} pages"
+                    )
+                    continue
+                yield run, paths
+
     def parse(self, file_path: str) -> str:
         """Parse a PDF file and extract text from all pages.
 
@@ -163,64 +493,189 @@ class PDFParser:
             raise FileNotFoundError(f"PDF file not found: {file_path}")
 
         try:
-            with pdfplumber.open(file_path) as pdf:
-                results: list[PDFPageResult] = []
-                ocr_pages = 0
-
-                for page_num, page in enumerate(pdf.pages):
-                    result = self.parse_page(file_path, page, page_num)
-                    results.append(result)
-                    if result.used_ocr:
-                        ocr_pages += 1
-
-                # Log summary
-                total_pages = len(results)
-                if ocr_pages > 0:
-                    logger.info(
-                        f"Parsed {total_pages} pages "
-                        f"({ocr_pages} required OCR)"
-                    )
-
-                # Combine all page texts
-                texts = [r.text for r in results if r.text]
-                return "\n\n".join(texts)
-
+            if self.workers > 1:
+                results = self._parse_parallel(file_path)
+            else:
+                results = self._parse_range(file_path, 0, None)
         except Exception as e:
-            if "pdfplumber" in str(type(e).__module__):
+            module = str(type(e).__module__)
+            if "pdfplumber" in module or module.startswith(("fitz", "pymupdf")):
                 raise ParserError(f"Failed to parse PDF: {e}")
             raise
 
+        # Log summary
+        ocr_pages = sum(1 for r in results if r.used_ocr)
+        if ocr_pages > 0:
+            logger.info(
+                f"Parsed {len(results)} pages "
+                f"({ocr_pages} required OCR)"
+            )
+
+        # Combine all page texts
+        return "\n\n".join(r.text for r in results if r.text)
+
+    def _parse_range(
+        self, file_path: str, start: int, stop: Optional[int]
+    ) -> list[PDFPageResult]:
+        """Parse pages [start, stop) of a PDF (stop=None for the rest).
+
+        Scanned pages are OCR'd after the text pass, ocr_chunk_size pages
+        per Tesseract process. PyMuPDF renders each one from the open page
+        into a temporary PNG as it goes; with pdfplumber they are rendered
+        afterwards by poppler, one call per run of pages.
+        """
+        deferred: list[int] = []
+        rendered: dict[int, str] = {}  # PyMuPDF renders awaiting OCR
+        pymupdf = self.backend == "pymupdf"
+        with tempfile.TemporaryDirectory() if pymupdf else nullcontext() as render_dir:
+            with self._open_pages(file_path) as pages:
+                if stop is None:
+                    stop = len(pages)
+                results = []
+                for page_num in range(start, stop):
+                    page = pages[page_num]
+                    text = self._extract_text_from_page(page)
+                    results.append(PDFPageResult(page_num=page_num, text=text, used_ocr=False))
+                    if self._needs_ocr(page, text, page_num):
+                        if not deferred:
+                            self._check_tesseract()
+                        deferred.append(page_num)
+                        if pymupdf:
+                            path = self._save_page_render(page, page_num, render_dir)
+                            if path is not None:
+                                rendered[page_num] = path
+                    self._release_page(page)
+
+            if deferred:
+                logger.info(f"{len(deferred)} page(s) appear to be scanned, attempting OCR...")
+                if pymupdf:
+                    chunks = self._rendered_chunks(rendered)
+                else:
+                    chunks = self._render_pages(file_path, deferred)
+                for run, paths in chunks:
+                    try:
+                        ocr_texts = self._ocr_image_files(paths)
+                    except Exception as e:
+                        # Keep the extracted text for this chunk and carry on
+                        logger.warning(f"OCR failed for pages {run[0] + 1}-{run[-1] + 1}: {e}")
+                        continue
+                    for page_num, ocr_text in zip(run, ocr_texts):
+                        if ocr_text:
+                            results[page_num - start] = PDFPageResult(
+                                page_num=page_num, text=ocr_text, used_ocr=True
+                            )
+        return results
+
+    def _save_page_render(self, page, page_num: int, folder: str) -> Optional[str]:
+        """Render an open PyMuPDF page to a PNG for batch OCR (None if that fails)."""
+        path = os.path.join(folder, f"page-{page_num + 1:05d}.png")
+        try:
+            page.get_pixmap(dpi=OCR_DPI).save(path)
+        except Exception as e:
+            logger.warning(f"OCR failed for page {page_num + 1}: {e}")
+            return None
+        return path
+
+    def _rendered_chunks(
+        self, rendered: dict[int, str]
+    ) -> Iterator[tuple[list[int], list[str]]]:
+        """Group saved page renders into (page_nums, image_paths) chunks of ocr_chunk_size."""
+        page_nums = list(rendered)
+        for i in range(0, len(page_nums), self.ocr_chunk_size):
+            run = page_nums[i:i + self.ocr_chunk_size]
+            yield run, [rendered[page_num] for page_num in run]
+
+    def _parse_parallel(self, file_path: str) -> list[PDFPageResult]:
+        """Split the pages into one contiguous range per worker process.
+
+        Each worker opens the PDF itself, so only paths and page texts cross
+        process boundaries. Results come back in page order.
+        """
+        page_count = self.get_page_count(file_path)
+        workers = min(self.workers, page_count)
+        if workers <= 1:
+            return self._parse_range(file_path, 0, page_count)
+
+        step = -(-page_count // workers)  # Ceiling division
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+
+        with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+            chunks = pool.map(self._parse_range, repeat(file_path), starts, stops)
+            return [result for chunk in chunks for result in chunk]
+
     def get_page_count(self, file_path: str) -> int:
         """Get the number of pages in a PDF."""
-        with pdfplumber.open(file_path) as pdf:
-            return len(pdf.pages)
+        with self._open_pages(file_path) as pages:
+            return len(pages)
 
-    def analyze(self, file_path: str) -> dict:
+    def analyze(self, file_path: str, sample_pages: Optional[int] = None) -> PDFAnalysis:
         """Analyze a PDF and return metadata about its content.
 
         Useful for understanding if a PDF is text-based or image-based
-        before running full extraction.
+        before running full extraction. Results are cached until the file's
+        modification time or size changes.
+
+        Args:
+            file_path: Path to the PDF file
+            sample_pages: Only read this many leading pages and extrapolate
+                the page and character tallies to the whole document
+                (None reads every page). total_pages is always exact.
         """
-        with pdfplumber.open(file_path) as pdf:
-            total_pages = len(pdf.pages)
+        try:
+            st = os.stat(file_path)
+            key = (
+                file_path, st.st_mtime_ns, st.st_size,
+                self.backend, self.min_chars_per_page, sample_pages,
+            )
+        except OSError:
+            key = None  # Let the backend report the missing/unreadable file
+
+        if key is not None and key in self._analysis_cache:
+            self._analysis_cache.move_to_end(key)
+            return self._analysis_cache[key]
+
+        analysis = self._analyze_pages(file_path, sample_pages)
+
+        if key is not None:
+            self._analysis_cache[key] = analysis
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return analysis
+
+    def _analyze_pages(self, file_path: str, sample_pages: Optional[int]) -> PDFAnalysis:
+        """Compute analyze() statistics from the first sample_pages pages (or all)."""
+        with self._open_pages(file_path) as pages:
+            total_pages = len(pages)
+            sampled = total_pages if sample_pages is None else min(sample_pages, total_pages)
             text_pages = 0
             image_pages = 0
+            blank_pages = 0
             total_chars = 0
 
-            for page in pdf.pages:
+            for page_num in range(sampled):
+                page = pages[page_num]
                 text = self._extract_text_from_page(page)
                 total_chars += len(text)
                 if len(text) >= self.min_chars_per_page:
                     text_pages += 1
+                elif self._has_images(page):
+                    image_pages += 1  # Little text over an image: scanned
                 else:
-                    image_pages += 1
-
-            return {
-                "total_pages": total_pages,
-                "text_pages": text_pages,
-                "image_pages": image_pages,
-                "total_characters": total_chars,
-                "avg_chars_per_page": total_chars / total_pages if total_pages > 0 else 0,
-                "likely_scanned": image_pages > text_pages,
-                "ocr_recommended": image_pages > 0,
-            }
+                    blank_pages += 1  # Nothing to OCR
+                self._release_page(page)
+
+        if 0 < sampled < total_pages:
+            text_pages, image_pages, blank_pages = _scale_counts(
+                (text_pages, image_pages, blank_pages), sampled, total_pages
+            )
+            total_chars = round(total_chars * total_pages / sampled)
+
+        return PDFAnalysis(
+            total_pages=total_pages,
+            sampled_pages=sampled,
+            text_pages=text_pages,
+            image_pages=image_pages,
+            blank_pages=blank_pages,
+            total_characters=total_chars,
+        )
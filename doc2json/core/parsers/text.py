@@ -1,17 +1,30 @@
 import os
+from typing import Optional
 
 
 class TextParser:
-    """Parser for plain text files."""
+    """Parser for plain text files.
 
-    SUPPORTED_EXTENSIONS = {".txt", ".text", ".md", ".markdown"}
+    Stateless, so the single instance in the global registry is shared by
+    every parse_document() call.
+    """
+
+    __slots__ = ()
+
+    SUPPORTED_EXTENSIONS = frozenset({".txt", ".text", ".md", ".markdown"})
 
     def can_parse(self, file_path: str) -> bool:
         """Check if this is a plain text file."""
         _, ext = os.path.splitext(file_path)
         return ext.lower() in self.SUPPORTED_EXTENSIONS
 
-    def parse(self, file_path: str) -> str:
-        """Read and return the text content."""
+    def parse(self, file_path: str, *, max_chars: Optional[int] = None) -> str:
+        """Read and return the text content.
+
+        Args:
+            file_path: Path to the text file
+            max_chars: Stop after this many characters instead of reading the
+                whole file (None reads everything)
+        """
         with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+            return f.read(max_chars)
@@ -1,10 +1,16 @@
 """Schema analysis utilities for dry-run and validation."""
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Type, get_args, get_origin, Any, Union
+from types import UnionType
+from functools import lru_cache
+from typing import Iterator, Type, get_args, get_origin, Any, Union
 from pydantic import BaseModel
 
+# Optional[X] / Union[X, Y] and the PEP 604 spelling X | None
+_UNION_TYPES = (Union, UnionType)
+
 
 @dataclass
 class EnumInfo:
@@ -97,7 +103,7 @@ def _estimate_field_tokens(type_hint: Any, field_name: str, seen: set[Type]) ->
     origin = get_origin(type_hint)
 
     # Handle Optional[X] - estimate for the inner type
-    if origin is Union:
+    if origin in _UNION_TYPES:
         args = [a for a in get_args(type_hint) if a is not type(None)]
         if args:
             return _estimate_field_tokens(args[0], field_name, seen)
@@ -145,10 +151,33 @@ def _estimate_field_tokens(type_hint: Any, field_name: str, seen: set[Type]) ->
     return TOKENS_PER_STRING
 
 
+def _unwrap_annotation(type_hint: Any) -> Iterator[Any]:
+    """Yield the types inside Optional, Union, list, set, tuple and dict hints."""
+    stack = [type_hint]
+    while stack:
+        type_hint = stack.pop()
+        if type_hint is None:
+            continue
+
+        origin = get_origin(type_hint)
+        if origin in _UNION_TYPES:
+            # Optional[X] is Union[X, None]
+            stack.extend(reversed([a for a in get_args(type_hint) if a is not type(None)]))
+        elif origin in (list, set, frozenset, tuple):
+            stack.extend(reversed(get_args(type_hint)))
+        elif origin is dict:
+            args = get_args(type_hint)
+            if len(args) >= 2:
+                stack.append(args[1])  # Value type
+        else:
+            yield type_hint
+
+
 def analyze_schema(schema: Type[BaseModel], name: str = None) -> SchemaAnalysis:
     """Analyze a Pydantic schema for fields, nested models, and enums.
 
-    Recursively traverses nested models to find all enums.
+    Recursively traverses nested models to find all enums. Results are
+    cached per class and shared between callers - don't mutate them.
 
     Args:
         schema: Pydantic BaseModel class to analyze
@@ -157,11 +186,17 @@ def analyze_schema(schema: Type[BaseModel], name: str = None) -> SchemaAnalysis:
     Returns:
         SchemaAnalysis with field counts, nested models, and enum info
     """
-    if name is None:
-        name = schema.__name__
+    analysis = _analyze_cached(schema)
+    if name is not None and name != analysis.name:
+        return replace(analysis, name=name)
+    return analysis
+
+
+@lru_cache(maxsize=256)
+def _analyze_cached(schema: Type[BaseModel]) -> SchemaAnalysis:
+    """Analyze a schema under its class name, once per class."""
+    name = schema.__name__
 
-    # Track what we've seen to avoid infinite recursion
-    seen_models: set[Type] = set()
     nested_models: list[str] = []
     enums: list[EnumInfo] = []
 
@@ -174,56 +209,28 @@ def analyze_schema(schema: Type[BaseModel], name: str = None) -> SchemaAnalysis:
     # Estimate output tokens
     estimated_tokens = estimate_output_tokens(schema)
 
-    def process_type(type_hint: Any) -> None:
-        """Recursively process a type hint to find nested models and enums."""
-        if type_hint is None:
-            return
-
-        # Handle Optional, Union, list, etc.
-        origin = get_origin(type_hint)
-        if origin is Union:
-            # Optional[X] is Union[X, None]
-            for arg in get_args(type_hint):
-                if arg is not type(None):
-                    process_type(arg)
-            return
-
-        if origin in (list, set, frozenset, tuple):
-            for arg in get_args(type_hint):
-                process_type(arg)
-            return
-
-        if origin is dict:
-            args = get_args(type_hint)
-            if len(args) >= 2:
-                process_type(args[1])  # Process value type
-            return
-
-        # Check if it's an enum
-        if isinstance(type_hint, type) and issubclass(type_hint, Enum):
-            if type_hint not in seen_models:
-                seen_models.add(type_hint)
-                enum_values = [e.value for e in type_hint]
-                enums.append(EnumInfo(
-                    name=type_hint.__name__,
-                    value_count=len(enum_values),
-                    values=enum_values,
-                ))
-            return
-
-        # Check if it's a nested Pydantic model
-        if isinstance(type_hint, type) and issubclass(type_hint, BaseModel):
-            if type_hint not in seen_models and type_hint != schema:
-                seen_models.add(type_hint)
-                nested_models.append(type_hint.__name__)
-                # Recurse into nested model's fields
-                for nested_field in type_hint.model_fields.values():
-                    process_type(nested_field.annotation)
-            return
-
-    # Process all fields in the schema
-    for field_info in model_fields.values():
-        process_type(field_info.annotation)
+    # Walk nested models breadth-first; seen stops cycles and duplicates
+    seen: set[Type] = {schema}
+    queue: deque[Type[BaseModel]] = deque([schema])
+    while queue:
+        model = queue.popleft()
+        for field_info in model.model_fields.values():
+            for type_hint in _unwrap_annotation(field_info.annotation):
+                if not isinstance(type_hint, type) or type_hint in seen:
+                    continue
+
+                if issubclass(type_hint, Enum):
+                    seen.add(type_hint)
+                    enum_values = [e.value for e in type_hint]
+                    enums.append(EnumInfo(
+                        name=type_hint.__name__,
+                        value_count=len(enum_values),
+                        values=enum_values,
+                    ))
+                elif issubclass(type_hint, BaseModel):
+                    seen.add(type_hint)
+                    nested_models.append(type_hint.__name__)
+                    queue.append(type_hint)
 
     return SchemaAnalysis(
         name=name,
@@ -175,12 +175,26 @@ Generate a complete Python file. Return ONLY the code, no explanation or markdow
     if provider == "anthropic":
         from anthropic import Anthropic
         client = Anthropic(api_key=api_key, base_url=base_url)
-        response = client.messages.create(
+        # Stream so we can hang up once the code block closes, rather than
+        # paying for any commentary the model adds after it
+        code = ""
+        opener = -1  # Index of the opening ``` once seen
+        with client.messages.stream(
             model=model,
             max_tokens=4096,
             messages=[{"role": "user", "content": prompt}],
-        )
-        code = response.content[0].text
+        ) as stream:
+            for text in stream.text_stream:
+                # Search only the new text (plus two characters, in case a
+                # fence straddles chunks) so the response is scanned once
+                start = max(len(code) - 2, opener + 3 if opener != -1 else 0)
+                code += text
+                fence = code.find("```", start)
+                if fence != -1 and opener == -1:
+                    opener = fence
+                    fence = code.find("```", opener + 3)
+                if fence != -1:
+                    break
     elif provider == "openai":
         from openai import OpenAI
         client = OpenAI(api_key=api_key, base_url=base_url)
@@ -0,0 +1,64 @@
+"""JSON encoding shared by every output writer."""
+
+import json
+import math
+from datetime import date, datetime, time
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: pip install doc2json[fast-json] for faster encoding
+
+
+def _default(obj: Any) -> Any:
+    """Encode the non-JSON types that can appear in records and metadata."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _finite(obj: Any) -> Any:
+    """Copy obj with NaN and Infinity replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def dumps(obj: Any) -> str:
+    """Encode a record as a single compact JSON line.
+
+    Uses orjson when it is installed and the stdlib otherwise, configured
+    to agree: compact separators, non-ASCII left unescaped, dates and times
+    via isoformat(), non-str keys turned into strings, and NaN/Infinity
+    (not valid JSON) written as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits - let the stdlib handle them
+
+    try:
+        return _stdlib_dumps(obj)
+    except ValueError:
+        # Out-of-range floats; rare, so only then pay for a cleaned copy
+        return _stdlib_dumps(_finite(obj))
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(
+        obj,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_default,
+        allow_nan=False,
+    )
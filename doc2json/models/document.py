@@ -1,6 +1,6 @@
 """Document metadata and size information."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -8,31 +8,36 @@ from typing import Optional
 LARGE_DOC_CHARS = 30_000  # ~7.5k tokens
 LARGE_DOC_PAGES = 20
 MAX_CHARS_DEFAULT = 100_000  # ~25k tokens - default limit for extraction
+CHUNK_OVERLAP_DEFAULT = 2_000  # Context carried between chunks (chunk strategy)
 
+# Rough chars-per-token ratio for English text, used for all token estimates
+CHARS_PER_TOKEN = 4
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DocumentInfo:
     """Metadata about a parsed document.
 
-    Used to determine extraction strategy for large documents.
+    Used to determine extraction strategy for large documents. Instances are
+    immutable, so the size classification is computed once at construction.
     """
     file_path: str
     char_count: int
     page_count: Optional[int] = None  # None for non-paginated formats (txt, html)
+    is_large: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def estimated_tokens(self) -> int:
-        """Rough token estimate (chars / 4)."""
-        return self.char_count // 4
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "is_large",
+            self.char_count > LARGE_DOC_CHARS
+            or (self.page_count or 0) > LARGE_DOC_PAGES,
+        )
 
     @property
-    def is_large(self) -> bool:
-        """Check if document exceeds 'large' thresholds."""
-        if self.char_count > LARGE_DOC_CHARS:
-            return True
-        if self.page_count and self.page_count > LARGE_DOC_PAGES:
-            return True
-        return False
+    def estimated_tokens(self) -> int:
+        """Rough token estimate (chars / CHARS_PER_TOKEN)."""
+        return self.char_count // CHARS_PER_TOKEN
 
     def exceeds_limit(self, max_chars: int) -> bool:
         """Check if document exceeds a specific character limit."""
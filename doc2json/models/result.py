@@ -65,21 +65,24 @@ class ExtractionResult(BaseModel):
         default=None,
         description="Original character count if document was truncated"
     )
+    assessment_partial: bool = Field(
+        default=False,
+        description="Whether the assessment saw only the first chunk of a chunked document"
+    )
 
     def to_output_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSONL output."""
-        result = {
+        meta = {
             "_source_file": self.source_file,
             "_schema": self.schema_name,
             "_schema_version": self.schema_version,
         }
 
         if self.error:
-            result["_error"] = self.error
-            return result
+            return {**meta, "_error": self.error}
 
-        # Add extracted data
-        result.update(self.data)
+        # Metadata and extracted data in one dict build, sized once
+        result = {**meta, **self.data}
 
         # Add truncation warning if applicable
         if self.truncated:
@@ -88,11 +91,9 @@ class ExtractionResult(BaseModel):
 
         # Add assessment if present
         if self.assessment:
-            result["_assessment"] = {
-                "review_status": self.assessment.review_status.value,
-                "ambiguous_fields": self.assessment.ambiguous_fields,
-                "review_notes": self.assessment.review_notes,
-                "schema_suggestions": [s.model_dump() for s in self.assessment.schema_suggestions],
-            }
+            # One pydantic-core serialization pass; mode="json" turns the enum into its value
+            result["_assessment"] = self.assessment.model_dump(mode="json")
+            if self.assessment_partial:
+                result["_assessment_partial"] = True
 
         return result
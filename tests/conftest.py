@@ -4,6 +4,7 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
 
 @pytest.fixture
@@ -13,7 +14,7 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_schema_code():
     """Return valid Pydantic schema code for testing."""
     return '''__version__ = "1"
@@ -76,3 +77,16 @@ Amount Due: $1,250.00
 Services rendered for consulting work.
 """)
     return text_file
+
+
+@pytest.fixture
+def make_completion():
+    """Factory for fake LLM completions carrying token usage.
+
+    Pass Anthropic-style (input_tokens/output_tokens) or OpenAI-style
+    (prompt_tokens/completion_tokens) counts; unset fields are absent,
+    just like on the real response objects.
+    """
+    def _make(**usage):
+        return SimpleNamespace(usage=SimpleNamespace(**usage))
+    return _make
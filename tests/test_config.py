@@ -71,6 +71,21 @@ class TestLoadConfig:
         assert config.schemas[1].name == "contracts"
         assert config.schemas[1].assess is False
 
+    def test_load_llm_cache_dir(self, temp_dir):
+        """Test loading the extraction cache directory from the llm section."""
+        config_yaml = """schemas:
+  - invoices
+llm:
+  provider: anthropic
+  cache_dir: .doc2json-cache
+"""
+        config_file = temp_dir / "doc2json.yml"
+        config_file.write_text(config_yaml)
+
+        config = load_config(str(config_file))
+
+        assert config.llm.cache_dir == ".doc2json-cache"
+
     def test_load_mixed_format(self, temp_dir):
         """Test loading config with mixed simple and extended format."""
         config_yaml = """schemas:
@@ -281,6 +296,7 @@ destination:
 
         config = load_config(str(config_file))
 
+        assert isinstance(config.destination, DestinationConfig)
         assert config.destination.type == "custom"
         assert config.destination.config["api_endpoint"] == "https://api.example.com"
         assert config.destination.config["api_key"] == "secret123"
@@ -323,3 +339,83 @@ class TestLLMConfig:
         config = LLMConfig(provider="openai", model="gpt-4o")
         assert config.provider == "openai"
         assert config.model == "gpt-4o"
+
+
+class TestConfigImmutability:
+    """Tests for immutable schema configuration."""
+
+    def test_schemas_is_tuple(self, temp_dir):
+        """Test that parsed schemas are stored as a tuple."""
+        config_file = temp_dir / "doc2json.yml"
+        config_file.write_text("schemas:\n  - invoices\n  - contracts\n")
+
+        config = load_config(str(config_file))
+
+        assert isinstance(config.schemas, tuple)
+        assert config.schemas[1].name == "contracts"
+
+    def test_get_schema_first_duplicate_wins(self):
+        """Test that get_schema returns the first schema with a given name."""
+        first = SchemaConfig(name="invoices", assess=True)
+        config = Config(
+            schemas=[first, SchemaConfig(name="invoices"), SchemaConfig(name="contracts")],
+            llm=LLMConfig(),
+        )
+
+        assert config.get_schema("invoices") is first
+        assert config.get_schema("contracts").name == "contracts"
+        assert config.get_schema("missing") is None
+
+    def test_schema_config_is_frozen_and_hashable(self):
+        """Test that SchemaConfig cannot be mutated and can be hashed."""
+        from dataclasses import FrozenInstanceError
+
+        config = SchemaConfig(
+            name="invoices",
+            destination=DestinationConfig(type="jsonl", config={"path": "out.jsonl"}),
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            config.name = "other"
+        assert hash(config) == hash(SchemaConfig(name="invoices"))
+
+
+class TestConfigCaching:
+    """Tests for reuse of parsed YAML between loads."""
+
+    def test_unchanged_file_parsed_once(self, temp_dir):
+        """Test that reloading an unchanged file skips YAML parsing."""
+        from unittest.mock import patch
+        import yaml
+
+        config_file = temp_dir / "doc2json.yml"
+        config_file.write_text("schemas:\n  - invoices\n")
+
+        with patch("doc2json.config.loader.yaml.load", wraps=yaml.load) as yaml_load:
+            first = load_config(str(config_file))
+            second = load_config(str(config_file))
+
+        assert yaml_load.call_count == 1
+        assert first.schemas == second.schemas
+        assert first is not second  # fresh Config objects each time
+
+    def test_modified_file_is_reparsed(self, temp_dir):
+        """Test that changing the file invalidates the cached parse."""
+        config_file = temp_dir / "doc2json.yml"
+        config_file.write_text("schemas:\n  - invoices\n")
+        assert load_config(str(config_file)).schemas[0].name == "invoices"
+
+        config_file.write_text("schemas:\n  - contracts\n  - receipts\n")
+
+        assert [s.name for s in load_config(str(config_file)).schemas] == ["contracts", "receipts"]
+
+    def test_env_vars_substituted_on_every_load(self, temp_dir, monkeypatch):
+        """Test that cached YAML still picks up current environment values."""
+        config_file = temp_dir / "doc2json.yml"
+        config_file.write_text("schemas:\n  - invoices\nllm:\n  model: ${D2J_TEST_MODEL}\n")
+
+        monkeypatch.setenv("D2J_TEST_MODEL", "model-a")
+        assert load_config(str(config_file)).llm.model == "model-a"
+
+        monkeypatch.setenv("D2J_TEST_MODEL", "model-b")
+        assert load_config(str(config_file)).llm.model == "model-b"
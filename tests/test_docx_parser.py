@@ -1,6 +1,7 @@
 """Tests for DOCX parser."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -160,18 +161,19 @@ class TestDOCXParserMetadata:
         """Test extracting document metadata."""
         parser = DOCXParser()
 
-        # Create mock properties
-        mock_props = Mock()
-        mock_props.title = "Test Document"
-        mock_props.author = "John Doe"
-        mock_props.subject = "Testing"
-        mock_props.keywords = "test, docx"
-        mock_props.created = None
-        mock_props.modified = None
-        mock_props.last_modified_by = "Jane Doe"
-
-        mock_doc = Mock()
-        mock_doc.core_properties = mock_props
+        # Plain namespaces: a misspelled attribute raises instead of
+        # silently returning a child Mock
+        mock_props = SimpleNamespace(
+            title="Test Document",
+            author="John Doe",
+            subject="Testing",
+            keywords="test, docx",
+            created=None,
+            modified=None,
+            last_modified_by="Jane Doe",
+        )
+
+        mock_doc = SimpleNamespace(core_properties=mock_props)
         mock_document.return_value = mock_doc
 
         metadata = parser.get_metadata("/fake/doc.docx")
@@ -191,27 +193,20 @@ class TestDOCXParserAnalyze:
         """Test analyzing document structure."""
         parser = DOCXParser()
 
-        # Create mock paragraphs
-        mock_para1 = Mock()
-        mock_para1.text = "First paragraph with some content"
-
-        mock_para2 = Mock()
-        mock_para2.text = ""  # Empty
+        # Create stand-in paragraphs
+        mock_para1 = SimpleNamespace(text="First paragraph with some content")
+        mock_para2 = SimpleNamespace(text="")  # Empty
+        mock_para3 = SimpleNamespace(text="Third paragraph")
 
-        mock_para3 = Mock()
-        mock_para3.text = "Third paragraph"
+        # Create stand-in table
+        mock_cell = SimpleNamespace(text="Cell content")
+        mock_row = SimpleNamespace(cells=[mock_cell])
+        mock_table = SimpleNamespace(rows=[mock_row])
 
-        # Create mock table
-        mock_cell = Mock()
-        mock_cell.text = "Cell content"
-        mock_row = Mock()
-        mock_row.cells = [mock_cell]
-        mock_table = Mock()
-        mock_table.rows = [mock_row]
-
-        mock_doc = Mock()
-        mock_doc.paragraphs = [mock_para1, mock_para2, mock_para3]
-        mock_doc.tables = [mock_table]
+        mock_doc = SimpleNamespace(
+            paragraphs=[mock_para1, mock_para2, mock_para3],
+            tables=[mock_table],
+        )
         mock_document.return_value = mock_doc
 
         analysis = parser.analyze("/fake/doc.docx")
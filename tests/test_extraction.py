@@ -1,7 +1,9 @@
 """Tests for extraction engine with mocked LLM responses."""
 
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pydantic import BaseModel, Field
 from typing import Optional
 
@@ -58,19 +60,31 @@ class TestExtractionEngine:
 
         assert client1 is client2
 
+    @pytest.mark.parametrize("async_, sdk_class", [(False, "Anthropic"), (True, "AsyncAnthropic")])
+    def test_build_client_picks_sdk_class(self, async_, sdk_class):
+        """Test that sync and async clients come from one builder with matching SDK classes."""
+        engine = ExtractionEngine(api_key="test-key")
+
+        with patch(f"anthropic.{sdk_class}") as mock_sdk, \
+                patch("instructor.from_anthropic") as mock_wrap:
+            client = engine._get_async_client() if async_ else engine._get_client()
+
+        mock_sdk.assert_called_once_with(base_url=None, api_key="test-key")
+        mock_wrap.assert_called_once_with(mock_sdk.return_value)
+        assert client is mock_wrap.return_value
+
 
 class TestExtractionEngineWithMocks:
     """Tests for ExtractionEngine with mocked LLM clients."""
 
-    def test_extract_anthropic(self):
+    def test_extract_anthropic(self, make_completion):
         """Test extraction with Anthropic provider using pre-set mock client."""
         engine = ExtractionEngine(provider="anthropic")
 
         # Create mock client that returns expected schema
         # create_with_completion returns (model, completion) tuple
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=100, output_tokens=50)
+        mock_completion = make_completion(input_tokens=100, output_tokens=50)
         mock_client.messages.create_with_completion.return_value = (
             InvoiceSchema(
                 title="Invoice #123",
@@ -87,14 +101,13 @@ class TestExtractionEngineWithMocks:
         assert result.amount == 500.00
         mock_client.messages.create_with_completion.assert_called_once()
 
-    def test_extract_openai(self):
+    def test_extract_openai(self, make_completion):
         """Test extraction with OpenAI provider using pre-set mock client."""
         engine = ExtractionEngine(provider="openai", model="gpt-4o")
 
         # Create mock client - create_with_completion returns tuple
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(prompt_tokens=80, completion_tokens=40)
+        mock_completion = make_completion(prompt_tokens=80, completion_tokens=40)
         mock_client.chat.completions.create_with_completion.return_value = (
             InvoiceSchema(
                 title="Invoice #456",
@@ -110,13 +123,12 @@ class TestExtractionEngineWithMocks:
         assert result.amount == 250.00
         mock_client.chat.completions.create_with_completion.assert_called_once()
 
-    def test_assess_returns_assessment(self):
+    def test_assess_returns_assessment(self, make_completion):
         """Test assessment returns Assessment object."""
         engine = ExtractionEngine(provider="anthropic")
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=200, output_tokens=30)
+        mock_completion = make_completion(input_tokens=200, output_tokens=30)
         mock_client.messages.create_with_completion.return_value = (
             Assessment(
                 review_status=ReviewStatus.NO_REVIEW_NEEDED,
@@ -134,13 +146,12 @@ class TestExtractionEngineWithMocks:
         assert isinstance(result, Assessment)
         assert result.review_status == ReviewStatus.NO_REVIEW_NEEDED
 
-    def test_assess_with_issues(self):
+    def test_assess_with_issues(self, make_completion):
         """Test assessment that finds issues."""
         engine = ExtractionEngine(provider="anthropic")
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=200, output_tokens=50)
+        mock_completion = make_completion(input_tokens=200, output_tokens=50)
         mock_client.messages.create_with_completion.return_value = (
             Assessment(
                 review_status=ReviewStatus.NEEDS_REVIEW,
@@ -161,13 +172,12 @@ class TestExtractionEngineWithMocks:
         assert "amount" in result.ambiguous_fields
         assert len(result.schema_suggestions) == 1
 
-    def test_extract_prompt_contains_document(self):
+    def test_extract_prompt_contains_document(self, make_completion):
         """Test that extract sends document text in prompt."""
         engine = ExtractionEngine(provider="anthropic")
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=100, output_tokens=50)
+        mock_completion = make_completion(input_tokens=100, output_tokens=50)
         mock_client.messages.create_with_completion.return_value = (
             InvoiceSchema(title="Test"),
             mock_completion,
@@ -181,13 +191,12 @@ class TestExtractionEngineWithMocks:
         messages = call_args.kwargs["messages"]
         assert "This is my document content" in messages[0]["content"]
 
-    def test_assess_prompt_contains_context(self):
+    def test_assess_prompt_contains_context(self, make_completion):
         """Test that assess includes document, schema, and extracted data."""
         engine = ExtractionEngine(provider="anthropic")
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=200, output_tokens=30)
+        mock_completion = make_completion(input_tokens=200, output_tokens=30)
         mock_client.messages.create_with_completion.return_value = (
             Assessment(
                 review_status=ReviewStatus.NO_REVIEW_NEEDED,
@@ -201,11 +210,34 @@ class TestExtractionEngineWithMocks:
 
         call_args = mock_client.messages.create_with_completion.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
+        system = call_args.kwargs["system"][0]
 
         # Verify all context is included
         assert "Original document text" in prompt
         assert "My Invoice" in prompt  # extracted data
-        assert "title" in prompt  # schema field
+        assert "title" in system["text"]  # schema field, in the cacheable prefix
+        assert system["cache_control"] == {"type": "ephemeral"}
+
+    def test_assess_openai_uses_stable_system_prefix(self):
+        """Test that the OpenAI assess prompt leads with the shared schema prefix."""
+        engine = ExtractionEngine(provider="openai", model="gpt-4o")
+
+        mock_client = Mock()
+        mock_client.chat.completions.create_with_completion.return_value = (
+            Assessment(review_status=ReviewStatus.NO_REVIEW_NEEDED),
+            Mock(usage=None),
+        )
+        engine._client = mock_client
+
+        engine.assess("Doc one", InvoiceSchema, InvoiceSchema(title="A"))
+        engine.assess("Doc two", InvoiceSchema, InvoiceSchema(title="B"))
+
+        first, second = [
+            c.kwargs["messages"] for c in mock_client.chat.completions.create_with_completion.call_args_list
+        ]
+        assert first[0]["role"] == "system"
+        assert first[0] == second[0]
+        assert "Doc two" in second[1]["content"]
 
 
 class TestExtractionEngineErrorHandling:
@@ -256,13 +288,12 @@ class TestExtractionEngineErrorHandling:
 class TestExtractionEngineRetry:
     """Tests for retry logic in ExtractionEngine."""
 
-    def test_retry_on_rate_limit(self):
+    def test_retry_on_rate_limit(self, make_completion):
         """Test that rate limit errors trigger retries."""
         engine = ExtractionEngine(provider="anthropic", max_retries=2, retry_delay=0.01)
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=100, output_tokens=50)
+        mock_completion = make_completion(input_tokens=100, output_tokens=50)
         # Fail twice with rate limit, then succeed
         mock_client.messages.create_with_completion.side_effect = [
             Exception("Rate limit exceeded"),
@@ -290,13 +321,12 @@ class TestExtractionEngineRetry:
         assert "Rate limit exceeded" in str(exc_info.value)
         assert mock_client.messages.create_with_completion.call_count == 2  # initial + 1 retry
 
-    def test_retry_on_server_error(self):
+    def test_retry_on_server_error(self, make_completion):
         """Test that 5xx errors trigger retries."""
         engine = ExtractionEngine(provider="anthropic", max_retries=1, retry_delay=0.01)
 
         mock_client = Mock()
-        mock_completion = Mock()
-        mock_completion.usage = Mock(input_tokens=100, output_tokens=50)
+        mock_completion = make_completion(input_tokens=100, output_tokens=50)
         mock_client.messages.create_with_completion.side_effect = [
             Exception("503 Service Unavailable"),
             (InvoiceSchema(title="Recovered"), mock_completion),
@@ -321,6 +351,41 @@ class TestExtractionEngineRetry:
         # Should only be called once (no retries for auth errors)
         assert mock_client.messages.create_with_completion.call_count == 1
 
+    def test_backoff_grows_and_is_capped(self):
+        """Test that retry sleeps grow exponentially up to the cap."""
+        engine = ExtractionEngine(provider="anthropic", max_retries=4, retry_delay=10.0)
+
+        mock_client = Mock()
+        mock_client.messages.create_with_completion.side_effect = Exception("503 Service Unavailable")
+        engine._client = mock_client
+
+        with patch("doc2json.core.extraction.time.sleep") as mock_sleep, \
+                patch("doc2json.core.extraction.random.uniform", return_value=0.0):
+            with pytest.raises(APIError):
+                engine.extract("Document", InvoiceSchema)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [10.0, 20.0, 30.0, 30.0]
+
+    def test_backoff_adds_jitter(self):
+        """Test that jitter is added on top of the base delay."""
+        engine = ExtractionEngine(retry_delay=1.0)
+
+        with patch("doc2json.core.extraction.random.uniform", return_value=0.2) as uniform:
+            delay = engine._backoff_delay(1, Exception("503"))
+
+        uniform.assert_called_once_with(0, 2.0 * engine.RETRY_JITTER)
+        assert delay == pytest.approx(2.2)
+
+    def test_backoff_honors_retry_after(self):
+        """Test that a Retry-After header overrides the computed backoff."""
+        engine = ExtractionEngine(retry_delay=1.0)
+
+        error = Exception("429 Too Many Requests")
+        error.response = Mock(headers={"retry-after": "7"})
+
+        assert engine._backoff_delay(0, error) == 7.0
+
     def test_is_retryable_error(self):
         """Test the retryable error detection."""
         engine = ExtractionEngine()
@@ -336,3 +401,334 @@ class TestExtractionEngineRetry:
         assert engine._is_retryable_error(Exception("authentication failed")) is False
         assert engine._is_retryable_error(Exception("invalid request")) is False
         assert engine._is_retryable_error(ValueError("bad input")) is False
+
+
+class TestExtractionEngineAsync:
+    """Tests for async extraction."""
+
+    def test_aextract_anthropic(self, make_completion):
+        """Test async extraction with the async Anthropic client."""
+        engine = ExtractionEngine(provider="anthropic")
+
+        mock_client = Mock()
+        mock_completion = make_completion(input_tokens=100, output_tokens=50)
+        mock_client.messages.create_with_completion = AsyncMock(
+            return_value=(InvoiceSchema(title="INV-001"), mock_completion)
+        )
+        engine._async_client = mock_client
+
+        response = asyncio.run(engine.aextract_with_metadata("Invoice INV-001", InvoiceSchema))
+
+        assert response.data.title == "INV-001"
+        assert response.tokens.input_tokens == 100
+        call_args = mock_client.messages.create_with_completion.call_args
+        assert call_args.kwargs["max_tokens"] == 4096
+        assert "Invoice INV-001" in call_args.kwargs["messages"][0]["content"]
+
+    def test_aextract_many_preserves_order(self):
+        """Test that concurrent results come back in input order."""
+        engine = ExtractionEngine(provider="openai", model="gpt-4o")
+
+        async def fake_create(**kwargs):
+            text = kwargs["messages"][0]["content"].rsplit("\n", 1)[-1]
+            # Finish later documents first
+            await asyncio.sleep(0.01 if text == "doc-0" else 0)
+            return InvoiceSchema(title=text), Mock(usage=None)
+
+        mock_client = Mock()
+        mock_client.chat.completions.create_with_completion = AsyncMock(side_effect=fake_create)
+        engine._async_client = mock_client
+
+        results = asyncio.run(
+            engine.aextract_many(["doc-0", "doc-1", "doc-2"], InvoiceSchema, max_concurrency=2)
+        )
+
+        assert [r.title for r in results] == ["doc-0", "doc-1", "doc-2"]
+
+    def test_aextract_retries_without_blocking(self):
+        """Test that async extraction retries transient errors."""
+        engine = ExtractionEngine(provider="anthropic", max_retries=1, retry_delay=0.01)
+
+        mock_client = Mock()
+        mock_client.messages.create_with_completion = AsyncMock(side_effect=[
+            Exception("503 Service Unavailable"),
+            (InvoiceSchema(title="Recovered"), Mock(usage=None)),
+        ])
+        engine._async_client = mock_client
+
+        with patch("doc2json.core.extraction.time.sleep") as mock_sleep:
+            result = asyncio.run(engine.aextract("Document", InvoiceSchema))
+
+        assert result.title == "Recovered"
+        mock_sleep.assert_not_called()
+
+    def test_aextract_exhausted_raises_rate_limit_error(self):
+        """Test that exhausted async retries raise RateLimitError."""
+        engine = ExtractionEngine(provider="anthropic", max_retries=1, retry_delay=0.01)
+
+        mock_client = Mock()
+        mock_client.messages.create_with_completion = AsyncMock(
+            side_effect=Exception("Rate limit exceeded")
+        )
+        engine._async_client = mock_client
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(engine.aextract("Document", InvoiceSchema))
+
+        assert mock_client.messages.create_with_completion.call_count == 2
+
+
+class TestExtractionEngineBatch:
+    """Tests for provider batch API extraction."""
+
+    def test_anthropic_batch_results_ordered(self):
+        """Test Anthropic message batches are submitted and reordered by custom_id."""
+        engine = ExtractionEngine(provider="anthropic")
+
+        raw = Mock()
+        raw.messages.batches.create.return_value = Mock(id="batch_1")
+        raw.messages.batches.retrieve.return_value = Mock(id="batch_1", processing_status="ended")
+
+        def entry(custom_id, title):
+            block = Mock(type="tool_use", input={"title": title})
+            return Mock(custom_id=custom_id, result=Mock(type="succeeded", message=Mock(content=[block])))
+
+        raw.messages.batches.results.return_value = [
+            entry("doc-1", "Second"),
+            Mock(custom_id="doc-2", result=Mock(type="errored")),
+            entry("doc-0", "First"),
+        ]
+        engine._client = Mock(client=raw)
+
+        results = engine.extract_batch(["a", "b", "c"], InvoiceSchema, poll_interval=0)
+
+        assert [r.title if r else None for r in results] == ["First", "Second", None]
+        requests = raw.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["doc-0", "doc-1", "doc-2"]
+        assert requests[0]["params"]["tool_choice"]["name"] == "InvoiceSchema"
+
+    def test_openai_batch_uploads_jsonl(self):
+        """Test OpenAI batches upload a JSONL file and parse the output file."""
+        import json
+
+        engine = ExtractionEngine(provider="openai", model="gpt-4o")
+
+        raw = Mock()
+        raw.files.create.return_value = Mock(id="file_1")
+        raw.batches.create.return_value = Mock(id="batch_1")
+        raw.batches.retrieve.return_value = Mock(status="completed", output_file_id="out_1")
+        output_line = {
+            "custom_id": "doc-0",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": json.dumps({"title": "INV-1"})}}]},
+            },
+            "error": None,
+        }
+        raw.files.content.return_value = Mock(text=json.dumps(output_line) + "\n")
+        engine._client = Mock(client=raw)
+
+        results = engine.extract_batch(["Invoice INV-1"], InvoiceSchema, poll_interval=0)
+
+        assert results[0].title == "INV-1"
+        _, payload = raw.files.create.call_args.kwargs["file"]
+        request = json.loads(payload.decode("utf-8").splitlines()[0])
+        assert request["url"] == "/v1/chat/completions"
+        assert request["body"]["model"] == "gpt-4o"
+        raw.batches.create.assert_called_once_with(
+            input_file_id="file_1",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+    def test_openai_batch_failure_raises(self):
+        """Test that a failed batch raises APIError."""
+        engine = ExtractionEngine(provider="openai")
+
+        raw = Mock()
+        raw.batches.retrieve.return_value = Mock(status="expired")
+        engine._client = Mock(client=raw)
+
+        with pytest.raises(APIError) as exc_info:
+            engine.collect_batch("batch_1", InvoiceSchema, count=1, poll_interval=0)
+
+        assert "expired" in str(exc_info.value)
+
+    def test_batch_unsupported_provider(self):
+        """Test that providers without a batch API raise ProviderError."""
+        engine = ExtractionEngine(provider="ollama")
+
+        with pytest.raises(ProviderError):
+            engine.submit_batch(["doc"], InvoiceSchema)
+
+
+class TestExtractionCache:
+    """Tests for the exact-match extraction cache."""
+
+    def _engine_with_client(self, cache):
+        engine = ExtractionEngine(provider="anthropic", cache=cache)
+        mock_client = Mock()
+        mock_client.messages.create_with_completion.return_value = (
+            InvoiceSchema(title="Cached"),
+            Mock(usage=Mock(input_tokens=10, output_tokens=5)),
+        )
+        engine._client = mock_client
+        return engine, mock_client
+
+    def test_repeat_extraction_hits_cache(self):
+        """Test that an identical document skips the LLM call."""
+        from doc2json.core.extraction import ExtractionCache
+
+        cache = ExtractionCache()
+        engine, mock_client = self._engine_with_client(cache)
+
+        first = engine.extract_with_metadata("Same document", InvoiceSchema)
+        second = engine.extract_with_metadata("Same document", InvoiceSchema)
+
+        assert first.data == second.data
+        assert second.tokens is None
+        assert mock_client.messages.create_with_completion.call_count == 1
+        assert cache.hits == 1
+
+    def test_different_text_misses_cache(self):
+        """Test that a different document is sent to the LLM."""
+        from doc2json.core.extraction import ExtractionCache
+
+        engine, mock_client = self._engine_with_client(ExtractionCache())
+
+        engine.extract("Document one", InvoiceSchema)
+        engine.extract("Document two", InvoiceSchema)
+
+        assert mock_client.messages.create_with_completion.call_count == 2
+
+    def test_directory_cache_persists(self, temp_dir):
+        """Test that entries written to disk are visible to a new cache."""
+        from doc2json.core.extraction import ExtractionCache
+
+        engine, _ = self._engine_with_client(ExtractionCache(directory=str(temp_dir)))
+        engine.extract("Persisted document", InvoiceSchema)
+
+        engine2, mock_client2 = self._engine_with_client(ExtractionCache(directory=str(temp_dir)))
+        result = engine2.extract("Persisted document", InvoiceSchema)
+
+        assert result.title == "Cached"
+        mock_client2.messages.create_with_completion.assert_not_called()
+
+    def test_schema_tool_uses_configured_cache_dir(self, temp_dir):
+        """Test that llm.cache_dir gives SchemaTool's engine a persistent cache."""
+        from doc2json.config.loader import LLMConfig
+        from doc2json.core.engine import SchemaTool
+
+        tool = SchemaTool(Mock())
+
+        cached = tool._create_engine(LLMConfig(cache_dir=str(temp_dir / "cache")))
+        uncached = tool._create_engine(LLMConfig())
+
+        assert cached.cache.directory == str(temp_dir / "cache")
+        assert uncached.cache is None
+
+
+class TestRateLimiter:
+    """Tests for proactive client-side throttling."""
+
+    def test_waits_when_bucket_empty(self):
+        """Test that requests beyond the per-minute budget must wait."""
+        from doc2json.core.extraction.ratelimit import RateLimiter
+
+        limiter = RateLimiter(requests_per_minute=60, clock=lambda: 0.0)
+
+        waits = [limiter._reserve(0) for _ in range(61)]
+
+        assert waits[:60] == [0.0] * 60
+        assert waits[60] == pytest.approx(1.0)  # one request per second refill
+
+    def test_aimd_decrease_and_recovery(self):
+        """Test that 429s cut the rate and a quiet period restores it."""
+        from doc2json.core.extraction.ratelimit import RateLimiter
+
+        now = [0.0]
+        limiter = RateLimiter(requests_per_minute=100, clock=lambda: now[0])
+
+        limiter.on_rate_limited()
+        assert limiter.scale == pytest.approx(0.8)
+
+        now[0] = 30.0
+        limiter.on_success()
+        assert limiter.scale == pytest.approx(0.8)  # still inside recovery period
+
+        now[0] = 61.0
+        limiter.on_success()
+        assert limiter.scale == 1.0
+
+    def test_engine_throttles_before_call(self):
+        """Test that the engine acquires from the limiter before each request."""
+        engine = ExtractionEngine(provider="anthropic", requests_per_minute=60)
+
+        order = []
+        engine._limiter = Mock()
+        engine._limiter.acquire.side_effect = lambda tokens: order.append(("acquire", tokens))
+
+        mock_client = Mock()
+
+        def create(**kwargs):
+            order.append(("create", None))
+            return InvoiceSchema(title="Test"), Mock(usage=None)
+
+        mock_client.messages.create_with_completion.side_effect = create
+        engine._client = mock_client
+
+        engine.extract("x" * 400, InvoiceSchema)
+
+        assert order == [("acquire", 100), ("create", None)]
+        engine._limiter.on_success.assert_called_once()
+
+    def test_rate_limit_error_slows_limiter(self):
+        """Test that a 429 from the provider is fed back to the limiter."""
+        engine = ExtractionEngine(
+            provider="anthropic", max_retries=1, retry_delay=0.01, requests_per_minute=600
+        )
+
+        mock_client = Mock()
+        mock_client.messages.create_with_completion.side_effect = [
+            Exception("429 Too Many Requests"),
+            (InvoiceSchema(title="Test"), Mock(usage=None)),
+        ]
+        engine._client = mock_client
+
+        engine.extract("Document", InvoiceSchema)
+
+        assert engine._limiter.scale == pytest.approx(0.8)
+
+
+class TestSchemaBlob:
+    """Tests for the per-class JSON schema cache."""
+
+    def test_schema_introspected_once(self):
+        """Test that repeated lookups reuse the cached schema."""
+        from doc2json.core.extraction import _schema_blob
+
+        class CachedSchema(BaseModel):
+            name: str = Field(description="Name")
+
+        with patch.object(
+            CachedSchema, "model_json_schema", wraps=CachedSchema.model_json_schema
+        ) as introspect:
+            first = _schema_blob(CachedSchema)
+            second = _schema_blob(CachedSchema)
+
+        assert first is second
+        assert introspect.call_count == 1
+        assert '"name"' in first[0]
+        assert first[1]["properties"]["name"]["description"] == "Name"
+
+    def test_same_named_schemas_do_not_collide(self):
+        """Test that distinct classes both named Schema get their own entry."""
+        from doc2json.core.extraction import _schema_blob
+
+        def make(field_name):
+            return type("Schema", (BaseModel,), {"__annotations__": {field_name: str}})
+
+        first, second = make("invoice_id"), make("contract_id")
+
+        assert "invoice_id" in _schema_blob(first)[0]
+        assert "contract_id" in _schema_blob(second)[0]
@@ -215,6 +215,23 @@ class TestHTMLExtractor:
         assert len(result["tables"]) == 1
         assert result["tables"][0] == [["A", "B"], ["1", "2"]]
 
+    def test_extract_structured_headings_grouped_by_level(self):
+        """Test that headings are grouped by level, in document order within a level."""
+        extractor = HTMLExtractor()
+        html = """
+        <h2>Section A</h2>
+        <h1>Top</h1>
+        <h3>Detail</h3>
+        <h2>Section B</h2>
+        """
+
+        result = extractor.extract_structured(html)
+
+        assert [(h["level"], h["text"]) for h in result["headings"]] == [
+            (1, "Top"), (2, "Section A"), (2, "Section B"), (3, "Detail"),
+        ]
+        assert result["title"] == "Top"  # no <title>, falls back to first h1
+
 
 class TestHTMLParserFile:
     """Tests for file-based HTML parsing."""
@@ -275,41 +292,170 @@ class TestHTMLParserFile:
         assert analysis["paragraph_count"] == 2
         assert analysis["has_content"] is True
 
+    @pytest.mark.parametrize("content", [
+        b"<html><head><title>Caf\xe9</title></head><body><p>x</p></body></html>",
+        b'<html><head><meta charset="utf-8"><title>Caf\xe9</title></head></html>',
+        b'<html><head><meta charset="iso-8859-1"><title>Caf\xe9</title></head></html>',
+        "\ufeff<html><head><title>Café</title></head></html>".encode("utf-8"),
+        "\ufeff<html><head><title>Café</title></head></html>".encode("utf-16-le"),
+    ], ids=["latin1_no_meta", "wrong_meta", "latin1_meta", "utf8_bom", "utf16_bom"])
+    def test_analyze_decodes_like_parse(self, tmp_path, content):
+        """Test that analyze and parse_structured read the same title."""
+        html_file = tmp_path / "test.html"
+        html_file.write_bytes(content)
+
+        parser = HTMLParser()
+
+        assert parser.analyze(str(html_file))["title"] == "Café"
+        assert parser.parse_structured(str(html_file))["title"] == "Café"
+
+
+STREAM_SAMPLES = {
+    "empty_first_h1": b"<html><body><h1></h1><h1>Second</h1><p>Text</p></body></html>",
+    "empty_title": b"<html><head><title> </title></head><body><h1>Main</h1></body></html>",
+    "two_titles": b"<html><head><title>First</title><title>Second</title></head></html>",
+    "removed_heading": (
+        b"<html><body><header><h1>Site</h1></header><nav><ul><li>Home</li></ul></nav>"
+        b"<h1>Article</h1><p>Body</p></body></html>"
+    ),
+    "svg_title": b"<html><body><svg><title>Icon</title></svg><h2>Only h2</h2></body></html>",
+    "inline_markup": b"<html><body><p><b>Bold</b> and <i>italic</i></p><h2><span></span></h2></body></html>",
+    "nested_containers": (
+        b"<html><body><table><tr><td><ul><li>In cell</li></ul></td></tr></table>"
+        b"<ul><li><ol><li></li></ol></li><li><p>Item</p></li></ul>"
+        b"<table><tr></tr></table><table><tr><td></td></tr></table></body></html>"
+    ),
+}
+
+
+class TestHTMLAnalyzeStream:
+    """Tests for streaming structure analysis."""
+
+    HTML = b"""
+    <html>
+    <head><title>Report</title></head>
+    <body>
+        <nav><h2>Menu</h2><p>Skip me</p></nav>
+        <h1>Heading</h1>
+        <p>Paragraph 1</p>
+        <p>   </p>
+        <ul><li><p>Item in paragraph</p></li><li>Item 2</li></ul>
+        <table><tr><th>Name</th></tr><tr><td>Value</td></tr></table>
+        <table></table>
+        <h3>Sub heading</h3>
+        <p>Paragraph 2</p>
+    </body>
+    </html>
+    """
+
+    def test_matches_structured_counts(self):
+        """Test that streaming counts agree with extract_structured."""
+        import io
+
+        extractor = HTMLExtractor()
+        structured = extractor.extract_structured(self.HTML.decode())
+
+        analysis = extractor.analyze_stream(io.BytesIO(self.HTML))
+
+        assert analysis["title"] == structured["title"] == "Report"
+        assert analysis["heading_count"] == len(structured["headings"]) == 2
+        assert analysis["paragraph_count"] == len(structured["paragraphs"]) == 3
+        assert analysis["table_count"] == len(structured["tables"]) == 1
+        assert analysis["list_count"] == len(structured["lists"]) == 1
+
+    @pytest.mark.parametrize("html", STREAM_SAMPLES.values(), ids=STREAM_SAMPLES.keys())
+    def test_agrees_with_structured(self, html):
+        """Test that streaming and tree analysis agree on every fixture."""
+        import io
+
+        extractor = HTMLExtractor()
+        structured = extractor.extract_structured(html.decode())
+
+        analysis = extractor.analyze_stream(io.BytesIO(html))
+
+        assert analysis["title"] == structured["title"]
+        assert analysis["heading_count"] == len(structured["headings"])
+        assert analysis["paragraph_count"] == len(structured["paragraphs"])
+        assert analysis["table_count"] == len(structured["tables"])
+        assert analysis["list_count"] == len(structured["lists"])
+
+    def test_title_falls_back_to_h1(self):
+        """Test that the first h1 is used when there is no title tag."""
+        import io
+
+        analysis = HTMLExtractor().analyze_stream(
+            io.BytesIO(b"<html><body><h1>Main</h1><p>Text</p></body></html>")
+        )
+
+        assert analysis["title"] == "Main"
+
+    def test_empty_input(self):
+        """Test that empty input yields zero counts rather than an error."""
+        import io
+
+        analysis = HTMLExtractor().analyze_stream(io.BytesIO(b""))
+
+        assert analysis["paragraph_count"] == 0
+        assert analysis["has_content"] is False
+
+
+ENCODING_SAMPLES = {
+    "utf8_bom": b"\xef\xbb\xbf<html><body>Test</body></html>",
+    "charset_meta": b'<html><head><meta charset="utf-8"></head></html>',
+    "http_equiv": (
+        b'<html><head><meta http-equiv="Content-Type" '
+        b'content="text/html; charset=Shift_JIS"></head></html>'
+    ),
+    "unknown_charset": b'<html><head><meta charset="not-a-charset"></head></html>',
+    "plain": b"<html><body>Simple</body></html>",
+}
+
+
+@pytest.fixture(scope="session")
+def encoding_samples(tmp_path_factory):
+    """Write the encoding-detection sample files once per session (per xdist worker)."""
+    samples_dir = tmp_path_factory.mktemp("encoding")
+    paths = {}
+    for name, content in ENCODING_SAMPLES.items():
+        path = samples_dir / f"{name}.html"
+        path.write_bytes(content)
+        paths[name] = str(path)
+    return paths
+
 
 class TestHTMLParserEncoding:
     """Tests for encoding detection."""
 
-    def test_detect_utf8_bom(self, tmp_path):
+    def test_detect_utf8_bom(self, encoding_samples):
         """Test detecting UTF-8 BOM."""
-        html_file = tmp_path / "test.html"
-        # Write with BOM
-        with open(html_file, "wb") as f:
-            f.write(b"\xef\xbb\xbf<html><body>Test</body></html>")
-
         parser = HTMLParser()
-        encoding = parser._detect_encoding(str(html_file))
+        encoding = parser._detect_encoding(encoding_samples["utf8_bom"])
 
         assert encoding == "utf-8-sig"
 
-    def test_detect_charset_meta(self, tmp_path):
+    def test_detect_charset_meta(self, encoding_samples):
         """Test detecting charset from meta tag."""
-        html_file = tmp_path / "test.html"
-        html_file.write_bytes(
-            b'<html><head><meta charset="utf-8"></head></html>'
-        )
-
         parser = HTMLParser()
-        encoding = parser._detect_encoding(str(html_file))
+        encoding = parser._detect_encoding(encoding_samples["charset_meta"])
 
         assert encoding == "utf-8"
 
-    def test_fallback_to_utf8(self, tmp_path):
-        """Test fallback to UTF-8 when no encoding detected."""
-        html_file = tmp_path / "test.html"
-        html_file.write_bytes(b"<html><body>Simple</body></html>")
+    def test_detect_http_equiv_charset(self, encoding_samples):
+        """Test detecting a charset declared in an http-equiv content attribute."""
+        parser = HTMLParser()
 
+        assert parser._detect_encoding(encoding_samples["http_equiv"]) == "shift_jis"
+
+    def test_unknown_charset_falls_back_to_utf8(self, encoding_samples):
+        """Test that an unrecognised charset label is ignored."""
+        parser = HTMLParser()
+
+        assert parser._detect_encoding(encoding_samples["unknown_charset"]) == "utf-8"
+
+    def test_fallback_to_utf8(self, encoding_samples):
+        """Test fallback to UTF-8 when no encoding detected."""
         parser = HTMLParser()
-        encoding = parser._detect_encoding(str(html_file))
+        encoding = parser._detect_encoding(encoding_samples["plain"])
 
         assert encoding == "utf-8"
 
@@ -11,7 +11,7 @@ from doc2json.models.document import (
 )
 from doc2json.config.loader import SchemaConfig, LargeDocStrategy, load_config
 from doc2json.core.exceptions import DocumentTooLargeError
-from doc2json.core.engine import SchemaTool
+from doc2json.core.engine import SchemaTool, TRUNCATION_MARKER, _iter_chunks, _merge_extracted
 from doc2json.models.result import ExtractionResult
 
 
@@ -58,6 +58,15 @@ class TestDocumentInfo:
         )
         assert large.is_large is True
 
+    def test_is_frozen(self):
+        """Test that DocumentInfo is immutable, so is_large cannot go stale."""
+        from dataclasses import FrozenInstanceError
+
+        info = DocumentInfo(file_path="/test.txt", char_count=1000)
+        with pytest.raises(FrozenInstanceError):
+            info.char_count = LARGE_DOC_CHARS + 1
+        assert info.is_large is False
+
     def test_exceeds_limit(self):
         """Test exceeds_limit method."""
         info = DocumentInfo(file_path="/test.txt", char_count=50000)
@@ -80,6 +89,8 @@ class TestDocumentInfo:
 class TestSchemaConfigLargeDoc:
     """Tests for large_doc_strategy in SchemaConfig."""
 
+    pytestmark = pytest.mark.io
+
     def test_default_strategy(self):
         """Test default strategy is truncate."""
         config = SchemaConfig(name="test")
@@ -184,8 +195,8 @@ class TestSizeStrategyApplication:
         )
 
         assert len(result_text) < len(text)
-        assert result_text.startswith("A" * 100)
-        assert "truncated" in result_text.lower()
+        assert result_text == "A" * 100 + TRUNCATION_MARKER
+        assert "truncated" in TRUNCATION_MARKER
         assert was_truncated is True
 
     def test_fail_strategy_raises(self):
@@ -222,6 +233,124 @@ class TestSizeStrategyApplication:
         assert was_truncated is False
 
 
+class TestChunkStrategy:
+    """Tests for the chunk large_doc_strategy."""
+
+    def test_chunks_cover_text_with_overlap(self):
+        """Test that chunks respect the size limit and overlap by the given amount."""
+        text = "".join(f"Sentence number {i}. " for i in range(200))
+        chunks = list(_iter_chunks(text, size=500, overlap=50))
+
+        assert len(chunks) > 1
+        assert all(len(c) <= 500 for c in chunks)
+        assert chunks[0] == text[:len(chunks[0])]
+        assert text.endswith(chunks[-1])
+        for prev, nxt in zip(chunks, chunks[1:]):
+            assert nxt.startswith(prev[-50:])
+            # Chunks end on a sentence break rather than mid-word
+            assert prev.endswith(". ")
+
+    def test_short_text_is_single_chunk(self):
+        """Test that text within the limit yields one chunk."""
+        assert list(_iter_chunks("short", size=100, overlap=10)) == ["short"]
+
+    def test_non_positive_size_rejected(self):
+        """Test that a zero chunk size raises instead of yielding empty windows."""
+        with pytest.raises(ValueError, match="positive"):
+            list(_iter_chunks("some text", size=0, overlap=0))
+
+    def test_merge_extracted(self):
+        """Test merging keeps first scalars, unions lists and merges objects."""
+        merged = _merge_extracted({}, {"title": "A", "total": None, "items": [1, 2], "meta": {"a": 1}})
+        _merge_extracted(merged, {"title": "B", "total": 10, "items": [2, 3], "meta": {"b": 2}})
+
+        assert merged == {"title": "A", "total": 10, "items": [1, 2, 3], "meta": {"a": 1, "b": 2}}
+
+    def test_extract_chunked_merges_and_sums_tokens(self):
+        """Test that each chunk is extracted and the results combined."""
+        from pydantic import BaseModel
+        from doc2json.core.extraction import ExtractionResponse
+        from doc2json.models.metadata import TokenUsage
+
+        class Doc(BaseModel):
+            title: str | None = None
+            parties: list[str] = []
+
+        responses = iter([
+            ExtractionResponse(Doc(title="Lease", parties=["Ann"]), TokenUsage(100, 10)),
+            ExtractionResponse(Doc(parties=["Ann", "Bob"]), TokenUsage(90, 8)),
+        ])
+        engine = Mock()
+        engine.extract_with_metadata.side_effect = lambda text, schema: next(responses)
+
+        schema_config = SchemaConfig(
+            name="test", large_doc_strategy=LargeDocStrategy.CHUNK,
+            max_chars=100, chunk_overlap=10,
+        )
+        tool = SchemaTool(Mock())
+
+        response = tool._extract_chunked(engine, "x" * 150, Doc, schema_config)
+
+        assert engine.extract_with_metadata.call_count == 2
+        assert response.data == Doc(title="Lease", parties=["Ann", "Bob"])
+        assert response.tokens == TokenUsage(190, 18)
+
+    def test_apply_size_strategy_leaves_text_whole(self):
+        """Test that the chunk strategy does not truncate."""
+        schema_config = SchemaConfig(name="test", large_doc_strategy=LargeDocStrategy.CHUNK, max_chars=100)
+        tool = SchemaTool(Mock())
+
+        text = "A" * 500
+        doc_info = DocumentInfo(file_path="/test.txt", char_count=len(text))
+
+        assert tool._apply_size_strategy(text, doc_info, schema_config) == (text, False)
+
+    def test_load_config_chunk_overlap(self, tmp_path):
+        """Test loading chunk strategy settings from YAML."""
+        config_file = tmp_path / "doc2json.yml"
+        config_file.write_text("""
+schemas:
+  - name: contracts
+    large_doc_strategy: chunk
+    max_chars: 20000
+    chunk_overlap: 500
+""")
+        contracts = load_config(str(config_file)).get_schema("contracts")
+
+        assert contracts.large_doc_strategy == LargeDocStrategy.CHUNK
+        assert contracts.chunk_overlap == 500
+
+    @pytest.mark.parametrize("max_chars", [0, -100])
+    def test_load_config_rejects_non_positive_chunk_size(self, tmp_path, max_chars):
+        """Test that the chunk strategy requires a positive max_chars."""
+        from doc2json.core.exceptions import ConfigError
+
+        config_file = tmp_path / "doc2json.yml"
+        config_file.write_text(f"""
+schemas:
+  - name: contracts
+    large_doc_strategy: chunk
+    max_chars: {max_chars}
+""")
+        with pytest.raises(ConfigError, match=r"max_chars .* schemas\[0\]"):
+            load_config(str(config_file))
+
+    @pytest.mark.parametrize("chunk_overlap", [-1, "500", 1.5])
+    def test_load_config_rejects_invalid_chunk_overlap(self, tmp_path, chunk_overlap):
+        """Test that chunk_overlap must be a non-negative integer."""
+        from doc2json.core.exceptions import ConfigError
+
+        config_file = tmp_path / "doc2json.yml"
+        config_file.write_text(f"""
+schemas:
+  - name: contracts
+    large_doc_strategy: chunk
+    chunk_overlap: {chunk_overlap!r}
+""")
+        with pytest.raises(ConfigError, match=r"chunk_overlap .* schemas\[0\]"):
+            load_config(str(config_file))
+
+
 class TestExtractionResultTruncation:
     """Tests for truncation metadata in ExtractionResult."""
 
@@ -253,6 +382,25 @@ class TestExtractionResultTruncation:
         assert output["_truncated"] is True
         assert output["_original_chars"] == 150000
 
+    def test_result_with_partial_assessment(self):
+        """Test output dict flags an assessment that only saw the first chunk."""
+        from doc2json.models.result import Assessment, ReviewStatus
+
+        result = ExtractionResult(
+            source_file="test.pdf",
+            schema_name="invoice",
+            schema_version="1",
+            data={"field": "value"},
+            assessment=Assessment(review_status=ReviewStatus.NO_REVIEW_NEEDED),
+            assessment_partial=True,
+        )
+        output = result.to_output_dict()
+
+        assert output["_assessment_partial"] is True
+        assert "_assessment_partial" not in result.model_copy(
+            update={"assessment_partial": False}
+        ).to_output_dict()
+
 
 class TestDocumentTooLargeError:
     """Tests for DocumentTooLargeError exception."""
@@ -267,3 +415,20 @@ class TestDocumentTooLargeError:
         assert error.char_count == 200000
         assert error.max_chars == 100000
         assert "Document too large" in str(error)
+
+    def test_counts_required(self):
+        """Test that the counts cannot be omitted."""
+        with pytest.raises(TypeError):
+            DocumentTooLargeError("Too big")
+
+    def test_counts_keyword_only(self):
+        """Test that the counts must be passed by keyword."""
+        with pytest.raises(TypeError):
+            DocumentTooLargeError("Too big", 200000, 100000)
+
+    def test_default_message_from_counts(self):
+        """Test that the message is built from the counts when none is given."""
+        error = DocumentTooLargeError(char_count=200000, max_chars=100000)
+
+        assert "200,000 chars > 100,000 max" in str(error)
+        assert "large_doc_strategy" in str(error)
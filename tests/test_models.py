@@ -154,6 +154,12 @@ class TestExtractionResult:
         assert "_assessment" in output
         assert output["_assessment"]["review_status"] == "suggested_review"
         assert output["_assessment"]["ambiguous_fields"] == ["date"]
+        assert output["_assessment"]["schema_suggestions"] == [{
+            "name": "date_format",
+            "field_type": "Optional[str]",
+            "description": "Date format used",
+            "sample_value": None,
+        }]
 
     def test_to_output_dict_with_error(self):
         """Test to_output_dict for failed extraction."""
@@ -191,3 +197,4 @@ class TestExtractionResult:
         assert output["title"] == "Document"
         assert output["items"] == [{"name": "Item 1"}, {"name": "Item 2"}]
         assert output["metadata"] == {"author": "John"}
+
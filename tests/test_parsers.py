@@ -11,6 +11,8 @@ from doc2json.core.exceptions import UnsupportedFileTypeError
 class TestTextParser:
     """Tests for TextParser."""
 
+    pytestmark = pytest.mark.io
+
     def test_can_parse_txt(self):
         """Test that .txt files are recognized."""
         parser = TextParser()
@@ -56,6 +58,16 @@ class TestTextParser:
 
         assert "\u00e9" in content
 
+    def test_parse_max_chars(self, temp_dir):
+        """Test that max_chars stops reading at a character (not byte) count."""
+        text_file = temp_dir / "long.txt"
+        text_file.write_text("\u00e9" * 10 + "x" * 1000, encoding="utf-8")
+
+        parser = TextParser()
+
+        assert parser.parse(str(text_file), max_chars=12) == "\u00e9" * 10 + "xx"
+        assert len(parser.parse(str(text_file))) == 1010
+
     def test_parse_missing_file(self):
         """Test error when file doesn't exist."""
         parser = TextParser()
@@ -103,6 +115,29 @@ class TestParserRegistry:
         retrieved = registry.get_parser("test.txt")
         assert retrieved is custom
 
+    def test_only_matching_parsers_consulted(self):
+        """Test that parsers declaring other extensions are not asked."""
+        registry = ParserRegistry()
+        asked = []
+
+        class HTMLOnlyParser:
+            SUPPORTED_EXTENSIONS = frozenset({".html"})
+
+            def can_parse(self, path):
+                asked.append(path)
+                return path.endswith(".html")
+
+            def parse(self, path):
+                return ""
+
+        registry.register(HTMLOnlyParser())
+        text_parser = TextParser()
+        registry.register(text_parser)
+
+        assert registry.get_parser("a.txt") is text_parser
+        assert registry.get_parser("B.TXT") is text_parser
+        assert asked == []
+
     def test_parse_through_registry(self, temp_dir):
         """Test parsing through registry convenience method."""
         registry = ParserRegistry()
@@ -118,6 +153,8 @@ class TestParserRegistry:
 class TestGlobalRegistry:
     """Tests for global parser registry functions."""
 
+    pytestmark = pytest.mark.io
+
     def test_parse_document_txt(self, temp_dir):
         """Test global parse_document function with text file."""
         text_file = temp_dir / "sample.txt"
@@ -4,13 +4,51 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+from PIL import Image
+
 # Skip all tests if PDF dependencies aren't installed
 pytest.importorskip("pdfplumber")
 
-from doc2json.core.parsers.pdf import PDFParser, PDFPageResult, MIN_CHARS_PER_PAGE
+from doc2json.core.parsers.pdf import PDFParser, PDFPageResult, MIN_CHARS_PER_PAGE, _which_tesseract
 from doc2json.core.exceptions import ParserError
 
 
+@pytest.fixture(autouse=True)
+def pdfplumber_backend(monkeypatch):
+    """Resolve backend='auto' to pdfplumber so the pdfplumber mocks apply
+    whether or not PyMuPDF is installed."""
+    monkeypatch.setattr("doc2json.core.parsers.pdf._pymupdf_available", lambda: False)
+
+
+@pytest.fixture(autouse=True)
+def clear_tesseract_lookup():
+    """Forget the memoized Tesseract path so each test's shutil.which patch applies."""
+    _which_tesseract.cache_clear()
+    yield
+    _which_tesseract.cache_clear()
+
+
+@pytest.fixture
+def patched_pdfplumber(monkeypatch):
+    """Replace pdfplumber.open with a mock; tests set its return_value."""
+    mock_open = MagicMock()
+    monkeypatch.setattr("doc2json.core.parsers.pdf.pdfplumber.open", mock_open)
+    return mock_open
+
+
+@pytest.fixture
+def make_mock_pdf():
+    """Factory for a mocked pdfplumber document with one page per text."""
+    def _factory(page_texts):
+        pages = [Mock(extract_text=Mock(return_value=t)) for t in page_texts]
+        mock_pdf = MagicMock()
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.pages = pages
+        return mock_pdf
+
+    return _factory
+
+
 class TestPDFParserBasics:
     """Basic tests for PDFParser."""
 
@@ -34,6 +72,7 @@ class TestPDFParserBasics:
         assert parser.min_chars_per_page == MIN_CHARS_PER_PAGE
         assert parser.ocr_enabled is True
         assert parser.ocr_language == "eng"
+        assert parser.backend == "pdfplumber"
 
     def test_custom_settings(self):
         """Test custom parser settings."""
@@ -41,79 +80,74 @@ class TestPDFParserBasics:
             min_chars_per_page=100,
             ocr_enabled=False,
             ocr_language="fra",
+            workers=4,
         )
         assert parser.min_chars_per_page == 100
         assert parser.ocr_enabled is False
         assert parser.ocr_language == "fra"
+        assert parser.workers == 4
 
 
 class TestPDFParserWithMocks:
     """Tests using mocked pdfplumber."""
 
-    @patch("doc2json.core.parsers.pdf.pdfplumber.open")
     @patch("os.path.exists", return_value=True)
-    def test_parse_text_based_pdf(self, mock_exists, mock_open):
+    def test_parse_text_based_pdf(self, mock_exists, patched_pdfplumber, make_mock_pdf):
         """Test parsing a PDF with extractable text."""
         parser = PDFParser()
-
-        # Mock pdfplumber
-        mock_page = Mock()
-        mock_page.extract_text.return_value = "This is the content of page 1. " * 10
-
-        mock_pdf = Mock()
-        mock_pdf.pages = [mock_page]
-        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-        mock_pdf.__exit__ = Mock(return_value=False)
-        mock_open.return_value = mock_pdf
+        patched_pdfplumber.return_value = make_mock_pdf(["This is the content of page 1. " * 10])
 
         result = parser.parse("/fake/path.pdf")
 
         assert "This is the content" in result
-        mock_page.extract_text.assert_called_once()
+        patched_pdfplumber.return_value.pages[0].extract_text.assert_called_once()
 
-    @patch("doc2json.core.parsers.pdf.pdfplumber.open")
     @patch("os.path.exists", return_value=True)
-    def test_parse_multi_page_pdf(self, mock_exists, mock_open):
+    def test_parse_multi_page_pdf(self, mock_exists, patched_pdfplumber, make_mock_pdf):
         """Test parsing a multi-page PDF."""
         parser = PDFParser()
-
-        # Mock pages
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = "Page 1 content " * 20
-
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "Page 2 content " * 20
-
-        mock_pdf = Mock()
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-        mock_pdf.__exit__ = Mock(return_value=False)
-        mock_open.return_value = mock_pdf
+        mock_pdf = make_mock_pdf(["Page 1 content " * 20, "Page 2 content " * 20])
+        mock_page1, mock_page2 = mock_pdf.pages
+        patched_pdfplumber.return_value = mock_pdf
 
         result = parser.parse("/fake/path.pdf")
 
         assert "Page 1 content" in result
         assert "Page 2 content" in result
+        # Each page's cached layout is released once its text is taken
+        mock_page1.close.assert_called_once()
+        mock_page2.close.assert_called_once()
 
-    @patch("doc2json.core.parsers.pdf.pdfplumber.open")
     @patch("os.path.exists", return_value=True)
-    def test_parse_empty_page(self, mock_exists, mock_open):
+    def test_parse_empty_page(self, mock_exists, patched_pdfplumber, make_mock_pdf):
         """Test handling pages with no text."""
         parser = PDFParser(ocr_enabled=False)
-
-        mock_page = Mock()
-        mock_page.extract_text.return_value = ""
-
-        mock_pdf = Mock()
-        mock_pdf.pages = [mock_page]
-        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-        mock_pdf.__exit__ = Mock(return_value=False)
-        mock_open.return_value = mock_pdf
+        patched_pdfplumber.return_value = make_mock_pdf([""])
 
         result = parser.parse("/fake/path.pdf")
 
         assert result == ""
 
+    @patch("doc2json.core.parsers.pdf.ProcessPoolExecutor")
+    @patch("os.path.exists", return_value=True)
+    def test_parse_with_workers(self, mock_exists, mock_pool, patched_pdfplumber, make_mock_pdf):
+        """Test that pages are split into one ordered range per worker."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Threads stand in for processes so the mocks are shared
+        mock_pool.side_effect = ThreadPoolExecutor
+        texts = [f"Page {i} content " * 10 for i in range(5)]
+        patched_pdfplumber.return_value = make_mock_pdf(texts)
+
+        result = PDFParser(workers=2).parse("/fake/path.pdf")
+
+        mock_pool.assert_called_once_with(max_workers=2)
+        assert [result.index(f"Page {i} content") for i in range(5)] == sorted(
+            result.index(f"Page {i} content") for i in range(5)
+        )
+        for page in patched_pdfplumber.return_value.pages:
+            page.extract_text.assert_called_once()
+
     def test_parse_page_result_dataclass(self):
         """Test PDFPageResult dataclass."""
         result = PDFPageResult(page_num=0, text="Hello", used_ocr=False)
@@ -124,6 +158,147 @@ class TestPDFParserWithMocks:
         ocr_result = PDFPageResult(page_num=1, text="OCR text", used_ocr=True)
         assert ocr_result.used_ocr is True
 
+    def test_page_result_is_frozen(self):
+        """Test that page results are immutable and carry no instance dict."""
+        from dataclasses import FrozenInstanceError
+
+        result = PDFPageResult(page_num=0, text="Hello", used_ocr=False)
+
+        with pytest.raises(FrozenInstanceError):
+            result.text = "Changed"
+        assert not hasattr(result, "__dict__")
+
+
+class TestPDFParserPyMuPDF:
+    """Tests for the PyMuPDF text extraction backend."""
+
+    @pytest.fixture
+    def fake_fitz(self, monkeypatch):
+        """Install a stand-in fitz module whose documents are lists of pages."""
+        import sys
+        import types
+
+        fitz = types.SimpleNamespace(open=MagicMock())
+        monkeypatch.setitem(sys.modules, "fitz", fitz)
+        monkeypatch.setattr("doc2json.core.parsers.pdf._pymupdf_available", lambda: True)
+        return fitz
+
+    def _document(self, *texts):
+        pages = []
+        for text in texts:
+            page = Mock()
+            page.get_text.return_value = text
+            pages.append(page)
+        doc = MagicMock()
+        doc.__enter__.return_value = pages
+        return doc
+
+    def test_auto_prefers_pymupdf(self, fake_fitz):
+        """Test that backend='auto' picks PyMuPDF when it is installed."""
+        assert PDFParser().backend == "pymupdf"
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            PDFParser(backend="pdfium")
+
+        assert "pdfium" in str(exc_info.value)
+
+    @patch("os.path.exists", return_value=True)
+    def test_parse_with_pymupdf(self, mock_exists, fake_fitz):
+        """Test parsing pages through PyMuPDF's get_text."""
+        fake_fitz.open.return_value = self._document("Page 1 content " * 10, "Page 2 content " * 10)
+
+        result = PDFParser(backend="pymupdf").parse("/fake/path.pdf")
+
+        assert "Page 1 content" in result
+        assert "Page 2 content" in result
+        fake_fitz.open.assert_called_once_with("/fake/path.pdf")
+
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string", return_value="Scanned text")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_ocr_renders_with_pixmap(self, mock_which, mock_convert, mock_ocr, fake_fitz):
+        """Test that OCR pages are rendered by PyMuPDF instead of poppler."""
+        page = Mock()
+        page.get_text.return_value = ""
+        page.get_images.return_value = [("xref",)]
+        page.get_pixmap.return_value = Mock(width=2, height=1, samples=bytes(6))
+
+        result = PDFParser(backend="pymupdf").parse_page("/fake/path.pdf", page, 0)
+
+        assert result.used_ocr is True
+        assert result.text == "Scanned text"
+        page.get_pixmap.assert_called_once()
+        mock_convert.assert_not_called()
+        assert mock_ocr.call_args[0][0].size == (2, 1)
+
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string", return_value="Inline scan")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_inline_image_triggers_ocr(self, mock_which, mock_ocr, fake_fitz):
+        """Test that a page whose only image is inline (BI/ID/EI) is OCR'd."""
+        page = Mock()
+        page.get_text.return_value = ""
+        page.get_images.return_value = []
+        page.get_image_info.return_value = [{"number": 0, "xref": 0}]
+        page.get_pixmap.return_value = Mock(width=2, height=1, samples=bytes(6))
+
+        result = PDFParser(backend="pymupdf").parse_page("/fake/path.pdf", page, 0)
+
+        assert result.used_ocr is True
+        assert result.text == "Inline scan"
+
+    def test_page_without_images_is_blank(self, fake_fitz):
+        """Test that a low-text page with no images of either kind skips OCR."""
+        page = Mock()
+        page.get_text.return_value = ""
+        page.get_images.return_value = []
+        page.get_image_info.return_value = []
+
+        result = PDFParser(backend="pymupdf").parse_page("/fake/path.pdf", page, 0)
+
+        assert result.used_ocr is False
+        page.get_pixmap.assert_not_called()
+
+    @patch("doc2json.core.parsers.pdf._ocr_batch")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_scanned_pages_ocr_in_batches(self, mock_which, mock_convert, mock_batch, fake_fitz):
+        """Test that PyMuPDF page renders share Tesseract runs of ocr_chunk_size pages."""
+        pages = []
+        for n in range(4):
+            pixmap = Mock()
+            pixmap.save.side_effect = lambda path, n=n: Image.new("L", (4, 4), color=n).save(path)
+            page = Mock()
+            page.get_text.return_value = ""
+            page.get_pixmap.return_value = pixmap
+            pages.append(page)
+        doc = MagicMock()
+        doc.__enter__.return_value = pages
+        fake_fitz.open.return_value = doc
+
+        def ocr(paths, lang):
+            texts = []
+            for path in paths:
+                with Image.open(path) as image:
+                    texts.append(f"Scanned {image.getpixel((0, 0))}")
+            return texts
+
+        mock_batch.side_effect = ocr
+
+        with patch("os.path.exists", return_value=True):
+            text = PDFParser(backend="pymupdf", ocr_chunk_size=2).parse("/fake/path.pdf")
+
+        assert text.split("\n\n") == [f"Scanned {n}" for n in range(4)]
+        assert [len(c.args[0]) for c in mock_batch.call_args_list] == [2, 2]
+        mock_convert.assert_not_called()
+
+    def test_page_count_with_pymupdf(self, fake_fitz):
+        """Test page counting through PyMuPDF."""
+        fake_fitz.open.return_value = self._document("a", "b", "c")
+
+        assert PDFParser(backend="pymupdf").get_page_count("/fake/path.pdf") == 3
+
 
 class TestPDFParserOCRDetection:
     """Tests for image-based PDF detection."""
@@ -169,8 +344,8 @@ class TestPDFParserOCRFallback:
         mock_page.extract_text.return_value = "X"
 
         # Mock OCR dependencies
-        mock_image = Mock()
-        mock_convert.return_value = [mock_image]
+        page_image = Image.new("L", (10, 10))
+        mock_convert.return_value = [page_image]
         mock_ocr.return_value = "OCR extracted text here"
 
         result = parser.parse_page("/fake/path.pdf", mock_page, 0)
@@ -180,6 +355,195 @@ class TestPDFParserOCRFallback:
         mock_convert.assert_called_once()
         mock_ocr.assert_called_once()
 
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_ocr_cache_hit(self, mock_which, mock_convert, mock_ocr):
+        """Test that an identical page image is only OCR'd once per language."""
+        parser = PDFParser(min_chars_per_page=50, ocr_enabled=True)
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = ""
+        mock_convert.side_effect = lambda *args, **kwargs: [Image.new("L", (10, 10), color=255)]
+        mock_ocr.return_value = "Scanned page text"
+
+        first = parser.parse_page("/fake/path.pdf", mock_page, 0)
+        second = parser.parse_page("/fake/path.pdf", mock_page, 1)
+
+        assert first.text == second.text == "Scanned page text"
+        assert second.used_ocr is True
+        assert mock_ocr.call_count == 1
+
+        parser.ocr_language = "fra"
+        parser.parse_page("/fake/path.pdf", mock_page, 0)
+        assert mock_ocr.call_count == 2
+
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_ocr_skipped_when_no_images(self, mock_which, mock_convert, mock_ocr):
+        """Test that a page with no text and no images is not rendered or OCR'd."""
+        parser = PDFParser(min_chars_per_page=50, ocr_enabled=True)
+
+        mock_page = Mock()
+        mock_page.extract_text.return_value = ""
+        mock_page.images = []
+
+        result = parser.parse_page("/fake/path.pdf", mock_page, 0)
+
+        assert result.text == ""
+        assert result.used_ocr is False
+        mock_convert.assert_not_called()
+        mock_ocr.assert_not_called()
+
+    @staticmethod
+    def _render(path, first_page, last_page, output_folder, **kwargs):
+        """Stand-in for pdf2image that writes one image per page, shaded by page number."""
+        paths = []
+        for n in range(first_page, last_page + 1):
+            image_path = f"{output_folder}/page-{n:02d}.png"
+            Image.new("L", (4, 4), color=n).save(image_path)
+            paths.append(image_path)
+        return paths
+
+    @patch("doc2json.core.parsers.pdf._ocr_batch")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_ocr_pages_rendered_in_chunks(
+        self, mock_which, mock_convert, mock_batch, patched_pdfplumber, tmp_path, make_mock_pdf
+    ):
+        """Test that scanned pages are rendered and OCR'd ocr_chunk_size pages at a time."""
+        pdf_path = tmp_path / "scanned.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        patched_pdfplumber.return_value = make_mock_pdf([""] * 30)
+
+        def ocr(paths, lang):
+            texts = []
+            for path in paths:
+                with Image.open(path) as image:
+                    texts.append(f"Scanned {image.getpixel((0, 0))}")
+            return texts
+
+        mock_convert.side_effect = self._render
+        mock_batch.side_effect = ocr
+
+        text = PDFParser(ocr_chunk_size=10).parse(str(pdf_path))
+
+        assert mock_convert.call_count == 3
+        assert [c.kwargs["first_page"] for c in mock_convert.call_args_list] == [1, 11, 21]
+        assert mock_batch.call_count == 3
+        assert text.split("\n\n") == [f"Scanned {n}" for n in range(1, 31)]
+
+    @patch("doc2json.core.parsers.pdf.subprocess.run")
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_ocr_batch_single_subprocess(
+        self, mock_which, mock_convert, mock_ocr, mock_run,
+        patched_pdfplumber, tmp_path, make_mock_pdf,
+    ):
+        """Test that several scanned pages are OCR'd by one Tesseract process."""
+        pdf_path = tmp_path / "scanned.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        patched_pdfplumber.return_value = make_mock_pdf(["", ""])
+        mock_convert.side_effect = self._render
+
+        def tesseract(args, **kwargs):
+            _, filelist, outbase, *_ = args
+            with open(filelist) as f:
+                assert len(f.read().split()) == 2
+            with open(f"{outbase}.txt", "w") as f:
+                f.write("First page\n\x0cSecond page\n\x0c")
+
+        mock_run.side_effect = tesseract
+
+        text = PDFParser().parse(str(pdf_path))
+
+        mock_run.assert_called_once()
+        mock_ocr.assert_not_called()
+        assert text == "First page\n\nSecond page"
+
+    @pytest.mark.parametrize("failure", ["tesseract_error", "page_count_mismatch", "bad_image"])
+    @patch("doc2json.core.parsers.pdf.subprocess.run")
+    @patch("doc2json.core.parsers.pdf.pytesseract.image_to_string", side_effect=OSError("bad"))
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_chunk_ocr_failure_keeps_text(
+        self, mock_which, mock_convert, mock_ocr, mock_run, failure,
+        patched_pdfplumber, tmp_path, make_mock_pdf,
+    ):
+        """Test that a failing OCR chunk degrades to the extracted text instead of raising."""
+        import subprocess
+
+        pdf_path = tmp_path / "scanned.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        patched_pdfplumber.return_value = make_mock_pdf(["p1", "p2", "p3"])
+
+        def render(*args, **kwargs):
+            paths = self._render(*args, **kwargs)
+            if failure == "bad_image":
+                with open(paths[0], "wb") as f:
+                    f.write(b"not an image")
+            return paths
+
+        def tesseract(args, **kwargs):
+            if failure == "tesseract_error":
+                raise subprocess.CalledProcessError(1, args)
+            with open(f"{args[2]}.txt", "w") as f:
+                # Two pages of output, however many images were sent
+                f.write("First\n\x0cSecond\n\x0c")
+
+        mock_convert.side_effect = render
+        mock_run.side_effect = tesseract
+
+        text = PDFParser().parse(str(pdf_path))
+
+        if failure == "bad_image":
+            # Only the unreadable page falls back; the other two are OCR'd
+            assert text == "p1\n\nFirst\n\nSecond"
+        else:
+            assert text == "p1\n\np2\n\np3"
+
+    @patch("doc2json.core.parsers.pdf._ocr_batch")
+    @patch("doc2json.core.parsers.pdf.pdf2image.convert_from_path")
+    @patch("shutil.which", return_value="/usr/bin/tesseract")
+    def test_render_count_mismatch_skips_chunk(
+        self, mock_which, mock_convert, mock_batch, patched_pdfplumber, tmp_path, make_mock_pdf
+    ):
+        """Test that a chunk rendered to the wrong number of images is not OCR'd."""
+        pdf_path = tmp_path / "scanned.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        patched_pdfplumber.return_value = make_mock_pdf(["p1", "p2"])
+        mock_convert.side_effect = lambda *args, **kwargs: self._render(*args, **kwargs)[:1]
+
+        text = PDFParser().parse(str(pdf_path))
+
+        assert text == "p1\n\np2"
+        mock_batch.assert_not_called()
+
+    def test_ocr_batch_page_count_must_match(self, tmp_path):
+        """Test that _ocr_batch rejects output that does not split into one text per image."""
+        from doc2json.core.parsers.pdf import _ocr_batch
+
+        def tesseract(output):
+            def run(args, **kwargs):
+                with open(f"{args[2]}.txt", "w") as f:
+                    f.write(output)
+            return run
+
+        with patch("doc2json.core.parsers.pdf.subprocess.run", side_effect=tesseract("A\x0cB\x0c")):
+            assert _ocr_batch(["a.png", "b.png"], "eng") == ["A", "B"]
+        with patch("doc2json.core.parsers.pdf.subprocess.run", side_effect=tesseract("A\x0cB\x0cC\x0c")):
+            with pytest.raises(RuntimeError, match="3 pages for 2 images"):
+                _ocr_batch(["a.png", "b.png"], "eng")
+
+    def test_page_runs(self):
+        """Test grouping of scanned pages into consecutive render chunks."""
+        from doc2json.core.parsers.pdf import _page_runs
+
+        assert list(_page_runs([0, 1, 2, 5, 6, 9], 2)) == [[0, 1], [2], [5, 6], [9]]
+        assert list(_page_runs([], 10)) == []
+
     def test_ocr_disabled_skips_ocr(self):
         """Test that OCR is skipped when disabled."""
         parser = PDFParser(min_chars_per_page=50, ocr_enabled=False)
@@ -214,22 +578,10 @@ class TestPDFParserOCRFallback:
 class TestPDFParserAnalyze:
     """Tests for PDF analysis functionality."""
 
-    @patch("doc2json.core.parsers.pdf.pdfplumber.open")
-    def test_analyze_text_pdf(self, mock_open):
+    def test_analyze_text_pdf(self, patched_pdfplumber, make_mock_pdf):
         """Test analyzing a text-based PDF."""
         parser = PDFParser(min_chars_per_page=50)
-
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = "A" * 100
-
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "B" * 200
-
-        mock_pdf = Mock()
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-        mock_pdf.__exit__ = Mock(return_value=False)
-        mock_open.return_value = mock_pdf
+        patched_pdfplumber.return_value = make_mock_pdf(["A" * 100, "B" * 200])
 
         analysis = parser.analyze("/fake/path.pdf")
 
@@ -241,22 +593,15 @@ class TestPDFParserAnalyze:
         assert analysis["likely_scanned"] is False
         assert analysis["ocr_recommended"] is False
 
-    @patch("doc2json.core.parsers.pdf.pdfplumber.open")
-    def test_analyze_scanned_pdf(self, mock_open):
+    def test_analyze_scanned_pdf(self, patched_pdfplumber, make_mock_pdf):
         """Test analyzing a scanned PDF."""
         parser = PDFParser(min_chars_per_page=50)
 
-        mock_page1 = Mock()
-        mock_page1.extract_text.return_value = ""  # No text
-
-        mock_page2 = Mock()
-        mock_page2.extract_text.return_value = "X"  # Minimal text
-
-        mock_pdf = Mock()
-        mock_pdf.pages = [mock_page1, mock_page2]
-        mock_pdf.__enter__ = Mock(return_value=mock_pdf)
-        mock_pdf.__exit__ = Mock(return_value=False)
-        mock_open.return_value = mock_pdf
+        # No text, then minimal text, both over an embedded image
+        mock_pdf = make_mock_pdf(["", "X"])
+        for page in mock_pdf.pages:
+            page.images = [{"name": "Im0"}]
+        patched_pdfplumber.return_value = mock_pdf
 
         analysis = parser.analyze("/fake/path.pdf")
 
@@ -266,6 +611,139 @@ class TestPDFParserAnalyze:
         assert analysis["likely_scanned"] is True
         assert analysis["ocr_recommended"] is True
 
+    def test_analyze_blank_pages_not_scanned(self, patched_pdfplumber, make_mock_pdf):
+        """Test that low-text pages without images count as blank, not scanned."""
+        parser = PDFParser(min_chars_per_page=50)
+
+        # A text page, a scanned page, then two blank pages
+        mock_pdf = make_mock_pdf(["A" * 100, "", "", ""])
+        for page, images in zip(mock_pdf.pages, [[], [{"name": "Im0"}], [], []]):
+            page.images = images
+        patched_pdfplumber.return_value = mock_pdf
+
+        analysis = parser.analyze("/fake/path.pdf")
+
+        assert analysis["text_pages"] == 1
+        assert analysis["image_pages"] == 1
+        assert analysis["blank_pages"] == 2
+        assert analysis["likely_scanned"] is False
+        assert analysis["ocr_recommended"] is True
+
+    def test_analyze_samples_only_first_n(self, patched_pdfplumber, make_mock_pdf):
+        """Test that sample_pages limits how many pages are read."""
+        parser = PDFParser(min_chars_per_page=50)
+
+        # First 20 pages: 15 text pages and 5 scanned
+        texts = ["A" * 100 if i % 4 else "" for i in range(1000)]
+        patched_pdfplumber.return_value = make_mock_pdf(texts)
+        pages = patched_pdfplumber.return_value.pages
+
+        analysis = parser.analyze("/fake/path.pdf", sample_pages=20)
+
+        assert sum(p.extract_text.call_count for p in pages) == 20
+        assert analysis["total_pages"] == 1000
+        assert analysis["sampled_pages"] == 20
+        assert analysis["text_pages"] == 750
+        assert analysis["image_pages"] == 250
+        assert analysis["total_characters"] == 75000
+        assert analysis["likely_scanned"] is False
+
+    def test_analyze_sampled_counts_add_up(self, patched_pdfplumber, make_mock_pdf):
+        """Test that extrapolated counts stay non-negative and sum to an odd total."""
+        parser = PDFParser(min_chars_per_page=50)
+        mock_pdf = make_mock_pdf(["A" * 100, ""] + ["A" * 100] * 5)
+        for page in mock_pdf.pages:
+            page.images = []
+        patched_pdfplumber.return_value = mock_pdf
+
+        analysis = parser.analyze("/fake/path.pdf", sample_pages=2)
+
+        assert analysis["total_pages"] == 7
+        assert analysis["text_pages"] + analysis["blank_pages"] == 7
+        assert min(analysis["text_pages"], analysis["blank_pages"]) >= 3
+        assert analysis["image_pages"] == 0
+        assert analysis["ocr_recommended"] is False
+
+    def test_scale_counts(self):
+        """Test largest-remainder scaling of sampled page counts."""
+        from doc2json.core.parsers.pdf import _scale_counts
+
+        assert _scale_counts([1, 0, 1], 2, 7) == [4, 0, 3]
+        assert _scale_counts([1, 1, 1], 3, 10) == [4, 3, 3]
+        assert _scale_counts([15, 5, 0], 20, 1000) == [750, 250, 0]
+
+    def test_analysis_attribute_and_key_access(self):
+        """Test that PDFAnalysis fields read the same as attributes and keys."""
+        from doc2json.core.parsers.pdf import PDFAnalysis
+
+        analysis = PDFAnalysis(
+            total_pages=4, sampled_pages=4, text_pages=1,
+            image_pages=2, blank_pages=1, total_characters=200,
+        )
+
+        assert analysis.avg_chars_per_page == analysis["avg_chars_per_page"] == 50
+        assert analysis["likely_scanned"] is True
+        assert analysis.ocr_recommended is True
+        with pytest.raises(KeyError):
+            analysis["missing"]
+
+    def test_analysis_is_a_mapping(self):
+        """Test that PDFAnalysis still works wherever the old dict did."""
+        import json
+        from doc2json.core.parsers.pdf import PDFAnalysis
+
+        analysis = PDFAnalysis(
+            total_pages=2, sampled_pages=2, text_pages=2,
+            image_pages=0, blank_pages=0, total_characters=300,
+        )
+
+        assert "likely_scanned" in analysis
+        assert "missing" not in analysis
+        assert "__class__" not in analysis
+        assert analysis.get("missing", 0) == 0
+        assert analysis.get("total_pages") == 2
+        assert list(analysis.keys())[-1] == "ocr_recommended"
+        assert dict(**analysis)["avg_chars_per_page"] == 150
+        assert analysis == dict(analysis)
+        assert analysis != {**analysis, "total_pages": 3}
+        assert analysis == PDFAnalysis(
+            total_pages=2, sampled_pages=2, text_pages=2,
+            image_pages=0, blank_pages=0, total_characters=300,
+        )
+        assert json.loads(json.dumps(dict(analysis))) == {
+            "total_pages": 2,
+            "sampled_pages": 2,
+            "text_pages": 2,
+            "image_pages": 0,
+            "blank_pages": 0,
+            "total_characters": 300,
+            "avg_chars_per_page": 150.0,
+            "likely_scanned": False,
+            "ocr_recommended": False,
+        }
+
+    def test_analyze_is_cached(self, patched_pdfplumber, tmp_path, make_mock_pdf):
+        """Test that analyzing an unchanged file reuses the previous result."""
+        import os
+
+        pdf_path = tmp_path / "doc.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        parser = PDFParser(min_chars_per_page=50)
+        patched_pdfplumber.return_value = make_mock_pdf(["A" * 100])
+
+        first = parser.analyze(str(pdf_path))
+        second = parser.analyze(str(pdf_path))
+
+        assert patched_pdfplumber.call_count == 1
+        assert second is first  # Frozen, so safe to share
+        assert second["total_pages"] == 1
+
+        # A changed file is analyzed again
+        pdf_path.write_bytes(b"%PDF-1.4 changed")
+        os.utime(pdf_path, ns=(0, 0))
+        parser.analyze(str(pdf_path))
+        assert patched_pdfplumber.call_count == 2
+
 
 class TestPDFParserErrors:
     """Tests for error handling."""
@@ -290,6 +768,16 @@ class TestPDFParserErrors:
 
             assert "Tesseract" in str(exc_info.value)
 
+    def test_tesseract_lookup_memoized(self):
+        """Test that the PATH search for Tesseract runs only once."""
+        parser = PDFParser(ocr_enabled=True)
+
+        with patch("shutil.which", return_value="/usr/bin/tesseract") as mock_which:
+            parser._check_tesseract()
+            parser._check_tesseract()
+
+        mock_which.assert_called_once_with("tesseract")
+
 
 class TestPDFParserIntegration:
     """Integration tests that would use real PDF files.
@@ -82,6 +82,19 @@ def test_extraction_engine_ollama_defaults(mock_modules):
         api_key="ollama"
     )
 
+def test_client_is_reused(mock_modules):
+    mock_openai, mock_instructor = mock_modules
+
+    engine = ExtractionEngine(provider="ollama", model="llama3")
+
+    first = engine._get_client()
+    second = engine._get_client()
+
+    # One HTTP client per engine, so connections to the server are pooled
+    assert first is second
+    assert mock_openai.OpenAI.call_count == 1
+    assert mock_instructor.from_openai.call_count == 1
+
 def test_extraction_engine_unsupported_provider():
     engine = ExtractionEngine(provider="invalid")
     with pytest.raises(ProviderError):
@@ -167,6 +167,24 @@ class TestAnalyzeSchema:
 
         assert len(analysis.enums) == 1  # Not 2
 
+    def test_pep604_optional_nested(self):
+        """Test that X | None annotations are unwrapped like Optional[X]."""
+        class Address(BaseModel):
+            street: str
+
+        class Person(BaseModel):
+            address: Address | None = None
+            age: int | None = None
+
+        class LegacyPerson(BaseModel):
+            address: Optional[Address] = None
+            age: Optional[int] = None
+
+        analysis = analyze_schema(Person)
+
+        assert analysis.nested_models == ["Address"]
+        assert analysis.estimated_output_tokens == analyze_schema(LegacyPerson).estimated_output_tokens
+
     def test_custom_name(self):
         """Test providing custom name."""
         class MySchema(BaseModel):
@@ -175,6 +193,14 @@ class TestAnalyzeSchema:
         analysis = analyze_schema(MySchema, name="custom_name")
 
         assert analysis.name == "custom_name"
+        assert analyze_schema(MySchema).name == "MySchema"
+
+    def test_analyze_schema_is_memoized(self):
+        """Test that repeated analysis of a class returns the cached result."""
+        class Cached(BaseModel):
+            field: str
+
+        assert analyze_schema(Cached) is analyze_schema(Cached)
 
 
 class TestSchemaAnalysisFormatting:
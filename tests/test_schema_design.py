@@ -39,9 +39,8 @@ def test_design_initial_schema_anthropic(mock_anthropic, mock_llm_response):
     # Setup mock
     mock_client = MagicMock()
     mock_anthropic.return_value = mock_client
-    mock_response = MagicMock()
-    mock_response.content = [MagicMock(text=f"```python\n{mock_llm_response}\n```")]
-    mock_client.messages.create.return_value = mock_response
+    stream = mock_client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = iter(["```python\n", mock_llm_response, "\n```"])
 
     # Run
     code = design_initial_schema(
@@ -59,6 +58,32 @@ def test_design_initial_schema_anthropic(mock_anthropic, mock_llm_response):
     assert "Field(description=" in code
     assert "datetime.date" in code
 
+@patch("anthropic.Anthropic")
+def test_design_initial_schema_stops_early(mock_anthropic, mock_llm_response):
+    """Streaming stops as soon as the code block is closed."""
+    consumed = []
+
+    def chunks():
+        for chunk in ["Here is the schema:\n``", "`python\n", mock_llm_response, "``", "`\n",
+                      "Some commentary after the code.", "And more."]:
+            consumed.append(chunk)
+            yield chunk
+
+    mock_client = MagicMock()
+    mock_anthropic.return_value = mock_client
+    stream = mock_client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = chunks()
+
+    code = design_initial_schema(
+        document_type="Invoice",
+        description="Extract invoice details",
+        provider="anthropic",
+    )
+
+    assert code == mock_llm_response.strip()
+    assert "Some commentary after the code." not in consumed
+    mock_client.messages.stream.return_value.__exit__.assert_called_once()
+
 def test_archetype_prompt_inclusion():
     with patch("doc2json.core.schema_generator.get_archetype_prompt") as mock_get_arch:
         mock_get_arch.return_value = "ARCHETYPE CONTEXT"
@@ -68,9 +93,8 @@ def test_archetype_prompt_inclusion():
         with patch("anthropic.Anthropic") as mock_anthropic:
             mock_client = MagicMock()
             mock_anthropic.return_value = mock_client
-            mock_response = MagicMock()
-            mock_response.content = [MagicMock(text="code")]
-            mock_client.messages.create.return_value = mock_response
+            stream = mock_client.messages.stream.return_value.__enter__.return_value
+            stream.text_stream = iter(["code"])
 
             design_initial_schema(
                 document_type="Invoice",
@@ -83,22 +107,20 @@ def test_archetype_prompt_inclusion():
 
 def test_generated_code_validity(mock_llm_response):
     """Verify that the generated code can actually be executed and loaded."""
-    # Create a temporary file
-    test_schema_path = "schemas/test_generated.py"
-    os.makedirs("schemas", exist_ok=True)
-    
-    try:
-        with open(test_schema_path, "w") as f:
-            f.write(mock_llm_response)
-        
-        # Try to load it using doc2json's loader
-        from doc2json.core.extraction import load_schema
-        schema_class = load_schema("test_generated")
-        
-        assert schema_class.__name__ == "Schema"
-        assert "invoice_number" in schema_class.model_fields
-        assert "items" in schema_class.model_fields
-        
-    finally:
-        if os.path.exists(test_schema_path):
-            os.remove(test_schema_path)
+    from doc2json.core.extraction import load_schema_from_source
+
+    schema_class = load_schema_from_source(mock_llm_response, "test_generated")
+
+    assert schema_class.__name__ == "Schema"
+    assert "invoice_number" in schema_class.model_fields
+    assert "items" in schema_class.model_fields
+    assert not os.path.exists("schemas/test_generated.py")
+
+
+def test_generated_code_without_schema_class():
+    """Verify that code lacking a Schema class is rejected."""
+    from doc2json.core.extraction import load_schema_from_source
+    from doc2json.core.exceptions import SchemaValidationError
+
+    with pytest.raises(SchemaValidationError):
+        load_schema_from_source("x = 1\n", "broken")
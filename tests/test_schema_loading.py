@@ -1,5 +1,7 @@
 """Tests for schema loading functionality."""
 
+import importlib.util
+import py_compile
 import pytest
 from pathlib import Path
 from pydantic import BaseModel
@@ -7,142 +9,159 @@ from pydantic import BaseModel
 from doc2json.core.extraction import load_schema, load_schema_module, get_schema_version
 from doc2json.core.exceptions import SchemaNotFoundError, SchemaValidationError
 
+# One worker per file under `pytest -n auto --dist loadgroup`, so the
+# module-scoped schemas directory is created once and never shared
+pytestmark = pytest.mark.xdist_group("schema_loading")
 
-class TestLoadSchemaModule:
-    """Tests for load_schema_module function."""
 
-    def test_load_valid_module(self, temp_dir, sample_schema_code):
-        """Test loading a valid schema module."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "invoice.py"
-        schema_file.write_text(sample_schema_code)
+NO_SCHEMA_SRC = b"""
+from pydantic import BaseModel
 
-        module = load_schema_module("invoice", str(schemas_dir))
+class Invoice(BaseModel):
+    title: str
+"""
 
-        assert hasattr(module, "Schema")
-        assert hasattr(module, "__version__")
+NOT_BM_SRC = b"""
+class Schema:
+    title: str
+"""
 
-    def test_missing_schema_file(self, temp_dir):
-        """Test error when schema file doesn't exist."""
-        with pytest.raises(SchemaNotFoundError) as exc_info:
-            load_schema_module("nonexistent", str(temp_dir))
+SYNTAX_SRC = b"""
+from pydantic import BaseModel
 
-        assert "Schema file not found" in str(exc_info.value)
+class Schema(BaseModel)
+    title: str  # missing colon above
+"""
 
+IMPORT_SRC = b"""
+from nonexistent_package import Something
 
-class TestLoadSchema:
-    """Tests for load_schema function."""
+class Schema(Something):
+    title: str
+"""
 
-    def test_load_valid_schema(self, temp_dir, sample_schema_code):
-        """Test loading a valid Pydantic schema."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "test.py"
-        schema_file.write_text(sample_schema_code)
 
-        schema_class = load_schema("test", str(schemas_dir))
+@pytest.fixture(scope="module")
+def schemas_dir(tmp_path_factory):
+    """Schemas directory shared by the module; tests write files named after themselves."""
+    return tmp_path_factory.mktemp("schemas_shared")
 
-        assert issubclass(schema_class, BaseModel)
-        assert "title" in schema_class.model_fields
 
-    def test_schema_without_schema_class(self, temp_dir):
-        """Test error when module doesn't define Schema class."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "bad.py"
-        schema_file.write_text("""
-from pydantic import BaseModel
+@pytest.fixture(scope="module")
+def sample_schema_file(schemas_dir, sample_schema_code):
+    """The sample schema written once as schemas/sample.py for the whole module.
 
-class Invoice(BaseModel):
-    title: str
-""")
+    Its bytecode is compiled into __pycache__ up front, where the source
+    loader looks for it, so loading the schema skips compile().
+    """
+    schema_file = schemas_dir / "sample.py"
+    schema_file.write_text(sample_schema_code)
+    py_compile.compile(str(schema_file), doraise=True)
+    return schema_file
 
-        with pytest.raises(SchemaValidationError) as exc_info:
-            load_schema("bad", str(schemas_dir))
 
-        assert "must define a 'Schema' class" in str(exc_info.value)
+@pytest.fixture(scope="class")
+def sample_schema_class(schemas_dir, sample_schema_file):
+    """The loaded sample Schema class and its JSON schema, shared within a test class."""
+    schema_class = load_schema("sample", str(schemas_dir))
+    return schema_class, schema_class.model_json_schema()
 
-    def test_schema_not_basemodel(self, temp_dir):
-        """Test error when Schema is not a Pydantic BaseModel."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "not_pydantic.py"
-        schema_file.write_text("""
-class Schema:
-    title: str
-""")
 
-        with pytest.raises(SchemaValidationError) as exc_info:
-            load_schema("not_pydantic", str(schemas_dir))
+@pytest.fixture
+def schema_writer(schemas_dir):
+    """Write schemas_dir/<name>.py; the files and their bytecode are removed after the test."""
+    paths = []
 
-        assert "must inherit from pydantic.BaseModel" in str(exc_info.value)
+    def _write(name, source):
+        path = schemas_dir / f"{name}.py"
+        path.write_bytes(source)
+        paths.append(path)
+        return path
 
-    def test_schema_with_syntax_error(self, temp_dir):
-        """Test error handling for schema with syntax error."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "syntax_error.py"
-        schema_file.write_text("""
-from pydantic import BaseModel
+    yield _write
+    for path in paths:
+        path.unlink(missing_ok=True)
+        Path(importlib.util.cache_from_source(str(path))).unlink(missing_ok=True)
 
-class Schema(BaseModel)
-    title: str  # missing colon above
-""")
 
-        with pytest.raises(SyntaxError):
-            load_schema("syntax_error", str(schemas_dir))
+class TestLoadSchemaModule:
+    """Tests for load_schema_module function."""
 
-    def test_schema_with_import_error(self, temp_dir):
-        """Test error handling for schema with missing import."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "import_error.py"
-        schema_file.write_text("""
-from nonexistent_package import Something
+    def test_load_valid_module(self, schemas_dir, sample_schema_file):
+        """Test loading a valid schema module."""
+        module = load_schema_module("sample", str(schemas_dir))
 
-class Schema(Something):
-    title: str
-""")
+        assert hasattr(module, "Schema")
+        assert hasattr(module, "__version__")
 
-        with pytest.raises(ModuleNotFoundError):
-            load_schema("import_error", str(schemas_dir))
+    def test_module_reused_until_file_changes(self, schemas_dir, schema_writer, request):
+        """Test that an unchanged schema file is executed only once."""
+        import os
+
+        schema_file = schema_writer(request.node.name, b'__version__ = "1"\n')
+
+        first = load_schema_module(request.node.name, str(schemas_dir))
+        assert load_schema_module(request.node.name, str(schemas_dir)) is first
+
+        schema_file.write_bytes(b'__version__ = "22"\n')
+        os.utime(schema_file, ns=(0, 0))
+
+        assert load_schema_module(request.node.name, str(schemas_dir)).__version__ == "22"
+
+    def test_missing_schema_file(self, temp_dir):
+        """Test error when schema file doesn't exist."""
+        with pytest.raises(SchemaNotFoundError, match="Schema file not found"):
+            load_schema_module("nonexistent", str(temp_dir))
+
+
+class TestLoadSchema:
+    """Tests for load_schema function."""
+
+    def test_load_valid_schema(self, schemas_dir, sample_schema_file):
+        """Test loading a valid Pydantic schema."""
+        schema_class = load_schema("sample", str(schemas_dir))
+
+        assert issubclass(schema_class, BaseModel)
+        assert "title" in schema_class.model_fields
+
+    @pytest.mark.parametrize("source,exc,msg", [
+        (NO_SCHEMA_SRC, SchemaValidationError, "must define a 'Schema' class"),
+        (NOT_BM_SRC, SchemaValidationError, r"must inherit from pydantic\.BaseModel"),
+        (SYNTAX_SRC, SyntaxError, None),
+        (IMPORT_SRC, ModuleNotFoundError, None),
+    ], ids=["no_schema_class", "not_basemodel", "syntax_error", "import_error"])
+    def test_invalid_schema_file(self, schemas_dir, schema_writer, request, source, exc, msg):
+        """Test the error raised for each kind of broken schema file."""
+        name = f"err_{request.node.callspec.id}"
+        schema_writer(name, source)
+
+        with pytest.raises(exc, match=msg):
+            load_schema(name, str(schemas_dir))
 
 
 class TestGetSchemaVersion:
     """Tests for get_schema_version function."""
 
-    def test_get_version(self, temp_dir, sample_schema_code):
+    def test_get_version(self, schemas_dir, sample_schema_file):
         """Test getting version from schema file."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "versioned.py"
-        schema_file.write_text(sample_schema_code)
-
-        version = get_schema_version("versioned", str(schemas_dir))
+        version = get_schema_version("sample", str(schemas_dir))
         assert version == "1"
 
-    def test_version_not_defined(self, temp_dir):
+    def test_version_not_defined(self, schemas_dir, schema_writer, request):
         """Test default version when __version__ not defined."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "no_version.py"
-        schema_file.write_text("""
+        schema_writer(request.node.name, b"""
 from pydantic import BaseModel
 
 class Schema(BaseModel):
     title: str
 """)
 
-        version = get_schema_version("no_version", str(schemas_dir))
+        version = get_schema_version(request.node.name, str(schemas_dir))
         assert version == "unknown"
 
-    def test_numeric_version(self, temp_dir):
+    def test_numeric_version(self, schemas_dir, schema_writer, request):
         """Test schema with numeric version string."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "v2.py"
-        schema_file.write_text('''__version__ = "2"
+        schema_writer(request.node.name, b'''__version__ = "2"
 
 from pydantic import BaseModel
 
@@ -150,36 +169,37 @@ class Schema(BaseModel):
     title: str
 ''')
 
-        version = get_schema_version("v2", str(schemas_dir))
+        version = get_schema_version(request.node.name, str(schemas_dir))
         assert version == "2"
 
+    def test_get_version_does_not_execute_module(self, schemas_dir, schema_writer, request):
+        """Test that a literal __version__ is read without running the file."""
+        schema_writer(request.node.name, b'__version__ = "7"\n\nraise RuntimeError("executed")\n')
+
+        assert get_schema_version(request.node.name, str(schemas_dir)) == "7"
+
+    def test_computed_version_loads_module(self, schemas_dir, schema_writer, request):
+        """Test that a non-literal __version__ is evaluated by loading the file."""
+        schema_writer(request.node.name, b'__version__ = ".".join(["1", "2"])\n')
+
+        assert get_schema_version(request.node.name, str(schemas_dir)) == "1.2"
+
 
 class TestSchemaFieldValidation:
     """Tests for schema field definitions and validation."""
 
-    def test_schema_fields_have_descriptions(self, temp_dir, sample_schema_code):
+    def test_schema_fields_have_descriptions(self, sample_schema_class):
         """Test that schema fields include descriptions."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "described.py"
-        schema_file.write_text(sample_schema_code)
-
-        schema_class = load_schema("described", str(schemas_dir))
-        schema_json = schema_class.model_json_schema()
+        _, schema_json = sample_schema_class
 
         # Check that fields have descriptions
         properties = schema_json.get("properties", {})
         assert "title" in properties
         assert "description" in properties["title"]
 
-    def test_optional_fields(self, temp_dir, sample_schema_code):
+    def test_optional_fields(self, sample_schema_class):
         """Test that optional fields are properly defined."""
-        schemas_dir = temp_dir / "schemas"
-        schemas_dir.mkdir()
-        schema_file = schemas_dir / "optional.py"
-        schema_file.write_text(sample_schema_code)
-
-        schema_class = load_schema("optional", str(schemas_dir))
+        schema_class, _ = sample_schema_class
 
         # Create instance with only required fields
         instance = schema_class(title="Test")
@@ -0,0 +1,69 @@
+"""Tests for the shared JSON output encoder."""
+
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+import doc2json.core.utils.serialization as serialization
+from doc2json.core.utils.serialization import dumps
+
+
+RECORD = {
+    "_source_file": "café.txt",
+    "items": [{"name": "Item 1"}, {"qty": 2, "price": 1.5}],
+    "flag": True,
+    "missing": None,
+}
+
+EDGE_RECORDS = {
+    "datetime": {"started_at": datetime(2024, 5, 1, 9, 30, 15, 250000, tzinfo=timezone.utc)},
+    "naive_datetime": {"started_at": datetime(2024, 5, 1, 9, 30)},
+    "date": {"due": date(2024, 5, 1)},
+    "non_finite": {"score": float("nan"), "bounds": [float("inf"), -float("inf"), 1.0]},
+    "non_str_keys": {1: "a", None: "b", 2.5: "c"},
+    "tuple": {"pair": (1, 2)},
+}
+
+
+class TestDumps:
+    """Tests for the output encoder."""
+
+    def test_compact_utf8_line(self):
+        """Test that output is compact single-line JSON without escaping non-ASCII."""
+        line = dumps(RECORD)
+
+        assert "\n" not in line
+        assert ", " not in line
+        assert "café.txt" in line
+        assert json.loads(line) == RECORD
+
+    @pytest.mark.parametrize("record", [RECORD, *EDGE_RECORDS.values()],
+                             ids=["plain", *EDGE_RECORDS.keys()])
+    def test_stdlib_fallback_matches(self, monkeypatch, record):
+        """Test that output is identical with and without orjson installed."""
+        pytest.importorskip("orjson")
+
+        with_orjson = dumps(record)
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert dumps(record) == with_orjson
+
+    def test_edge_values(self, monkeypatch):
+        """Test the encoding of dates, non-finite floats and non-str keys."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert json.loads(dumps(EDGE_RECORDS["datetime"])) == {
+            "started_at": "2024-05-01T09:30:15.250000+00:00"
+        }
+        assert json.loads(dumps(EDGE_RECORDS["non_finite"])) == {
+            "score": None, "bounds": [None, None, 1.0]
+        }
+        assert json.loads(dumps(EDGE_RECORDS["non_str_keys"])) == {
+            "1": "a", "null": "b", "2.5": "c"
+        }
+
+    def test_unsupported_type_raises(self):
+        """Test that objects with no JSON form still raise TypeError."""
+        with pytest.raises(TypeError, match="object"):
+            dumps({"value": object()})